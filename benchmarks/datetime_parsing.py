@@ -0,0 +1,37 @@
+"""
+Compares the shared Hi-Rez datetime parser with the per-instance strptime calls the models used before.
+
+    python benchmarks/datetime_parsing.py
+"""
+from datetime import datetime, timedelta
+import os
+import sys
+from timeit import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+
+from pyrez.utils import parseDatetime, __parseDatetime__
+
+def matchTimestamps(matches = 500, playersPerMatch = 10):
+    start = datetime(2018, 10, 12, 5, 33, 11)
+    rows = []
+    for i in range(matches):
+        when = (start + timedelta(minutes=i)).strftime("%m/%d/%Y %I:%M:%S %p").lstrip('0')
+        rows.extend([when] * playersPerMatch) # Every player of a match shares its timestamps
+    return rows
+
+def strptimeParse(values):
+    return [ datetime.strptime(value, "%m/%d/%Y %H:%M:%S %p") for value in values ]
+
+def fastParse(values):
+    return [ parseDatetime(value) for value in values ]
+
+def uncachedParse(values):
+    __parseDatetime__.cache_clear()
+    return [ __parseDatetime__.__wrapped__(value) for value in values ]
+
+if __name__ == "__main__":
+    values, number = matchTimestamps(), 20
+    print("{0} timestamps x {1} runs".format(len(values), number))
+    for name, func in (("strptime (previous)", strptimeParse), ("parseDatetime, no cache", uncachedParse), ("parseDatetime", fastParse)):
+        print("{0:<25} {1:.4f}s".format(name, timeit(lambda: func(values), number=number)))
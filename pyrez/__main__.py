@@ -0,0 +1,5 @@
+import sys
+
+from pyrez.cli import main
+
+sys.exit(main())
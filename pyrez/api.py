@@ -1,13 +1,20 @@
 from datetime import timedelta, datetime
+from functools import partial
 from hashlib import md5 as getMD5Hash
+import json
 from sys import version_info as pythonVersion
+from threading import RLock
 import requests
 
 import pyrez
+from pyrez.cache import createKey
 from pyrez.enumerations import *
 from pyrez.exceptions import *
+from pyrez.feeds import ServerFeedCache, ServerFeedWatcher
 from pyrez.http import HttpRequest as HttpRequest
 from pyrez.models import *
+from pyrez.schema import parseModels, parseRecords
+from pyrez.stats import RequestStats
 
 class BaseAPI:
     """
@@ -52,22 +59,33 @@ class BaseAPI:
         self.__endpointBaseURL__ = str(endpoint)
         self.__responseFormat__ = ResponseFormat(responseFormat) if isinstance(responseFormat, ResponseFormat) else ResponseFormat.JSON
         self.__header__ = header
-        
+        self.stats = RequestStats()
+
     def __encode__(self, string, encodeType = "utf-8"):
         return str(string).encode(encodeType)
 
     def __decode__(self, string, encodeType = "utf-8"):
         return str(string).encode(encodeType)
 
-    def __httpRequest__(self, url, header = None):
-        httpResponse = HttpRequest(header if header else self.__header__).get(url)
-        if httpResponse.status_code >= 400:
-            raise NotFoundException("Wrong URL: {0}".format(httpResponse.text))
-        if httpResponse.status_code == 200:
-            try:
-                return httpResponse.json()
-            except:
-                return httpResponse.text
+    def __httpRequest__(self, url, header = None, apiMethod = "http"):
+        headers = dict(header if header else self.__header__ or HttpRequest.defaultHeaders)
+        headers.setdefault("accept-encoding", "gzip, deflate")
+        httpResponse = HttpRequest(headers).get(url, headers=headers, stream=True)
+        try:
+            if httpResponse.status_code >= 400:
+                error = NotFoundException("Wrong URL: {0}".format(httpResponse.text))
+                error.statusCode = httpResponse.status_code # Tells a real 404 apart from outages (5xx) and rate limiting (429)
+                raise error
+            if httpResponse.status_code == 200:
+                content, wireBytes = HttpRequest.readContent(httpResponse)
+                self.stats.record(apiMethod, requests=1, compressedBytes=wireBytes, decompressedBytes=len(content))
+                text = content.decode(httpResponse.encoding or "utf-8", errors="replace")
+                try:
+                    return json.loads(text)
+                except ValueError:
+                    return text
+        finally:
+            httpResponse.close()
 
 class HiRezAPI(BaseAPI):
     """
@@ -86,7 +104,7 @@ class HiRezAPI(BaseAPI):
         Otherwise, this will be used. It defaults to class:`ResponseFormat.JSON`.
     """
 
-    PYREZ_HEADER = { "user-agent": "{0} [Python/{1.major}.{1.minor}]".format(pyrez.__title__, pythonVersion) }
+    PYREZ_HEADER = { "user-agent": "{0} [Python/{1.major}.{1.minor}]".format(pyrez.__title__, pythonVersion), "accept-encoding": "gzip, deflate" }
 
     def __init__(self, devId, authKey, endpoint, responseFormat = ResponseFormat.JSON, sessionId = None):
         """
@@ -104,6 +122,15 @@ class HiRezAPI(BaseAPI):
         """
         super().__init__(devId, authKey, endpoint, responseFormat, self.PYREZ_HEADER)
         self.currentSessionId = sessionId if sessionId and str(sessionId).isalnum() else None
+        self.rateLimiter = None # Optional :class:`RateLimiter` shared by every request made by this instance
+        self.modelParser = None # Optional :class:`ModelParser` used to build models from large batch responses
+        self.statusMonitor = None # Optional :class:`ServerStatusMonitor` that holds requests back while the endpoint is down
+        self.scheduler = None # Optional :class:`RequestScheduler` that orders requests by priority class
+        self.playerCache = None # Optional :class:`StaleWhileRevalidateCache` for player-centric methods
+        self.negativeCache = None # Optional :class:`NegativeCache` for not-found and private players
+        self.responseCache = None # Optional :class:`TwoTierCache` for static catalogs and finished matches
+        self.outputMode = OutputMode.MODEL # Default :class:`OutputMode` of list-returning methods (each one also takes outputMode)
+        self.__sessionLock__ = RLock()
 
     def __createTimeStamp__(self, format = "%Y%m%d%H%M%S"):
         """
@@ -145,11 +172,11 @@ class HiRezAPI(BaseAPI):
     def __sessionExpired__(self):
         return self.currentSessionId is None or not str(self.currentSessionId).isalnum()
 
-    def __buildUrlRequest__(self, apiMethod, params =()): # [queue, date, hour]
+    def __buildUrlRequest__(self, apiMethod, params =(), responseFormat = None): # [queue, date, hour]
         if len(str(apiMethod)) == 0:
             raise InvalidArgumentException("No API method specified!")
         #urlRequest = '/'.join(self.__endpointBaseURL__, apiMethod.lower(), self.__responseFormat__)
-        urlRequest = "{0}/{1}{2}".format(self.__endpointBaseURL__, apiMethod.lower(), self.__responseFormat__)
+        urlRequest = "{0}/{1}{2}".format(self.__endpointBaseURL__, apiMethod.lower(), responseFormat or self.__responseFormat__)
         if apiMethod.lower() != "ping":
             urlRequest += "/{0}/{1}".format(self.__devId__, self.__createSignature__(apiMethod.lower()))
             if self.currentSessionId != None and apiMethod.lower() != "createsession":
@@ -168,14 +195,36 @@ class HiRezAPI(BaseAPI):
                         urlRequest += "/{0}".format(param.strftime("yyyyMMdd") if isinstance(param, datetime) else str(param.value) if isinstance(param, IntFlag) or isinstance(param, Enum) else str(param))
         return urlRequest.replace(' ', "%20")
 
-    def makeRequest(self, apiMethod, params =()):
+    def makeRequest(self, apiMethod, params =(), responseFormat = None):
         if len(str(apiMethod)) == 0:
             raise InvalidArgumentException("No API method specified!")
-        elif(apiMethod.lower() != "createsession" and self.__sessionExpired__()):
-            self.__createSession__()
-        result = self.__httpRequest__(apiMethod if str(apiMethod).lower().startswith("http") else self.__buildUrlRequest__(apiMethod, params))
+        # The format is passed down per request: swapping self.__responseFormat__ isn't safe while other threads use this instance
+        responseFormat = responseFormat or self.__responseFormat__
+        loader = partial(self.__makeRequest__, apiMethod, params, responseFormat)
+        # Player-centric methods go through the stale-while-revalidate cache, everything else through the general response cache
+        for cache in (self.playerCache if self.playerCache and self.playerCache.handles(apiMethod) else self.responseCache, self.negativeCache):
+            if cache and cache.handles(apiMethod):
+                loader = partial(cache.fetch, createKey(apiMethod, params, self.__endpointBaseURL__, responseFormat), apiMethod, loader)
+        return loader()
+
+    def __makeRequest__(self, apiMethod, params =(), responseFormat = None):
+        responseFormat = responseFormat or self.__responseFormat__
+        if(apiMethod.lower() != "createsession" and self.__sessionExpired__()):
+            with self.__sessionLock__:
+                if self.__sessionExpired__():
+                    self.__createSession__()
+        if self.statusMonitor and apiMethod.lower() not in self.statusMonitor.UNGATED_METHODS:
+            self.statusMonitor.gate(self.__endpointBaseURL__)
+        ticket = self.scheduler.acquire(apiMethod) if self.scheduler and apiMethod.lower() != "createsession" else None
+        try:
+            if self.rateLimiter:
+                self.rateLimiter.acquire()
+            result = self.__httpRequest__(apiMethod if str(apiMethod).lower().startswith("http") else self.__buildUrlRequest__(apiMethod, params, responseFormat), apiMethod="http" if str(apiMethod).lower().startswith("http") else apiMethod)
+        finally:
+            if ticket:
+                self.scheduler.release(ticket)
         if result:
-            if str(self.__responseFormat__).lower() == str(ResponseFormat.XML).lower():
+            if str(responseFormat).lower() == str(ResponseFormat.XML).lower():
                 return result
             else:
                 if str(result).lower().find("ret_msg") == -1:
@@ -191,13 +240,23 @@ class HiRezAPI(BaseAPI):
                             raise SessionLimitException("Concurrent sessions limit reached: " + hasError.retMsg)
                         elif hasError.retMsg.find("Invalid session id") != -1:
                             self.__createSession__()
-                            return self.makeRequest(apiMethod, params)
+                            return self.__makeRequest__(apiMethod, params, responseFormat)
                         elif hasError.retMsg.find("Exception while validating developer access") != -1:
                             raise WrongCredentials("Wrong credentials: " + hasError.retMsg)
                         elif hasError.retMsg.find("404") != -1:
                             raise NotFoundException("Not found: " + hasError.retMsg)
                     return result
 
+    def __parseModels__(self, modelClass, rows, outputMode = None):
+        outputMode = OutputMode(outputMode or self.outputMode)
+        if outputMode == OutputMode.RAW:
+            models = rows
+        elif outputMode == OutputMode.RECORD:
+            models = parseRecords(modelClass, rows)
+        else:
+            models = self.modelParser.parse(modelClass, rows) if self.modelParser else parseModels(modelClass, rows)
+        return models if models else None
+
     def switchEndpoint(self, endpoint):
         if not isinstance(endpoint, Endpoint):
             raise InvalidArgumentException("You need to use the Endpoint enum to switch endpoints")
@@ -209,10 +268,7 @@ class HiRezAPI(BaseAPI):
         A required step to Authenticate the devId/signature for further API use.
         """
         try:
-            tempResponseFormat = self.__responseFormat__
-            self.__responseFormat__ = ResponseFormat.JSON
-            responseJSON = self.makeRequest("createsession")
-            self.__responseFormat__ = tempResponseFormat
+            responseJSON = self.makeRequest("createsession", responseFormat=ResponseFormat.JSON)
             return Session(**responseJSON) if responseJSON else None
         except WrongCredentials as x:
             raise x
@@ -227,10 +283,7 @@ class HiRezAPI(BaseAPI):
         Object of :class:`Ping`
             Returns the infos about the API.
         """
-        tempResponseFormat = self.__responseFormat__
-        self.__responseFormat__ = ResponseFormat.JSON
-        responseJSON = self.makeRequest("ping")
-        self.__responseFormat__ = tempResponseFormat
+        responseJSON = self.makeRequest("ping", responseFormat=ResponseFormat.JSON)
         return Ping(responseJSON) if responseJSON else None
     
     def testSession(self, sessionId = None):
@@ -248,7 +301,7 @@ class HiRezAPI(BaseAPI):
         """
         session = self.currentSessionId if sessionId is None or not str(sessionId).isalnum() else sessionId
         uri = "{0}/testsession{1}/{2}/{3}/{4}/{5}".format(self.__endpointBaseURL__, self.__responseFormat__, self.__devId__, self.__createSignature__("testsession"), session, self.__createTimeStamp__())
-        result = self.__httpRequest__(uri)
+        result = self.__httpRequest__(uri, apiMethod="testsession")
         return result.find("successful test") != -1
 
     def getDataUsed(self):
@@ -261,19 +314,27 @@ class HiRezAPI(BaseAPI):
         Object of :class:`DataUsed`
 
         """
-        tempResponseFormat = self.__responseFormat__
-        self.__responseFormat__ = ResponseFormat.JSON
-        responseJSON = self.makeRequest("getdataused")
-        self.__responseFormat__ = tempResponseFormat
+        responseJSON = self.makeRequest("getdataused", responseFormat=ResponseFormat.JSON)
         return None if responseJSON is None else DataUsed(**responseJSON) if str(responseJSON).startswith('{') else DataUsed(**responseJSON[0])
     
     def getHiRezServerFeeds(self):
         """
         A quick way of validating access to the Hi-Rez API.
         """
-        req = self.__httpRequest__("http://status.hirezstudios.com/history.atom", self.__header__)
+        req = self.__httpRequest__("http://status.hirezstudios.com/history.atom", self.__header__, "getHiRezServerFeeds")
         return req
     
+    def getHiRezServerFeedEntries(self):
+        """
+        Returns the incidents of the Hi-Rez status feed, newest first.
+        The feed is fetched with conditional requests and one parsed copy is shared by every API instance of the process.
+
+        Returns
+        -------
+        list of :class:`HiRezServerFeedEntry`
+        """
+        return ServerFeedCache.getInstance(ServerFeedWatcher.FEED_URL, self.__header__).refresh()
+
     def getHiRezServerStatus(self):
         """
         /gethirezserverstatus[ResponseFormat]/{devId}/{signature}/{session}/{timestamp}
@@ -284,12 +345,23 @@ class HiRezAPI(BaseAPI):
         Object of :class:`HiRezServerStatus`
 
         """
-        tempResponseFormat = self.__responseFormat__
-        self.__responseFormat__ = ResponseFormat.JSON
-        responseJSON = self.makeRequest("gethirezserverstatus")
-        self.__responseFormat__ = tempResponseFormat
+        responseJSON = self.makeRequest("gethirezserverstatus", responseFormat=ResponseFormat.JSON)
         return None if responseJSON is None else HiRezServerStatus(**responseJSON) if str(responseJSON).startswith('{') else HiRezServerStatus(**responseJSON[0])
 
+    def getHiRezServerStatuses(self, outputMode = None):
+        """
+        /gethirezserverstatus[ResponseFormat]/{devId}/{signature}/{session}/{timestamp}
+        Same as :meth:`getHiRezServerStatus`, but returns the status of every platform environment.
+
+        Returns
+        -------
+        list of :class:`HiRezServerStatus`
+        """
+        responseJSON = self.makeRequest("gethirezserverstatus", responseFormat=ResponseFormat.JSON)
+        if not responseJSON:
+            return None
+        return self.__parseModels__(HiRezServerStatus, responseJSON if isinstance(responseJSON, list) else [responseJSON], outputMode) or []
+
     def getPatchInfo(self):
         """
         /getpatchinfo[ResponseFormat]/{devId}/{signature}/{session}/{timestamp}
@@ -300,13 +372,10 @@ class HiRezAPI(BaseAPI):
         Object of :class:`PatchInfo`
 
         """
-        tempResponseFormat = self.__responseFormat__
-        self.__responseFormat__ = ResponseFormat.JSON
-        responseJSON = self.makeRequest("getpatchinfo")
-        self.__responseFormat__ = tempResponseFormat
+        responseJSON = self.makeRequest("getpatchinfo", responseFormat=ResponseFormat.JSON)
         return PatchInfo(**responseJSON) if responseJSON else None
     
-    def getFriends(self, playerId):
+    def getFriends(self, playerId, outputMode = None):
         """
         /getfriends[ResponseFormat]/{devId}/{signature}/{session}/{timestamp}/{playerId}
         Returns the User names of each of the player’s friends of one player. [PC only]
@@ -325,11 +394,7 @@ class HiRezAPI(BaseAPI):
         else:
             if not responseJSON:
                 return None
-            friends = []
-            for friend in responseJSON:
-                obj = Friend(**friend)
-                friends.append(obj)
-            return friends if friends else None
+            return self.__parseModels__(Friend, responseJSON, outputMode)
 
     def getMatchDetails(self, matchId):
         """
@@ -361,7 +426,7 @@ class HiRezAPI(BaseAPI):
         """
         return self.makeRequest("getmatchdetailsbatch", [matchIds])
 
-    def getMatchHistory(self, playerId):
+    def getMatchHistory(self, playerId, outputMode = None):
         """
         /getmatchhistory[ResponseFormat]/{devId}/{signature}/{session}/{timestamp}/{playerId}
         Gets recent matches and high level match statistics for a particular player.
@@ -378,11 +443,7 @@ class HiRezAPI(BaseAPI):
         else:
             if not getMatchHistoryResponse:
                 return None
-            matchHistorys = []
-            for i in range(0, len(getMatchHistoryResponse)):
-                obj = MatchHistory(**getMatchHistoryResponse[i])
-                matchHistorys.append(obj)
-            return matchHistorys if matchHistorys else None
+            return self.__parseModels__(MatchHistory, getMatchHistoryResponse, outputMode)
 
     def getMatchIdsByQueue(self, queueId, date, hour = -1):
         """
@@ -481,7 +542,7 @@ class HiRezAPI(BaseAPI):
         """
         return self.makeRequest("getplayeridbyportaluserid", [portalId, portalUserId])
     #Need to test
-    def getPlayerIdByPortalUserId(self, portalId, gamerTag):
+    def getPlayerIdsByGamerTag(self, portalId, gamerTag):
         """
         /getplayeridsbygamertag[ResponseFormat]/{developerId}/{signature}/{session}/{timestamp}/{portalId}/{gamerTag}
         Function returns a list of Hi-Rez playerId values for {portalId}/{portalUserId} combination provided. The appropriate
@@ -522,7 +583,7 @@ class HiRezAPI(BaseAPI):
                 return None
             return PlayerStatus(**getPlayerStatusResponse) if str(getPlayerStatusResponse).startswith('{') else PlayerStatus(**getPlayerStatusResponse[0]) if getPlayerStatusResponse else None
     #Need to test
-    def getQueueStats(self, playerId, queueId):
+    def getQueueStats(self, playerId, queueId, outputMode = None):
         """
         /getqueuestats[ResponseFormat]/{devId}/{signature}/{session}/{timestamp}/{playerId}/{queue}
         Returns match summary statistics for a (player, queue) combination grouped by gods played.
@@ -541,11 +602,7 @@ class HiRezAPI(BaseAPI):
         else:
             if not getQueueStatsResponse:
                 return None
-            QueueStats = []
-            for i in getQueueStatsResponse:
-                obj = QueueStats(**i)
-                QueueStats.append(obj)
-            return QueueStats if QueueStats else None
+            return self.__parseModels__(QueueStats, getQueueStatsResponse, outputMode)
 
 class BaseSmitePaladinsAPI(HiRezAPI):
     """
@@ -578,7 +635,7 @@ class BaseSmitePaladinsAPI(HiRezAPI):
             Otherwise, this will be used. It defaults to class:`ResponseFormat.JSON`.
         """
         super().__init__(devId, authKey, endpoint, responseFormat, sessionId)
-    def getGods(self, language = LanguageCode.English):
+    def getGods(self, language = LanguageCode.English, outputMode = None):
         """
         /getgods[ResponseFormat]/{devId}/{signature}/{session}/{timestamp}/{languageCode}
         Returns all Gods and their various attributes.
@@ -601,13 +658,9 @@ class BaseSmitePaladinsAPI(HiRezAPI):
         else:
             if not getGodsResponse:
                 return None
-            gods = []
-            for i in getGodsResponse:
-                obj = God(**i) if isinstance(self, SmiteAPI) else Champion(**i)
-                gods.append(obj)
-            return gods if gods else None
+            return self.__parseModels__(God if isinstance(self, SmiteAPI) else Champion, getGodsResponse, outputMode)
 
-    def getGodRanks(self, playerId):
+    def getGodRanks(self, playerId, outputMode = None):
         """
         /getgodranks[ResponseFormat]/{devId}/{signature}/{session}/{timestamp}/{playerId}
         Returns the Rank and Worshippers value for each God a player has played.
@@ -631,12 +684,9 @@ class BaseSmitePaladinsAPI(HiRezAPI):
         else:
             if not getGodRanksResponse:
                 return None
-            godRanks = []
-            for i in getGodRanksResponse:
-                godRanks.append(GodRank(**i))
-            return godRanks if godRanks else None
+            return self.__parseModels__(GodRank, getGodRanksResponse, outputMode)
     #Need to test
-    def getGodSkins(self, godId, language = LanguageCode.English):
+    def getGodSkins(self, godId, language = LanguageCode.English, outputMode = None):
         """
         /getgodskins[ResponseFormat]/{devId}/{signature}/{session}/{timestamp}/{godId}/{languageCode}
         Returns all available skins for a particular God.
@@ -652,11 +702,7 @@ class BaseSmitePaladinsAPI(HiRezAPI):
         else:
             if not getGodSkinsResponse:
                 return None
-            godSkins = []
-            for godSkin in getGodSkinsResponse:
-                obj = GodSkin(**godSkin) if isinstance(self, SmiteAPI) != -1 else ChampionSkin(**godSkin)
-                godSkins.append(obj)
-            return godSkins if godSkins else None
+            return self.__parseModels__(GodSkin if isinstance(self, SmiteAPI) else ChampionSkin, getGodSkinsResponse, outputMode)
     
     def getItems(self, language = LanguageCode.English):
         """
@@ -708,7 +754,7 @@ class PaladinsAPI(BaseSmitePaladinsAPI):
             raise InvalidArgumentException("You need to use the Platform enum to switch platforms")
         self.__endpointBaseURL__ = str(Endpoint.PALADINS_XBOX) if platform == Platform.XBOX or platform == Platform.NINTENDO_SWITCH else str(Endpoint.PALADINS_PS4) if platform == Platform.PS4 else str(Endpoint.PALADINS_PC)
 
-    def getChampions(self, language = LanguageCode.English):
+    def getChampions(self, language = LanguageCode.English, outputMode = None):
         """
         /getchampions[ResponseFormat]/{devId}/{signature}/{session}/{timestamp}/{languageCode}
         Returns all Champions and their various attributes. [PaladinsAPI only]
@@ -723,13 +769,9 @@ class PaladinsAPI(BaseSmitePaladinsAPI):
         else:
             if not getChampionsResponse:
                 return None
-            champions = []
-            for i in getChampionsResponse:
-                obj = Champion(**i)
-                champions.append(obj)
-            return champions if champions else None
+            return self.__parseModels__(Champion, getChampionsResponse, outputMode)
     #Needed to test
-    def getChampionsCards(self, championId, language = LanguageCode.English):
+    def getChampionsCards(self, championId, language = LanguageCode.English, outputMode = None):
         """
         /getchampioncards[ResponseFormat]/{devId}/{signature}/{session}/{timestamp}/{championId}/{languageCode}
         Returns all Champion cards. [PaladinsAPI only]
@@ -744,11 +786,7 @@ class PaladinsAPI(BaseSmitePaladinsAPI):
         else:
             if not getChampionsCardsResponse:
                 return None
-            cards = []
-            for i in getChampionsCardsResponse:
-                obj = ChampionCard(**i)
-                cards.append(obj)
-            return cards if cards else None
+            return self.__parseModels__(ChampionCard, getChampionsCardsResponse, outputMode)
 
     def getChampionLeaderboard(self, champId, queue = 428):
         """
@@ -763,7 +801,7 @@ class PaladinsAPI(BaseSmitePaladinsAPI):
             raise InvalidArgumentException("Invalid Champion ID!")
         getChampionLeaderboardResponse = self.makeRequest("getchampionleaderboard", [champId, queue])
         return getChampionLeaderboardResponse
-    def getChampionRanks(self, playerId):
+    def getChampionRanks(self, playerId, outputMode = None):
         """
         /getchampionranks[ResponseFormat]/{devId}/{signature}/{session}/{timestamp}/{playerId}
         Returns the Rank and Worshippers value for each Champion a player has played. [PaladinsAPI only]
@@ -780,10 +818,7 @@ class PaladinsAPI(BaseSmitePaladinsAPI):
         else:
             if not getChampionsRanksResponse:
                 return None
-            championRanks = []
-            for i in getChampionsRanksResponse:
-                championRanks.append(GodRank(**i))
-            return championRanks if championRanks else None
+            return self.__parseModels__(GodRank, getChampionsRanksResponse, outputMode)
 
     def getChampionRecommendedItems(self, champId, language = LanguageCode.English):
         """
@@ -802,7 +837,7 @@ class PaladinsAPI(BaseSmitePaladinsAPI):
         return self.makeRequest("getchampionrecommendeditems", [champId, language])
         #raise DeprecatedException("OSBSOLETE - NO DATA RETURNED")
     #Need to test
-    def getChampionSkins(self, champId, language = LanguageCode.English):
+    def getChampionSkins(self, champId, language = LanguageCode.English, outputMode = None):
         """
         /getchampionskins[ResponseFormat]/{devId}/{signature}/{session}/{timestamp}/{godId}/{languageCode}
         Returns all available skins for a particular Champion. [PaladinsAPI only]
@@ -818,13 +853,9 @@ class PaladinsAPI(BaseSmitePaladinsAPI):
         else:
             if not getChampSkinsResponse:
                 return None
-            champSkins = []
-            for champSkin in getChampSkinsResponse:
-                obj = ChampionSkin(**champSkin)
-                champSkins.append(obj)
-            return champSkins if champSkins else None
+            return self.__parseModels__(ChampionSkin, getChampSkinsResponse, outputMode)
 
-    def getMatchPlayerDetails(self, matchId):
+    def getMatchPlayerDetails(self, matchId, outputMode = None):
         """
         /getmatchplayerdetails[ResponseFormat]/{devId}/{signature}/{session}/{timestamp}/{matchId}
         Returns player information for a live match.
@@ -841,11 +872,7 @@ class PaladinsAPI(BaseSmitePaladinsAPI):
         else:
             if not responseJSON:
                 return None
-            players = []
-            for player in responseJSON:
-                obj = MatchPlayerDetail(**player)
-                players.append(obj)
-            return players if players else None
+            return self.__parseModels__(MatchPlayerDetail, responseJSON, outputMode)
 
     def getPlayerIdInfoForXboxAndSwitch(self, playerName):
         """
@@ -858,7 +885,7 @@ class PaladinsAPI(BaseSmitePaladinsAPI):
         """
         return self.makeRequest("getplayeridinfoforxboxandswitch", [playerName])
 
-    def getPlayerLoadouts(self, playerId, language = LanguageCode.English):
+    def getPlayerLoadouts(self, playerId, language = LanguageCode.English, outputMode = None):
         """
         /getplayerloadouts[ResponseFormat]/{devId}/{signature}/{session}/{timestamp}/playerId}/{languageCode}
         Returns deck loadouts per Champion. [PaladinsAPI only]
@@ -876,11 +903,7 @@ class PaladinsAPI(BaseSmitePaladinsAPI):
         else:
             if not getPlayerLoadoutsResponse:
                 return None
-            playerLoadouts = []
-            for i in range(0, len(getPlayerLoadoutsResponse)):
-                obj = PlayerLoadout(**getPlayerLoadoutsResponse[i])
-                playerLoadouts.append(obj)
-            return playerLoadouts if playerLoadouts else None
+            return self.__parseModels__(PlayerLoadout, getPlayerLoadoutsResponse, outputMode)
         
 class RealmRoyaleAPI(HiRezAPI):
     """
@@ -936,7 +959,7 @@ class RealmRoyaleAPI(HiRezAPI):
         return self.makeRequest("getplayerstats", [playerId])
 
     # /searchplayers[ResponseFormat]/{devId}/{signature}/{session}/{timestamp}/{player}
-    def searchPlayers(self, playerId):
+    def searchPlayers(self, playerId, outputMode = None):
         if not playerId or not str(playerId).isnumeric():
             raise InvalidArgumentException("Invalid player!")
         searchPlayerResponse = self.makeRequest("searchplayers", [playerId])
@@ -945,11 +968,7 @@ class RealmRoyaleAPI(HiRezAPI):
         else:
             if not searchPlayerResponse:
                 return None
-            players = []
-            for player in searchPlayerResponse:
-                obj = Player(**player)
-                players.append(obj)
-            return players if players else None
+            return self.__parseModels__(Player, searchPlayerResponse, outputMode)
 
 class SmiteAPI(BaseSmitePaladinsAPI):
     """
@@ -1005,7 +1024,7 @@ class SmiteAPI(BaseSmitePaladinsAPI):
             raise InvalidArgumentException("Invalid Match ID!")
         return self.makeRequest("getdemodetails", [matchId])
     #Need to test
-    def getEsportsProLeagueDetails(self):
+    def getEsportsProLeagueDetails(self, outputMode = None):
         """
         /getesportsproleaguedetails[ResponseFormat]/{devId}/{signature}/{session}/{timestamp}
         Returns the matchup information for each matchup for the current eSports Pro League season.
@@ -1017,13 +1036,9 @@ class SmiteAPI(BaseSmitePaladinsAPI):
         else:
             if not getEsportsProLeagueDetailsResponse:
                 return None
-            details = []
-            for detail in getEsportsProLeagueDetailsResponse:
-                obj = EsportProLeagueDetail(**detail)
-                details.append(obj)
-            return details if details else None
+            return self.__parseModels__(EsportProLeagueDetail, getEsportsProLeagueDetailsResponse, outputMode)
     #Need to test
-    def getGodLeaderboard(self, godId, queueId):
+    def getGodLeaderboard(self, godId, queueId, outputMode = None):
         """
         /getgodleaderboard[ResponseFormat]/{devId}/{signature}/{session}/{timestamp}/{godId}/{queue}
         Returns the current season’s leaderboard for a god/queue combination. [SmiteAPI only; queues 440, 450, 451 only]
@@ -1039,11 +1054,7 @@ class SmiteAPI(BaseSmitePaladinsAPI):
         else:
             if not getGodLeaderboardResponse:
                 return None
-            godLeaderb = []
-            for leader in getGodLeaderboardResponse:
-                obj = GodLeaderboard(**leader)
-                godLeaderb.append(obj)
-            return godLeaderb if godLeaderb else None
+            return self.__parseModels__(GodLeaderboard, getGodLeaderboardResponse, outputMode)
     
     def getGodRecommendedItems(self, godId, language = LanguageCode.English):
         """
@@ -1081,7 +1092,7 @@ class SmiteAPI(BaseSmitePaladinsAPI):
         """
         return self.makeRequest("getleagueseasons", [queueId])
     #Need to test
-    def getMotd(self):
+    def getMotd(self, outputMode = None):
         """
         /getmotd[ResponseFormat]/{devId}/{signature}/{session}/{timestamp}
         Returns information about the 20 most recent Match-of-the-Days.
@@ -1092,13 +1103,9 @@ class SmiteAPI(BaseSmitePaladinsAPI):
         else:
             if not getMOTDResponse:
                 return None
-            motds = []
-            for motd in getMOTDResponse:
-                obj = MOTD(**motd)
-                motds.append(obj)
-            return motds if motds else None
+            return self.__parseModels__(MOTD, getMOTDResponse, outputMode)
     #Need to test
-    def getTeamDetails(self, clanId):
+    def getTeamDetails(self, clanId, outputMode = None):
         """
         /getteamdetails[ResponseFormat]/{devId}/{signature}/{session}/{timestamp}/{clanId}
         Lists the number of players and other high level details for a particular clan.
@@ -1115,11 +1122,7 @@ class SmiteAPI(BaseSmitePaladinsAPI):
         else:
             if not getTeamDetailsResponse:
                 return None
-            teamDetails = []
-            for teamDetail in getTeamDetailsResponse:
-                obj = TeamDetail(**teamDetail)
-                teamDetails.append(obj)
-            return teamDetails if teamDetails else None
+            return self.__parseModels__(TeamDetail, getTeamDetailsResponse, outputMode)
     
     def getTeamMatchHistory(self, clanId):
         """
@@ -1133,7 +1136,7 @@ class SmiteAPI(BaseSmitePaladinsAPI):
         raise DeprecatedException("*DEPRECATED* - As of 2.14 Patch, /getteammatchhistory is no longer supported and will return a NULL dataset.")
         #return self.makeRequest("getteammatchhistory", [clanId])
     #Need to test
-    def getTeamPlayers(self, clanId):
+    def getTeamPlayers(self, clanId, outputMode = None):
         """
         /getteamplayers[ResponseFormat]/{devId}/{signature}/{session}/{timestamp}/{clanId}
         Lists the players for a particular clan.
@@ -1150,11 +1153,7 @@ class SmiteAPI(BaseSmitePaladinsAPI):
         else:
             if not getTeamPlayers:
                 return None
-            teamPlayers = []
-            for teamPlayer in getTeamPlayers:
-                obj = TeamPlayer(**teamPlayer)
-                teamPlayers.append(obj)
-            return teamPlayers if teamPlayers else None
+            return self.__parseModels__(TeamPlayer, getTeamPlayers, outputMode)
 
     def getTopMatches(self):
         """
@@ -0,0 +1,458 @@
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from hashlib import sha1
+import json
+import mmap
+import os
+from threading import RLock
+from time import monotonic, time
+import zlib
+
+from pyrez.exceptions import CustomException, NotFoundException, PlayerNotFoundException
+from pyrez.stats import RequestStats
+
+def createKey(apiMethod, params, *scope):
+    """
+    Builds the key of a response cache entry from the API method, its parameters and a scope (endpoint, response format, ...).
+    """
+    return tuple(str(value) for value in scope) + (str(apiMethod).lower(),) + tuple(str(param.value) if hasattr(param, "value") else str(param) for param in params or ())
+
+class PersistentCache:
+    """
+    Small key/value store kept in memory and saved as a JSON file, so it survives restarts.
+
+    Parameters
+    ----------
+    path : [optional] : str
+        File used to persist the entries. When None the cache lives only in memory.
+    """
+    def __init__(self, path = None):
+        self.path = path
+        self.__data__ = {}
+        self.__dirty__ = False
+        self.__lock__ = RLock()
+        if path and os.path.isfile(path):
+            try:
+                with open(path, 'r', encoding="utf-8") as file:
+                    self.__data__ = json.load(file)
+            except (OSError, ValueError):
+                self.__data__ = {}
+
+    def __contains__(self, key):
+        with self.__lock__:
+            return key in self.__data__
+
+    def __len__(self):
+        with self.__lock__:
+            return len(self.__data__)
+
+    def get(self, key, default = None):
+        with self.__lock__:
+            return self.__data__.get(key, default)
+
+    def items(self):
+        with self.__lock__:
+            return list(self.__data__.items())
+
+    def set(self, key, value):
+        with self.__lock__:
+            if self.__data__.get(key) != value:
+                self.__data__[key] = value
+                self.__dirty__ = True
+
+    def delete(self, key):
+        with self.__lock__:
+            if self.__data__.pop(key, None) is not None:
+                self.__dirty__ = True
+
+    def save(self):
+        """
+        Writes the entries to disk (only if something changed). The file is replaced atomically.
+        """
+        with self.__lock__:
+            if not self.path or not self.__dirty__:
+                return
+            tempPath = "{0}.tmp".format(self.path)
+            with open(tempPath, 'w', encoding="utf-8") as file:
+                json.dump(self.__data__, file)
+            os.replace(tempPath, self.path)
+            self.__dirty__ = False
+
+class StaleWhileRevalidateCache:
+    """
+    Per-method TTL cache for the responses of player-centric API methods.
+
+    A fresh entry is returned as is. A stale entry (older than its freshness window but still inside its stale window)
+    is returned immediately while a background refresh fetches a new copy, so hot players never wait on the upstream API.
+    Assign it to :attr:`HiRezAPI.playerCache`.
+
+    Parameters
+    ----------
+    freshness : [optional] : dict
+        API method → (freshSeconds, staleSeconds). Only these methods are cached. It defaults to :attr:`DEFAULT_FRESHNESS`.
+    maxEntries : [optional] : int
+        Entries kept before the least recently used ones are evicted. It defaults to 10000.
+    maxWorkers : [optional] : int
+        Threads used for background refreshes. It defaults to 2.
+    """
+    DEFAULT_FRESHNESS = {
+        "getplayer": (300, 3600),
+        "getgodranks": (600, 21600), # getChampionRanks uses it too
+        "getchampionranks": (600, 21600),
+        "getqueuestats": (600, 21600),
+        "getplayerloadouts": (900, 43200),
+        "getplayerachievements": (1800, 86400),
+    }
+
+    def __init__(self, freshness = None, maxEntries = 10000, maxWorkers = 2):
+        self.freshness = { str(method).lower(): windows for method, windows in (self.DEFAULT_FRESHNESS if freshness is None else freshness).items() }
+        self.maxEntries = max(1, int(maxEntries))
+        self.stats = RequestStats()
+        self.__entries__ = OrderedDict()
+        self.__refreshing__ = set()
+        self.__lock__ = RLock()
+        self.__executor__ = ThreadPoolExecutor(max_workers=max(1, int(maxWorkers)))
+
+    def handles(self, apiMethod):
+        return str(apiMethod).lower() in self.freshness
+
+    def __store__(self, key, value):
+        with self.__lock__:
+            self.__entries__ [key] = (monotonic(), value)
+            self.__entries__.move_to_end(key)
+            while len(self.__entries__) > self.maxEntries:
+                self.__entries__.popitem(last=False)
+
+    def __refresh__(self, key, apiMethod, loader):
+        try:
+            value = loader()
+            if value is not None:
+                self.__store__(key, value)
+            self.stats.increment(apiMethod, "refreshes")
+        except Exception:
+            self.stats.increment(apiMethod, "refreshErrors") # Keep serving the stale copy
+        finally:
+            with self.__lock__:
+                self.__refreshing__.discard(key)
+
+    def fetch(self, key, apiMethod, loader):
+        """
+        Returns the cached response for key, calling loader() on a miss (or in the background when the entry is stale).
+
+        Parameters
+        ----------
+        key : tuple
+            See :func:`createKey`.
+        apiMethod : str
+        loader : callable
+            Fetches the response from the API. None responses are not cached.
+        """
+        apiMethod = str(apiMethod).lower()
+        freshSeconds, staleSeconds = self.freshness [apiMethod]
+        with self.__lock__:
+            entry = self.__entries__.get(key)
+            if entry is not None:
+                age = monotonic() - entry [0]
+                if age < freshSeconds:
+                    self.__entries__.move_to_end(key)
+                    self.stats.increment(apiMethod, "hits")
+                    return entry [1]
+                if age < freshSeconds + staleSeconds:
+                    self.__entries__.move_to_end(key)
+                    self.stats.increment(apiMethod, "staleHits")
+                    if key not in self.__refreshing__:
+                        self.__refreshing__.add(key)
+                        self.__executor__.submit(self.__refresh__, key, apiMethod, loader)
+                    return entry [1]
+                del self.__entries__ [key]
+        self.stats.increment(apiMethod, "misses")
+        value = loader()
+        if value is not None:
+            self.__store__(key, value)
+        return value
+
+    def invalidate(self, key = None):
+        """
+        Drops one entry, or every entry when key is None.
+        """
+        with self.__lock__:
+            if key is None:
+                self.__entries__.clear()
+            else:
+                self.__entries__.pop(key, None)
+
+    def close(self):
+        self.__executor__.shutdown(wait=False)
+
+class NegativeCache:
+    """
+    Remembers not-found and private-profile results for a short time, so typos and bad IDs don't cost a round trip each.
+
+    Empty responses (None), :class:`NotFoundException` / :class:`PlayerNotFoundException` and responses flagged as private are
+    replayed to the caller until they expire. Only genuine not-found errors are kept (see :meth:`isNegative`): HTTP errors
+    other than 404, such as outages and rate limiting, are never cached. Assign it to :attr:`HiRezAPI.negativeCache`.
+
+    Parameters
+    ----------
+    ttl : [optional] : dict
+        API method → seconds a negative result is kept. Only these methods are cached. It defaults to :attr:`DEFAULT_TTL`.
+    maxEntries : [optional] : int
+        Entries kept before the least recently used ones are evicted. It defaults to 5000.
+    """
+    DEFAULT_TTL = { "getplayer": 120, "getplayeridbyname": 120, "searchplayers": 60 }
+    NEGATIVE_EXCEPTIONS = (NotFoundException, PlayerNotFoundException)
+
+    def __init__(self, ttl = None, maxEntries = 5000):
+        self.ttl = { str(method).lower(): seconds for method, seconds in (self.DEFAULT_TTL if ttl is None else ttl).items() }
+        self.maxEntries = max(1, int(maxEntries))
+        self.stats = RequestStats()
+        self.__entries__ = OrderedDict()
+        self.__lock__ = RLock()
+
+    def handles(self, apiMethod):
+        return str(apiMethod).lower() in self.ttl
+
+    @staticmethod
+    def isPrivate(response):
+        rows = response if isinstance(response, list) else [ response ]
+        return any(isinstance(row, dict) and str(row.get("ret_msg", "")).lower().find("privacy") != -1 for row in rows)
+
+    @staticmethod
+    def isNegative(exc):
+        """
+        Returns True when exc means the resource doesn't exist: a not-found ret_msg, or an HTTP error whose status is 404.
+        """
+        return getattr(exc, "statusCode", 404) == 404
+
+    @staticmethod
+    def __freeze__(exc):
+        # (class, args, attributes) of exc: every replay raises a new exception, so tracebacks don't pile up on a shared one
+        args = exc.args [1:] if isinstance(exc, CustomException) and exc.args and exc.args [0] is exc else exc.args
+        return type(exc), args, dict(vars(exc))
+
+    @staticmethod
+    def __thaw__(error):
+        errorClass, args, attributes = error
+        exc = errorClass(*args)
+        exc.__dict__.update(attributes)
+        return exc
+
+    def __store__(self, key, apiMethod, entry):
+        with self.__lock__:
+            self.__entries__ [key] = (monotonic() + self.ttl [apiMethod], entry)
+            self.__entries__.move_to_end(key)
+            while len(self.__entries__) > self.maxEntries:
+                self.__entries__.popitem(last=False)
+        self.stats.increment(apiMethod, "stored")
+
+    def fetch(self, key, apiMethod, loader):
+        """
+        Replays a remembered negative result for key, or calls loader() and remembers its result when it is negative.
+
+        Parameters
+        ----------
+        key : tuple
+            See :func:`createKey`.
+        apiMethod : str
+        loader : callable
+            Fetches the response from the API.
+        """
+        apiMethod = str(apiMethod).lower()
+        with self.__lock__:
+            entry = self.__entries__.get(key)
+            if entry is not None:
+                if entry [0] > monotonic():
+                    self.__entries__.move_to_end(key)
+                    self.stats.increment(apiMethod, "savedCalls")
+                    response, error = entry [1]
+                    if error is not None:
+                        raise self.__thaw__(error)
+                    return response
+                del self.__entries__ [key]
+        try:
+            response = loader()
+        except self.NEGATIVE_EXCEPTIONS as exc:
+            if self.isNegative(exc):
+                self.__store__(key, apiMethod, (None, self.__freeze__(exc)))
+            raise
+        if response is None or self.isPrivate(response):
+            self.__store__(key, apiMethod, (response, None))
+        return response
+
+    def getSavedCalls(self, apiMethod = None):
+        """
+        Returns how many API calls were answered from the cache (for one method, or for all of them when apiMethod is None).
+        """
+        return self.stats.get(apiMethod).get("savedCalls", 0)
+
+    def invalidate(self, key = None):
+        """
+        Drops one entry, or every entry when key is None.
+        """
+        with self.__lock__:
+            if key is None:
+                self.__entries__.clear()
+            else:
+                self.__entries__.pop(key, None)
+
+class TwoTierCache:
+    """
+    General response cache for :meth:`HiRezAPI.makeRequest`: a bounded in-memory LRU tier in front of a size-capped disk tier.
+
+    Disk entries are zlib-compressed JSON files sharded by key hash and read through mmap. They are written atomically
+    (temporary file + rename), so several processes on one host can share the directory. A disk hit is promoted to memory.
+    Assign it to :attr:`HiRezAPI.responseCache`.
+
+    Parameters
+    ----------
+    directory : str
+        Directory of the disk tier (created if needed).
+    memoryEntries : [optional] : int
+        Entries kept in memory. It defaults to 1024.
+    diskBytes : [optional] : int
+        Size cap of the disk tier. The least recently used files are evicted above it. It defaults to 256 MiB.
+    maxAge : [optional] : int
+        Seconds an entry stays valid in either tier. It defaults to 3600.
+    methods : [optional] : iterable of str
+        API methods to cache. It defaults to :attr:`CACHED_METHODS`.
+    """
+    # Static catalogs and finished-match data only: live data (statuses, leaderboards, match histories, friends, patch info...)
+    # must always reach the API, otherwise trackers poll a frozen copy and patch checks never see a new patch
+    CACHED_METHODS = frozenset([ "getchampioncards", "getchampionrecommendeditems", "getchampions", "getchampionskins", "getdemodetails", "getesportsproleaguedetails", "getgodrecommendeditems", "getgods", "getgodskins", "getitems", "getleagueseasons", "getmatchdetails", "getmatchdetailsbatch", "getmotd" ])
+    SHARD_COUNT = 256
+
+    def __init__(self, directory, memoryEntries = 1024, diskBytes = 268435456, maxAge = 3600, methods = None):
+        self.directory = directory
+        self.memoryEntries = max(1, int(memoryEntries))
+        self.diskBytes = int(diskBytes)
+        self.maxAge = maxAge
+        self.methods = frozenset(str(method).lower() for method in methods) if methods is not None else self.CACHED_METHODS
+        self.stats = RequestStats()
+        self.__memory__ = OrderedDict()
+        self.__writtenBytes__ = 0
+        self.__lock__ = RLock()
+        os.makedirs(directory, exist_ok=True)
+        self.evict()
+
+    def handles(self, apiMethod):
+        return str(apiMethod).lower() in self.methods
+
+    def __getPath__(self, key):
+        digest = sha1(repr(key).encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, "{0:02x}".format(int(digest [:4], 16) % self.SHARD_COUNT), "{0}.z".format(digest))
+
+    def __remember__(self, key, created, value):
+        with self.__lock__:
+            self.__memory__ [key] = (created, value)
+            self.__memory__.move_to_end(key)
+            while len(self.__memory__) > self.memoryEntries:
+                self.__memory__.popitem(last=False)
+
+    def __readDisk__(self, key):
+        path = self.__getPath__(key)
+        try:
+            created = os.stat(path).st_mtime
+            if time() - created >= self.maxAge:
+                os.remove(path)
+                return None
+            with open(path, "rb") as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                value = json.loads(zlib.decompress(data).decode("utf-8"))
+            os.utime(path, (time(), created)) # atime drives LRU eviction, mtime keeps the age
+            return created, value
+        except (OSError, ValueError, zlib.error):
+            return None
+
+    def __writeDisk__(self, key, value):
+        path = self.__getPath__(key)
+        data = zlib.compress(json.dumps(value).encode("utf-8"))
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tempPath = "{0}.{1}.tmp".format(path, os.getpid())
+            with open(tempPath, "wb") as file:
+                file.write(data)
+            os.replace(tempPath, path)
+        except OSError:
+            return
+        with self.__lock__:
+            self.__writtenBytes__ += len(data)
+            shouldEvict = self.__writtenBytes__ >= self.diskBytes // 16
+        if shouldEvict:
+            self.evict()
+
+    def evict(self):
+        """
+        Removes expired disk entries, then the least recently used ones until the disk tier fits :attr:`diskBytes`.
+        Files removed meanwhile by another process are skipped.
+        """
+        now, files, totalBytes = time(), [], 0
+        for root, _, names in os.walk(self.directory):
+            for name in names:
+                path = os.path.join(root, name)
+                try:
+                    stat = os.stat(path)
+                    if now - stat.st_mtime >= (self.maxAge if name.endswith(".z") else 3600): # Stale temporary files too
+                        os.remove(path)
+                        continue
+                except OSError:
+                    continue
+                files.append((stat.st_atime, stat.st_size, path))
+                totalBytes += stat.st_size
+        for _, size, path in sorted(files):
+            if totalBytes <= self.diskBytes:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            totalBytes -= size
+        with self.__lock__:
+            self.__writtenBytes__ = 0
+
+    def fetch(self, key, apiMethod, loader):
+        """
+        Returns the cached response for key from memory, then disk, calling loader() when both tiers miss.
+
+        Parameters
+        ----------
+        key : tuple
+            See :func:`createKey`.
+        apiMethod : str
+        loader : callable
+            Fetches the response from the API. None responses are not cached.
+        """
+        apiMethod = str(apiMethod).lower()
+        with self.__lock__:
+            entry = self.__memory__.get(key)
+            if entry is not None:
+                if time() - entry [0] < self.maxAge:
+                    self.__memory__.move_to_end(key)
+                    self.stats.increment(apiMethod, "memoryHits")
+                    return entry [1]
+                del self.__memory__ [key]
+        entry = self.__readDisk__(key)
+        if entry is not None:
+            self.__remember__(key, *entry)
+            self.stats.increment(apiMethod, "diskHits")
+            return entry [1]
+        self.stats.increment(apiMethod, "misses")
+        value = loader()
+        if value is not None:
+            self.__remember__(key, time(), value)
+            self.__writeDisk__(key, value)
+        return value
+
+    def getHitRatio(self, apiMethod = None):
+        """
+        Returns (memoryHitRatio, diskHitRatio, missRatio) for one method, or for all of them when apiMethod is None.
+        """
+        counters = self.stats.get(apiMethod)
+        total = counters.get("memoryHits", 0) + counters.get("diskHits", 0) + counters.get("misses", 0)
+        if not total:
+            return 0.0, 0.0, 0.0
+        return counters.get("memoryHits", 0) / total, counters.get("diskHits", 0) / total, counters.get("misses", 0) / total
+
+    def getHitRatios(self):
+        """
+        Returns :meth:`getHitRatio` for every method seen so far.
+        """
+        return { apiMethod: self.getHitRatio(apiMethod) for apiMethod in self.stats.snapshot() }
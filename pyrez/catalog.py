@@ -0,0 +1,504 @@
+from logging import getLogger
+from sys import intern
+from threading import Event, Lock, Thread
+from time import monotonic
+
+from pyrez.cache import PersistentCache
+from pyrez.enumerations import LanguageCode
+from pyrez.exceptions import InvalidArgumentException
+from pyrez.executor import BulkExecutor
+
+logger = getLogger(__name__)
+
+class CatalogWarmup:
+    """
+    Fetches the whole catalog matrix (method × language × platform) concurrently at start-up and indexes it by id.
+
+    Gods/champions and items are fetched first. Skins and cards (one request per god/champion) are fetched next.
+    With a snapshot file, the last catalog is loaded straight away and refreshed in the background.
+
+    Parameters
+    ----------
+    apis : dict
+        Platform → :class:`SmiteAPI` or :class:`PaladinsAPI` (e.g. :attr:`CrossPlatformLookup.apis`).
+    languages : [optional] : list of class:`LanguageCode`
+        It defaults to every language.
+    catalogs : [optional] : list of str
+        API methods that only take a language. It defaults to :attr:`CATALOGS` of the game.
+    characterCatalogs : [optional] : list of str
+        API methods that take a god/champion id and a language. It defaults to :attr:`CHARACTER_CATALOGS` of the game.
+    snapshotPath : [optional] : str
+        JSON file the catalog is loaded from and saved to.
+    maxWorkers : [optional] : int
+        Maximum number of requests in flight. It defaults to 8.
+    """
+    CATALOGS = { "SmiteAPI": ("getgods", "getitems"), "PaladinsAPI": ("getchampions", "getitems") }
+    CHARACTER_CATALOGS = { "SmiteAPI": ("getgodskins",), "PaladinsAPI": ("getchampionskins", "getchampioncards") }
+    CHARACTER_METHODS = ("getgods", "getchampions")
+    ID_FIELDS = { "getgods": "id", "getchampions": "id", "getitems": "ItemId", "getgodskins": "skin_id1", "getchampionskins": "skin_id1", "getchampioncards": "card_id1" }
+
+    def __init__(self, apis, languages = tuple(LanguageCode.__members__.values()), catalogs = None, characterCatalogs = None, snapshotPath = None, maxWorkers = 8):
+        if not apis:
+            raise InvalidArgumentException("You need to pass at least one API object!")
+        self.apis = dict(apis)
+        self.languages = tuple(languages)
+        self.catalogs = { platform: tuple(catalogs) if catalogs is not None else self.CATALOGS.get(type(api).__name__, ()) for platform, api in self.apis.items() }
+        self.characterCatalogs = { platform: tuple(characterCatalogs) if characterCatalogs is not None else self.CHARACTER_CATALOGS.get(type(api).__name__, ()) for platform, api in self.apis.items() }
+        self.snapshot = PersistentCache(snapshotPath) if snapshotPath else None
+        self.executor = BulkExecutor(maxWorkers)
+        self.errors = []
+        self.failure = None
+        self.ready = Event()
+        self.__rows__ = {}
+        self.__indexes__ = {}
+        self.__lock__ = Lock()
+        self.__thread__ = None
+
+    @staticmethod
+    def __key__(platform, apiMethod, language):
+        return "{0}/{1}/{2}".format(platform, apiMethod, int(language))
+
+    def __request__(self, item):
+        platform, apiMethod, params = item
+        return self.apis [platform].makeRequest(apiMethod, params)
+
+    def __fetch__(self, requests):
+        rows, errors = {}, []
+        for (platform, apiMethod, params), result, error in self.executor.mapAsCompleted(self.__request__, requests):
+            if error is not None:
+                errors.append(((platform, apiMethod, params), error))
+            elif isinstance(result, list):
+                rows.setdefault(self.__key__(platform, apiMethod, params [-1]), []).extend(result)
+        return rows, errors
+
+    def __keepPrevious__(self, rows, errors):
+        """
+        Completes the catalogs a refresh couldn't fetch (fully, partly or not at all) with the rows loaded before, fresh rows first.
+        """
+        with self.__lock__:
+            previous = self.__rows__
+        failedKeys = { self.__key__(platform, apiMethod, params [-1]) for (platform, apiMethod, params), error in errors }
+        for key in (failedKeys & previous.keys()) | (previous.keys() - rows.keys()):
+            idField, fresh = self.ID_FIELDS.get(key.split('/') [1]), rows.get(key, [])
+            if idField is None:
+                rows [key] = fresh or previous [key]
+                continue
+            freshIds = { row.get(idField) for row in fresh if isinstance(row, dict) }
+            rows [key] = fresh + [ row for row in previous [key] if isinstance(row, dict) and row.get(idField) not in freshIds ]
+        return rows
+
+    def __buildIndexes__(self, rows):
+        indexes = {}
+        for key, catalogRows in rows.items():
+            idField = self.ID_FIELDS.get(key.split('/') [1])
+            if idField:
+                indexes [key] = { int(row [idField]): row for row in catalogRows if isinstance(row, dict) and row.get(idField) }
+        with self.__lock__:
+            self.__rows__, self.__indexes__ = rows, indexes
+
+    def warmUp(self):
+        """
+        Fetches every catalog now, rebuilds the indexes and saves the snapshot (if any). Sets :attr:`ready` when done,
+        even when the warm-up itself fails: its exception is then kept in :attr:`failure` and raised.
+        Failed requests are kept in :attr:`errors`; the catalogs they belong to keep the rows loaded before
+        (from the snapshot or the previous warm-up), merged under whatever the refresh did fetch.
+        """
+        try:
+            self.__warmUp__()
+            self.failure = None
+        except Exception as x:
+            self.failure = x
+            raise
+        finally:
+            self.ready.set()
+
+    def __warmUp__(self):
+        rows, errors = self.__fetch__([ (platform, apiMethod, [ language ]) for platform, methods in self.catalogs.items() for apiMethod in methods for language in self.languages ])
+        rows = self.__keepPrevious__(rows, errors) # Gods/champions first: the character requests are built from them
+        characterRequests = []
+        for platform, methods in self.characterCatalogs.items():
+            characterIds = { int(row ["id"]) for key, catalogRows in rows.items() if key.split('/') [0] == str(platform) and key.split('/') [1] in self.CHARACTER_METHODS for row in catalogRows if row.get("id") }
+            characterRequests.extend((platform, apiMethod, [ characterId, language ]) for apiMethod in methods for characterId in sorted(characterIds) for language in self.languages)
+        characterRows, characterErrors = self.__fetch__(characterRequests)
+        rows.update(characterRows)
+        rows = self.__keepPrevious__(rows, characterErrors)
+        self.errors = errors + characterErrors
+        self.__buildIndexes__(rows)
+        if self.snapshot is not None:
+            for key, catalogRows in rows.items():
+                self.snapshot.set(key, catalogRows)
+            self.snapshot.save()
+
+    def __background__(self):
+        try:
+            self.warmUp()
+        except Exception:
+            logger.exception("Catalog warm-up failed")
+
+    def start(self):
+        """
+        Loads the snapshot (when there is one) and marks the catalog ready at once, then refreshes it in a background thread.
+        Without a snapshot, :attr:`ready` is set when the background warm-up finishes (see :attr:`failure`).
+        """
+        if self.snapshot is not None and len(self.snapshot):
+            self.__buildIndexes__(dict(self.snapshot.items()))
+            self.ready.set()
+        self.__thread__ = Thread(target=self.__background__, daemon=True)
+        self.__thread__.start()
+        return self.__thread__
+
+    def waitReady(self, timeout = None):
+        """
+        Waits until the catalog is ready or the warm-up failed.
+
+        Returns
+        -------
+        bool
+            True when the catalog can be used: a warm-up (or the snapshot) loaded it. False on timeout, or when the
+            warm-up failed before anything was loaded (its exception is in :attr:`failure`).
+        """
+        if not self.ready.wait(timeout):
+            return False
+        with self.__lock__:
+            return self.failure is None or bool(self.__rows__)
+
+    def getRows(self, apiMethod, language = LanguageCode.English, platform = None):
+        """
+        Returns the rows of one catalog (for the first platform when platform is None).
+        """
+        with self.__lock__:
+            return self.__rows__.get(self.__key__(next(iter(self.apis)) if platform is None else platform, str(apiMethod).lower(), language), [])
+
+    def get(self, apiMethod, objectId, language = LanguageCode.English, platform = None):
+        """
+        Returns the row with objectId (god/champion, item, skin or card id) in O(1), or None.
+        """
+        with self.__lock__:
+            return self.__indexes__.get(self.__key__(next(iter(self.apis)) if platform is None else platform, str(apiMethod).lower(), language), {}).get(int(objectId))
+
+class MultiLanguageCatalog:
+    """
+    One catalog (gods, champions, items, skins or cards) held for many languages at once.
+
+    The fields of an object that are identical in every language (ids, URLs, numeric stats, ...) are stored once.
+    Only the values that differ from them are kept per language, and every string is interned so repeated values
+    (roles, pantheons, rarities, ...) are shared by all objects.
+
+    Parameters
+    ----------
+    idField : str
+        Field holding the object id, e.g. "id", "ItemId" or "card_id1".
+    """
+    def __init__(self, idField):
+        self.idField = idField
+        self.languages = []
+        self.__invariant__ = {}
+        self.__localized__ = {}
+
+    @classmethod
+    def fromWarmup(cls, warmup, apiMethod, platform = None):
+        """
+        Builds the catalog of apiMethod in every language loaded by a :class:`CatalogWarmup`.
+        """
+        catalog = cls(warmup.ID_FIELDS [str(apiMethod).lower()])
+        for language in warmup.languages:
+            catalog.add(language, warmup.getRows(apiMethod, language, platform))
+        return catalog
+
+    @staticmethod
+    def intern(value):
+        if isinstance(value, str):
+            return intern(value)
+        if isinstance(value, dict):
+            return { intern(str(key)): MultiLanguageCatalog.intern(item) for key, item in value.items() }
+        if isinstance(value, list):
+            return [ MultiLanguageCatalog.intern(item) for item in value ]
+        return value
+
+    def add(self, language, rows):
+        """
+        Adds the rows of one language.
+        """
+        if language not in self.languages:
+            self.languages.append(language)
+        for row in rows or []:
+            if not isinstance(row, dict) or row.get(self.idField) is None:
+                continue
+            objectId = int(row [self.idField])
+            row = self.intern(row)
+            invariant = self.__invariant__.get(objectId)
+            if invariant is None:
+                self.__invariant__ [objectId] = row
+                continue
+            localized = { field: value for field, value in row.items() if invariant.get(field) != value }
+            if localized:
+                self.__localized__.setdefault(objectId, {}) [language] = localized
+
+    def __len__(self):
+        return len(self.__invariant__)
+
+    def __contains__(self, objectId):
+        return int(objectId) in self.__invariant__
+
+    def get(self, objectId, language = LanguageCode.English):
+        """
+        Returns the row of an object in one language, or None.
+        """
+        invariant = self.__invariant__.get(int(objectId))
+        if invariant is None:
+            return None
+        localized = self.__localized__.get(int(objectId), {}).get(language)
+        return dict(invariant, **localized) if localized else dict(invariant)
+
+    def getRows(self, language = LanguageCode.English):
+        return [ self.get(objectId, language) for objectId in self.__invariant__ ]
+
+    def getLocalizedFields(self):
+        """
+        Returns the names of the fields that differ between languages for at least one object.
+        """
+        return { field for languages in self.__localized__.values() for localized in languages.values() for field in localized }
+
+class ItemCatalog:
+    """
+    Items returned by :meth:`BaseSmitePaladinsAPI.getItems` indexed for O(1) lookups.
+
+    The id index, the build trees (Smite's ChildItemId is the item an item is upgraded from), and the tier and type
+    indexes are built once, so enriching match rows is a dict lookup per item.
+
+    Parameters
+    ----------
+    rows : list
+        Rows returned by getItems.
+    """
+    def __init__(self, rows):
+        self.items = {}
+        self.upgrades = {}
+        self.tiers = {}
+        self.types = {}
+        for row in rows or []:
+            itemId = self.toId(row.get("ItemId")) if isinstance(row, dict) else None
+            if not itemId:
+                continue
+            self.items [itemId] = row
+            parentId = self.toId(row.get("ChildItemId"))
+            if parentId and parentId != itemId:
+                self.upgrades.setdefault(parentId, []).append(itemId)
+            tier, itemType = row.get("ItemTier"), row.get("Type", row.get("item_type")) # Smite / Paladins
+            if tier is not None:
+                self.tiers.setdefault(self.toId(tier) or tier, []).append(itemId)
+            if itemType is not None:
+                self.types.setdefault(str(itemType), []).append(itemId)
+
+    @classmethod
+    def fromWarmup(cls, warmup, language = LanguageCode.English, platform = None):
+        return cls(warmup.getRows("getitems", language, platform))
+
+    @staticmethod
+    def toId(value):
+        try:
+            return int(value)
+        except (TypeError, ValueError):
+            return None
+
+    def __len__(self):
+        return len(self.items)
+
+    def __contains__(self, itemId):
+        return self.toId(itemId) in self.items
+
+    def get(self, itemId):
+        return self.items.get(self.toId(itemId))
+
+    def getParent(self, itemId):
+        """
+        Returns the item this one is upgraded from, or None for a root item.
+        """
+        parentId = self.toId((self.get(itemId) or {}).get("ChildItemId"))
+        return self.items.get(parentId) if parentId != self.toId(itemId) else None
+
+    def getUpgrades(self, itemId):
+        """
+        Returns the items built directly from this one.
+        """
+        return [ self.items [upgradeId] for upgradeId in self.upgrades.get(self.toId(itemId), []) ]
+
+    def getBuildPath(self, itemId):
+        """
+        Returns the items from the root of the build tree down to itemId.
+        """
+        path, row, seen = [], self.get(itemId), set()
+        while row is not None and id(row) not in seen:
+            seen.add(id(row))
+            path.append(row)
+            row = self.getParent(row ["ItemId"])
+        return path [::-1]
+
+    def getTree(self, itemId, seen = None):
+        """
+        Returns { itemId: { upgradeId: { ... } } }, the build tree below itemId. An item met again on its own branch
+        (a cycle in bad catalog data) is listed without children.
+        """
+        itemId, seen = self.toId(itemId), seen or frozenset()
+        if itemId in seen:
+            return { itemId: {} }
+        seen = seen | { itemId }
+        return { itemId: { upgradeId: children for upgrade in self.upgrades.get(itemId, []) for upgradeId, children in self.getTree(upgrade, seen).items() } }
+
+    def getByTier(self, tier):
+        return [ self.items [itemId] for itemId in self.tiers.get(self.toId(tier) or tier, []) ]
+
+    def getByType(self, itemType):
+        return [ self.items [itemId] for itemId in self.types.get(str(itemType), []) ]
+
+    def resolve(self, itemIds):
+        """
+        Returns the item of every id (None for empty slots and unknown ids).
+        """
+        items = self.items
+        return [ items.get(self.toId(itemId)) for itemId in itemIds ]
+
+    def resolveMatch(self, match):
+        """
+        Returns (actives, items) of a :class:`MatchHistory` object or a raw match history row.
+        """
+        if isinstance(match, dict):
+            return self.resolve(match.get("ActiveId{0}".format(i)) for i in range(1, 5)), self.resolve(match.get("ItemId{0}".format(i)) for i in range(1, 7))
+        return self.resolve(item.itemId for item in match.items), self.resolve(item.itemId for item in match.loadout)
+
+    def enrich(self, matches):
+        """
+        Sets the catalog row as item.item on every :class:`InGameItem` of many :class:`MatchHistory` objects and returns them.
+        """
+        for match in matches or []:
+            for item in match.items + match.loadout:
+                item.item = self.items.get(self.toId(item.itemId))
+        return matches
+
+class CardIndex:
+    """
+    Every champion card of one patch and language, built once from :meth:`PaladinsAPI.getChampionsCards`
+    (one request per champion, sent concurrently), to resolve the cards of many :class:`PlayerLoadout` in O(1).
+
+    Use :meth:`getInstance` to share one index per endpoint, patch and language.
+    The patch is asked with getPatchInfo at most once every :attr:`PATCH_CHECK_INTERVAL` seconds per endpoint.
+
+    Parameters
+    ----------
+    api : class:`PaladinsAPI`
+    language : [optional] : class:`LanguageCode`
+        It defaults to English.
+    patch : [optional] : str
+        Game version the index belongs to.
+    maxWorkers : [optional] : int
+        Maximum number of requests in flight. It defaults to 8.
+    """
+    CARD_ID_FIELDS = ("card_id2", "card_id1") # Looked up in this order
+    PATCH_CHECK_INTERVAL = 300
+    __instances__ = {}
+    __buildLocks__ = {} # One lock per index key, so languages (and endpoints) are built in parallel
+    __patches__ = {} # endpoint → (monotonic time of the check, game version)
+    __instancesLock__ = Lock()
+
+    def __init__(self, api, language = LanguageCode.English, patch = None, maxWorkers = 8):
+        self.api = api
+        self.language = language
+        self.patch = patch
+        self.executor = BulkExecutor(maxWorkers)
+        self.errors = []
+        self.__cards__ = { field: {} for field in self.CARD_ID_FIELDS }
+
+    @classmethod
+    def getPatch(cls, api):
+        """
+        Returns the game version of the endpoint of api, asking getPatchInfo only when the last answer is older than :attr:`PATCH_CHECK_INTERVAL`.
+        """
+        endpoint = api.__endpointBaseURL__
+        with cls.__instancesLock__:
+            checked = cls.__patches__.get(endpoint)
+        if checked is not None and monotonic() - checked [0] < cls.PATCH_CHECK_INTERVAL:
+            return checked [1]
+        patchInfo = api.getPatchInfo()
+        patch = patchInfo.gameVersion if patchInfo else None
+        with cls.__instancesLock__:
+            cls.__patches__ [endpoint] = (monotonic(), patch)
+        return patch
+
+    @classmethod
+    def getInstance(cls, api, language = LanguageCode.English):
+        """
+        Returns the index of the current patch (see :meth:`getPatch`), building it on first use.
+
+        Builds are serialized per endpoint, patch and language only. A build with errors is returned but not shared,
+        so the next call builds the index again.
+        """
+        key = (api.__endpointBaseURL__, cls.getPatch(api), int(language))
+        with cls.__instancesLock__:
+            index = cls.__instances__.get(key)
+            if index is not None:
+                return index
+            buildLock = cls.__buildLocks__.setdefault(key, Lock())
+        with buildLock:
+            with cls.__instancesLock__:
+                index = cls.__instances__.get(key)
+            if index is not None:
+                return index
+            index = cls(api, language, key [1]).build()
+            if not index.errors:
+                with cls.__instancesLock__:
+                    cls.__instances__ [key] = index
+            return index
+
+    def __request__(self, championId):
+        return self.api.makeRequest("getchampioncards", [ championId, self.language ])
+
+    def build(self):
+        """
+        Fetches the cards of every champion and rebuilds the index. Failed champions are kept in :attr:`errors`.
+        """
+        champions = self.api.makeRequest("getchampions", [ self.language ]) or []
+        cards, errors = { field: {} for field in self.CARD_ID_FIELDS }, []
+        for championId, rows, error in self.executor.mapAsCompleted(self.__request__, { int(champion ["id"]) for champion in champions if champion.get("id") }):
+            if error is not None:
+                errors.append((championId, error))
+                continue
+            for row in rows or []:
+                for field in self.CARD_ID_FIELDS:
+                    if row.get(field):
+                        cards [field] [int(row [field])] = row
+        self.__cards__, self.errors = cards, errors
+        return self
+
+    def __len__(self):
+        return len(self.__cards__ [self.CARD_ID_FIELDS [-1]])
+
+    def get(self, cardId):
+        """
+        Returns the card row of a loadout item id, or None.
+        """
+        try:
+            cardId = int(cardId)
+        except (TypeError, ValueError):
+            return None
+        for field in self.CARD_ID_FIELDS:
+            card = self.__cards__ [field].get(cardId)
+            if card is not None:
+                return card
+        return None
+
+    def resolveLoadout(self, loadout):
+        """
+        Returns the card rows of a :class:`PlayerLoadout` or a raw getplayerloadouts row.
+        """
+        if isinstance(loadout, dict):
+            return [ self.get(card.get("ItemId")) for card in loadout.get("LoadoutItems") or [] ]
+        return [ self.get(card.itemId) for card in loadout.cards ]
+
+    def enrich(self, loadouts):
+        """
+        Sets the card row as card.card on every :class:`LoadoutItem` of many :class:`PlayerLoadout` and returns them.
+        """
+        for loadout in loadouts or []:
+            for card in loadout.cards:
+                card.card = self.get(card.itemId)
+        return loadouts
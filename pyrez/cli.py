@@ -0,0 +1,232 @@
+import argparse
+from datetime import datetime, timedelta
+import json
+import os
+import sys
+from time import monotonic
+
+from pyrez.api import PaladinsAPI, RealmRoyaleAPI, SmiteAPI
+from pyrez.enumerations import LanguageCode, Platform
+from pyrez.executor import BulkExecutor
+from pyrez.export import ModelExporter
+from pyrez.models import MatchHistory
+from pyrez.ratelimit import RateLimiter
+from pyrez.schema import parseModels
+from pyrez.store import MatchStore
+
+GAMES = { "paladins": PaladinsAPI, "realm": RealmRoyaleAPI, "smite": SmiteAPI }
+CATALOGS = { "paladins": ("getchampions", "getitems"), "realm": (), "smite": ("getgods", "getitems") }
+
+class Progress:
+    """
+    Prints throughput and quota progress to stderr, at most once per interval.
+    """
+    def __init__(self, api, total = None, interval = 1.0, requestsLeft = None, stream = sys.stderr):
+        self.api = api
+        self.total = total
+        self.interval = interval
+        self.requestsLeft = requestsLeft
+        self.stream = stream
+        self.done = 0
+        self.started = monotonic()
+        self.__lastPrint__ = 0
+
+    def update(self, count = 1, force = False):
+        self.done += count
+        now = monotonic()
+        if self.stream is None or not force and now - self.__lastPrint__ < self.interval:
+            return
+        self.__lastPrint__ = now
+        requests = self.api.stats.get().get("requests", 0)
+        line = "{0}{1} items, {2:.1f} items/s, {3} requests".format(self.done, "/{0}".format(self.total) if self.total is not None else '', self.done / max(now - self.started, 1e-6), requests)
+        if self.requestsLeft is not None:
+            line += ", ~{0} requests left today".format(max(0, self.requestsLeft - requests))
+        self.stream.write("\r" + line)
+        self.stream.flush()
+
+    def finish(self):
+        self.update(0, force=True)
+        if self.stream is not None:
+            self.stream.write("\n")
+
+class Output:
+    """
+    Writes rows as JSON lines, or as columnar/CSV files through :class:`ModelExporter` when a model is given.
+    """
+    def __init__(self, path, format, modelClass = None):
+        self.format = format
+        self.__exporter__ = None
+        self.__file__ = None
+        if format == "jsonl":
+            self.__file__ = open(path, 'w', encoding="utf-8") if path and path != '-' else sys.stdout
+        else:
+            if modelClass is None:
+                raise SystemExit("The {0} format is only available for match data; use jsonl.".format(format))
+            if not path or path == '-':
+                raise SystemExit("The {0} format needs an --output file.".format(format))
+            self.__exporter__ = ModelExporter(path, modelClass, format)
+
+    def write(self, rows):
+        if self.__exporter__ is not None:
+            self.__exporter__.write(parseModels(MatchHistory, [ row for row in rows if isinstance(row, dict) ]))
+            return
+        for row in rows:
+            self.__file__.write(json.dumps(row) + "\n")
+
+    def close(self):
+        if self.__exporter__ is not None:
+            self.__exporter__.close()
+        elif self.__file__ is not sys.stdout:
+            self.__file__.close()
+
+def createApi(args):
+    devId, authKey = args.dev_id or os.environ.get("PYREZ_DEV_ID"), args.auth_key or os.environ.get("PYREZ_AUTH_KEY")
+    if not devId or not authKey:
+        raise SystemExit("You need to pass --dev-id and --auth-key (or set PYREZ_DEV_ID and PYREZ_AUTH_KEY).")
+    api = GAMES [args.game](devId, authKey, Platform [args.platform.upper()])
+    if args.rate:
+        api.rateLimiter = RateLimiter(args.rate)
+    return api
+
+def createProgress(api, args, total = None):
+    requestsLeft = None
+    if not args.quiet:
+        try:
+            dataUsed = api.getDataUsed()
+            requestsLeft = dataUsed.requestsLeft() if dataUsed else None
+        except Exception:
+            pass
+    return Progress(api, total, stream=None if args.quiet else sys.stderr, requestsLeft=requestsLeft)
+
+def readIds(values):
+    ids = []
+    for value in values:
+        if os.path.isfile(value):
+            with open(value, 'r', encoding="utf-8") as file:
+                lines = file.read().splitlines()
+        else:
+            lines = [value]
+        for line in lines:
+            line = line.strip()
+            if line.startswith('{'):
+                row = json.loads(line)
+                line = str(row.get("Match") or row.get("match_id") or row.get("player_id") or '')
+            if line:
+                ids.append(line)
+    return list(dict.fromkeys(ids))
+
+def harvestMatchIds(api, args):
+    start, end = datetime.strptime(args.start, "%Y-%m-%d"), datetime.strptime(args.end or args.start, "%Y-%m-%d")
+    days = [ start + timedelta(days=i) for i in range((end - start).days + 1) ]
+    hours = [ "{0},{1:02d}".format(hour, minute) for hour in range(24) for minute in range(0, 60, 10) ] if args.window == "10m" else range(24) if args.window == "hour" else [-1]
+    jobs = [ (queue, day.strftime("%Y%m%d"), hour) for queue in args.queue for day in days for hour in hours ]
+    output, progress = Output(args.output, "jsonl"), createProgress(api, args, len(jobs))
+    try:
+        for job, rows, error in BulkExecutor(args.workers).mapAsCompleted(lambda job: api.getMatchIdsByQueue(*job), jobs):
+            if error is not None:
+                sys.stderr.write("\n{0}: {1}\n".format(job, error))
+            elif rows:
+                output.write({ "Match": row.get("Match"), "Active_Flag": row.get("Active_Flag"), "queue": job [0], "date": job [1] } for row in rows if str(row.get("Active_Flag", 'n')).lower() != 'y' or args.include_active)
+            progress.update()
+    finally:
+        progress.finish()
+        output.close()
+
+def fetchMatches(api, args):
+    matchIds = readIds(args.ids)
+    store = MatchStore(args.store) if args.store else None
+    if store is not None:
+        matchIds = store.getMissingMatchIds(matchIds)
+    batches = [ ','.join(str(matchId) for matchId in matchIds [i:i + args.batch_size]) for i in range(0, len(matchIds), args.batch_size) ]
+    output, progress = Output(args.output, args.format, MatchHistory), createProgress(api, args, len(matchIds))
+    try:
+        for batch, rows, error in BulkExecutor(args.workers).mapAsCompleted(api.getMatchDetailsBatch, batches):
+            if error is not None:
+                sys.stderr.write("\n{0}: {1}\n".format(batch, error))
+            elif rows:
+                if store is not None:
+                    store.addMatchRows(rows, complete=True)
+                output.write(rows)
+            progress.update(batch.count(',') + 1)
+    finally:
+        progress.finish()
+        output.close()
+        if store is not None:
+            store.close()
+
+def refreshPlayers(api, args):
+    players = readIds(args.players)
+    output, progress = Output(args.output, "jsonl"), createProgress(api, args, len(players))
+    try:
+        for player, rows, error in BulkExecutor(args.workers).mapAsCompleted(lambda player: api.makeRequest("getplayer", [player]), players):
+            if error is not None:
+                sys.stderr.write("\n{0}: {1}\n".format(player, error))
+            elif rows:
+                output.write(rows if isinstance(rows, list) else [rows])
+            progress.update()
+    finally:
+        progress.finish()
+        output.close()
+
+def dumpCatalogs(api, args):
+    languages = [ LanguageCode [language] for language in args.language ] if args.language else [ LanguageCode.English ]
+    jobs = [ (method, language) for method in CATALOGS [args.game] for language in languages ]
+    output, progress = Output(args.output, "jsonl"), createProgress(api, args, len(jobs))
+    try:
+        for job, rows, error in BulkExecutor(args.workers).mapAsCompleted(lambda job: api.makeRequest(job [0], [job [1]]), jobs):
+            if error is not None:
+                sys.stderr.write("\n{0}: {1}\n".format(job, error))
+            elif rows:
+                output.write({ "catalog": job [0], "language": job [1].name, "data": row } for row in rows)
+            progress.update()
+    finally:
+        progress.finish()
+        output.close()
+
+def createParser():
+    parser = argparse.ArgumentParser(prog="pyrez", description="Bulk data pulls from the Hi-Rez API.")
+    parser.add_argument("--dev-id", help="Developer ID (defaults to $PYREZ_DEV_ID).")
+    parser.add_argument("--auth-key", help="Authentication key (defaults to $PYREZ_AUTH_KEY).")
+    parser.add_argument("--game", choices=sorted(GAMES), default="smite")
+    parser.add_argument("--platform", choices=[ platform.name.lower() for platform in Platform ], default="pc")
+    parser.add_argument("--workers", type=int, default=8, help="Maximum number of requests in flight (default: 8).")
+    parser.add_argument("--rate", type=float, help="Maximum requests per second.")
+    parser.add_argument("--output", "-o", default='-', help="Output file (default: stdout).")
+    parser.add_argument("--quiet", "-q", action="store_true", help="Don't print progress.")
+    commands = parser.add_subparsers(dest="command")
+    commands.required = True
+
+    command = commands.add_parser("matchids", help="Harvest match IDs of queues over a date range.")
+    command.add_argument("--queue", type=int, action="append", required=True, help="Queue ID (repeatable).")
+    command.add_argument("--start", required=True, help="First day (YYYY-MM-DD).")
+    command.add_argument("--end", help="Last day (YYYY-MM-DD, default: start).")
+    command.add_argument("--window", choices=("day", "hour", "10m"), default="hour", help="Size of every request (default: hour).")
+    command.add_argument("--include-active", action="store_true", help="Keep matches still in progress.")
+    command.set_defaults(func=harvestMatchIds)
+
+    command = commands.add_parser("matches", help="Fetch match details in bulk.")
+    command.add_argument("ids", nargs='+', help="Match IDs, or files with one ID (or matchids JSON line) per line.")
+    command.add_argument("--format", choices=("jsonl",) + ModelExporter.FORMATS, default="jsonl")
+    command.add_argument("--batch-size", type=int, default=MatchStore.BATCH_SIZE, help="Matches per getmatchdetailsbatch request (default: 10).")
+    command.add_argument("--store", help="SQLite MatchStore: matches already stored are skipped and new ones are added.")
+    command.set_defaults(func=fetchMatches)
+
+    command = commands.add_parser("players", help="Refresh a list of players.")
+    command.add_argument("players", nargs='+', help="Player names/IDs, or files with one per line.")
+    command.set_defaults(func=refreshPlayers)
+
+    command = commands.add_parser("catalog", help="Dump the gods/champions and items catalogs.")
+    command.add_argument("--language", action="append", choices=list(LanguageCode.__members__), help="Language (repeatable, default: English).")
+    command.set_defaults(func=dumpCatalogs)
+    return parser
+
+def main(argv = None):
+    args = createParser().parse_args(argv)
+    try:
+        args.func(createApi(args), args)
+    except KeyboardInterrupt:
+        return 130
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,194 @@
+from array import array
+from bisect import bisect_left
+from functools import partial
+from heapq import merge
+from itertools import groupby
+import json
+import os
+
+from pyrez.enumerations import OutputMode
+from pyrez.executor import BulkExecutor
+
+class CompactIdSet:
+    """
+    Set of integer ids stored as a sorted array of 64-bit integers (8 bytes per id) plus a small write buffer.
+
+    Parameters
+    ----------
+    ids : [optional] : iterable of int
+    bufferSize : [optional] : int
+        Number of ids kept in the buffer before it is merged into the array. It defaults to 4096.
+    """
+    def __init__(self, ids = (), bufferSize = 4096):
+        self.bufferSize = bufferSize
+        self.__ids__ = array('q', sorted(set(int(i) for i in ids)))
+        self.__buffer__ = set()
+
+    def __contains__(self, id):
+        id = int(id)
+        if id in self.__buffer__:
+            return True
+        index = bisect_left(self.__ids__, id)
+        return index < len(self.__ids__) and self.__ids__ [index] == id
+
+    def __len__(self):
+        return len(self.__ids__) + len(self.__buffer__)
+
+    def __iter__(self):
+        self.__merge__()
+        return iter(self.__ids__)
+
+    def __merge__(self):
+        if self.__buffer__:
+            self.__ids__ = array('q', (id for id, _ in groupby(merge(self.__ids__, sorted(self.__buffer__)))))
+            self.__buffer__ = set()
+
+    def add(self, id):
+        """
+        Adds an id. Returns False if it was already there.
+        """
+        if id in self:
+            return False
+        self.__buffer__.add(int(id))
+        if len(self.__buffer__) >= self.bufferSize:
+            self.__merge__()
+        return True
+
+class FriendGraphCrawler:
+    """
+    Breadth-first crawler of the friends graph, built on getFriends.
+
+    Every level of the graph is expanded concurrently and players are visited once (by :attr:`Friend.playerId`).
+    The crawl state can be saved to a file, so an interrupted crawl resumes where it stopped.
+    A player whose getFriends request fails is requeued up to maxRetries times; players that keep failing
+    are listed in :attr:`failed` and in the state file, which is then kept so they are retried on resume.
+
+    Parameters
+    ----------
+    api : class:`HiRezAPI`
+    maxDepth : [optional] : int
+        Number of levels expanded from the seeds. It defaults to 2.
+    maxNodes : [optional] : int
+        Maximum number of players visited. It defaults to 10000.
+    maxWorkers : [optional] : int
+        Maximum number of requests in flight. It defaults to 8.
+    rateLimiter : [optional] : class:`RateLimiter`
+    statePath : [optional] : str
+        JSON file where the frontier is saved. The visited set is saved next to it, in "<statePath>.visited".
+    checkpointEvery : [optional] : int
+        Number of expanded players between two saves of the state. It defaults to 100.
+    maxRetries : [optional] : int
+        Number of times a failed player is requeued within its level. It defaults to 2.
+    """
+    def __init__(self, api, maxDepth = 2, maxNodes = 10000, maxWorkers = 8, rateLimiter = None, statePath = None, checkpointEvery = 100, maxRetries = 2):
+        self.api = api
+        self.maxDepth = maxDepth
+        self.maxNodes = maxNodes
+        self.executor = BulkExecutor(maxWorkers, rateLimiter)
+        self.statePath = statePath
+        self.checkpointEvery = checkpointEvery
+        self.maxRetries = maxRetries
+        self.failed = {} # playerId → last exception
+        self.__savedVisited__ = 0 # Ids in the visited file as of the last save
+        self.__unsaved__ = [] # Ids visited since the last save
+
+    def __visitedPath__(self):
+        return "{0}.visited".format(self.statePath)
+
+    def loadState(self):
+        if not self.statePath or not os.path.isfile(self.statePath):
+            return None
+        with open(self.statePath, 'r', encoding="utf-8") as file:
+            state = json.load(file)
+        if "visitedCount" in state: # Ids appended to the visited file by a save that didn't complete are ignored
+            state ["visited"] = array('q')
+            with open(self.__visitedPath__(), 'rb') as file:
+                state ["visited"].frombytes(file.read(8 * state ["visitedCount"]))
+        return state
+
+    def saveState(self, depth, frontier, nextFrontier, visited):
+        """
+        Saves the crawl state. The visited ids are appended to the visited file as 64-bit integers (native byte order),
+        only the ones visited since the last save, so a checkpoint doesn't rewrite the whole visited set.
+        """
+        if not self.statePath:
+            return
+        with open(os.open(self.__visitedPath__(), os.O_RDWR | os.O_CREAT), 'r+b') as file:
+            file.truncate(8 * self.__savedVisited__)
+            file.seek(0, os.SEEK_END)
+            array('q', self.__unsaved__).tofile(file)
+        visitedCount = self.__savedVisited__ + len(self.__unsaved__)
+        tempPath = "{0}.tmp".format(self.statePath)
+        with open(tempPath, 'w', encoding="utf-8") as file:
+            json.dump({ "depth": depth, "frontier": sorted(frontier), "next": nextFrontier, "visitedCount": visitedCount, "failed": sorted(self.failed) }, file)
+        os.replace(tempPath, self.statePath)
+        self.__savedVisited__, self.__unsaved__ = visitedCount, []
+
+    def crawl(self, seeds = (), sink = None):
+        """
+        Crawls the graph from the seeds, resuming the saved state of an interrupted crawl if there is one.
+
+        Seeds that the saved crawl hasn't visited yet are added to its current frontier.
+
+        Parameters
+        ----------
+        seeds : iterable of int
+        sink : [optional] : callable
+            Called with (playerId, :class:`Friend`) for every edge found.
+
+        Returns
+        -------
+        generator of tuple
+            (playerId, :class:`Friend`) for every edge found.
+        """
+        state, self.failed = self.loadState(), {}
+        if state:
+            depth, frontier, nextFrontier, visited = state ["depth"], set(state ["frontier"]), state ["next"], CompactIdSet(state ["visited"])
+            # A state file of an older version keeps the visited ids in the JSON: the first save moves them to the visited file
+            self.__savedVisited__, self.__unsaved__ = (state ["visitedCount"], []) if "visitedCount" in state else (0, list(visited))
+            if state.get("failed"):
+                if depth >= self.maxDepth: # Finished crawl: only its failed players are left to expand
+                    depth, frontier, nextFrontier = self.maxDepth - 1, set(), []
+                frontier.update(state ["failed"])
+        else:
+            depth, frontier, nextFrontier, visited = 0, set(), [], CompactIdSet()
+            self.__savedVisited__, self.__unsaved__ = 0, []
+        for seed in seeds:
+            if visited.add(seed):
+                frontier.add(int(seed))
+                self.__unsaved__.append(int(seed))
+        while frontier and depth < self.maxDepth:
+            expanded, attempts = 0, {}
+            while frontier:
+                retries = []
+                for playerId, friends, error in self.executor.mapAsCompleted(partial(self.api.getFriends, outputMode=OutputMode.MODEL), sorted(frontier)):
+                    frontier.discard(playerId)
+                    if error is not None:
+                        attempts [playerId] = attempts.get(playerId, 0) + 1
+                        if attempts [playerId] <= self.maxRetries:
+                            retries.append(playerId)
+                        else:
+                            self.failed [playerId] = error
+                        continue
+                    self.failed.pop(playerId, None)
+                    for friend in friends or []:
+                        if not friend.playerId:
+                            continue # Private profiles come back without a playerId
+                        if sink:
+                            sink(playerId, friend)
+                        yield playerId, friend
+                        if len(visited) < self.maxNodes and visited.add(friend.playerId):
+                            nextFrontier.append(friend.playerId)
+                            self.__unsaved__.append(int(friend.playerId))
+                    expanded += 1
+                    if expanded % self.checkpointEvery == 0:
+                        self.saveState(depth, frontier.union(retries), nextFrontier, visited)
+                frontier = set(retries)
+            depth, frontier, nextFrontier = depth + 1, set(nextFrontier), []
+            self.saveState(depth, frontier, nextFrontier, visited)
+        if self.failed:
+            self.saveState(depth, frontier, nextFrontier, visited) # Kept so the failed players are retried on resume
+        elif self.statePath:
+            for path in (self.statePath, self.__visitedPath__()): # The crawl is complete, nothing left to resume
+                if os.path.isfile(path):
+                    os.remove(path)
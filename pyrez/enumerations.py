@@ -8,6 +8,11 @@ class ResponseFormat(BaseEnum):
     JSON = "json"
     XML = "xml"
 
+class OutputMode(BaseEnum):
+    MODEL = "model" # Full model objects
+    RAW = "raw" # Decoded dicts, unchanged
+    RECORD = "record" # Named tuples with the attribute names of the models
+
 class LanguageCode(IntFlag): # LanguageCode(5) == LanguageCode lang =(LanguageCode) 5;
     English = 1
     German = 2
@@ -21,6 +21,9 @@ class NotFoundException(CustomException):
 class NotSupported(CustomException):
     def __init__(self, *args, **kwargs):
         return super().__init__(*args, **kwargs)
+class ServerDownException(CustomException):
+    def __init__(self, *args, **kwargs):
+        return super().__init__(*args, **kwargs)
 class SessionLimitException(CustomException):
     def __init__(self, *args, **kwargs):
         return super().__init__(*args, **kwargs)
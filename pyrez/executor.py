@@ -0,0 +1,51 @@
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+class BulkExecutor:
+    """
+    Runs the same API call over many inputs concurrently.
+
+    Parameters
+    ----------
+    maxWorkers : [optional] : int
+        Maximum number of requests in flight. It defaults to 8.
+    rateLimiter : [optional] : class:`RateLimiter`
+        When given, every call waits for a token before it is sent.
+    """
+    def __init__(self, maxWorkers = 8, rateLimiter = None):
+        self.maxWorkers = max(1, int(maxWorkers))
+        self.rateLimiter = rateLimiter
+
+    def __call__(self, func, item):
+        if self.rateLimiter:
+            self.rateLimiter.acquire()
+        return func(item)
+
+    def mapAsCompleted(self, func, items):
+        """
+        Calls func for every item and yields the results as soon as each one completes.
+
+        Parameters
+        ----------
+        func : callable
+            Called with one item at a time.
+        items : iterable
+
+        Returns
+        -------
+        generator of tuple
+            (item, result, exception) tuples; exception is None when the call succeeded.
+        """
+        items = list(items)
+        if not items:
+            return
+        with ThreadPoolExecutor(max_workers=min(self.maxWorkers, len(items))) as executor:
+            futures = { executor.submit(self, func, item): item for item in items }
+            try:
+                for future in as_completed(futures):
+                    try:
+                        yield futures[future], future.result(), None
+                    except Exception as x:
+                        yield futures[future], None, x
+            finally:
+                for future in futures:
+                    future.cancel()
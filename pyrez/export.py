@@ -0,0 +1,167 @@
+import csv
+from datetime import datetime
+from enum import Enum
+import gzip
+
+from pyrez.exceptions import InvalidArgumentException, NotSupported
+from pyrez.models import GodRank, MatchHistory, MatchPlayerDetail, QueueStats
+from pyrez.utils import parseDatetime
+
+try:
+    import pyarrow
+    import pyarrow.ipc
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
+
+def __item__(attr, index, field):
+    def getter(obj):
+        items = getattr(obj, attr, None) or []
+        return getattr(items [index], field, None) if index < len(items) else None
+    return getter
+
+# Stable column layout of every exportable model: (column, type, attribute name or getter)
+SCHEMAS = {
+    MatchHistory: [
+        ("matchId", "int", "matchId"), ("playerName", "str", "playerName"), ("championId", "int", "championId"), ("championName", "str", "championName"),
+        ("matchQueueId", "int", "matchQueueId"), ("queue", "str", "queue"), ("matchTime", "datetime", "matchTime"), ("matchMinutes", "int", "matchMinutes"),
+        ("matchTimeSecond", "int", "matchTimeSecond"), ("mapGame", "str", "mapGame"), ("matchRegion", "str", "matchRegion"), ("winStatus", "str", "winStatus"),
+        ("taskForce", "int", "taskForce"), ("winningTaskForce", "int", "winningTaskForce"), ("team1Score", "int", "team1Score"), ("team2Score", "int", "team2Score"),
+        ("kills", "int", "kills"), ("deaths", "int", "deaths"), ("assists", "int", "assists"), ("killingSpree", "int", "killingSpree"), ("multiKillMax", "int", "multiKillMax"),
+        ("level", "int", "level"), ("credits", "int", "credits"), ("creeps", "int", "creeps"), ("damage", "int", "damage"), ("damageBot", "int", "damageBot"),
+        ("damageDoneInHand", "int", "damageDoneInHand"), ("damageMitigated", "int", "damageMitigated"), ("damageStructure", "int", "damageStructure"),
+        ("damageTaken", "int", "damageTaken"), ("damageTakenMagical", "int", "damageTakenMagical"), ("damageTakenPhysical", "int", "damageTakenPhysical"),
+        ("healing", "int", "healing"), ("healingBot", "int", "healingBot"), ("healingPlayerSelf", "int", "healingPlayerSelf"), ("objectiveAssists", "int", "objectiveAssists"),
+        ("wardsPlaced", "int", "wardsPlaced"), ("distanceTraveled", "int", "distanceTraveled"), ("skinId", "int", "skinId"), ("skin", "str", "skin"), ("surrendered", "str", "surrendered"),
+    ] + [ ("active{0}{1}".format(i + 1, suffix), "int", __item__("items", i, field)) for i in range(4) for suffix, field in (("Id", "itemId"), ("Level", "itemLevel")) ]
+      + [ ("item{0}{1}".format(i + 1, suffix), "int", __item__("loadout", i, field)) for i in range(6) for suffix, field in (("Id", "itemId"), ("Level", "itemLevel")) ],
+    MatchPlayerDetail: [
+        ("matchId", "int", "matchId"), ("playerId", "int", "playerId"), ("playerName", "str", "playerName"), ("accountLevel", "int", "accountLevel"),
+        ("championId", "int", "championId"), ("championName", "str", "championName"), ("masteryLevel", "int", "masteryLevel"), ("queue", "int", "queue"),
+        ("skinId", "int", "skinId"), ("playerCreated", "datetime", "playerCreated"), ("taskForce", "int", "taskForce"), ("tier", "int", "tier"),
+        ("tierWins", "int", "tierWins"), ("tierLosses", "int", "tierLosses"),
+    ],
+    QueueStats: [
+        ("playerId", "int", "playerId"), ("godId", "int", "godId"), ("godName", "str", "godName"), ("queue", "str", "queue"), ("matches", "int", "matches"),
+        ("wins", "int", "wins"), ("losses", "int", "losses"), ("kills", "int", "kills"), ("deaths", "int", "deaths"), ("assists", "int", "assists"),
+        ("gold", "int", "gold"), ("minutes", "int", "minutes"), ("lastPlayed", "datetime", "lastPlayed"),
+    ],
+    GodRank: [
+        ("playerId", "int", "playerId"), ("godId", "int", "godId"), ("godName", "str", "godName"), ("godLevel", "int", "godLevel"), ("worshippers", "int", "worshippers"),
+        ("wins", "int", "wins"), ("losses", "int", "losses"), ("kills", "int", "kills"), ("deaths", "int", "deaths"), ("assists", "int", "assists"), ("minionKills", "int", "minionKills"),
+    ],
+}
+
+def __convert__(value, type):
+    if isinstance(value, Enum):
+        value = value.value
+    if value is None or value == "None":
+        return None
+    try:
+        if type == "int":
+            return int(value)
+        if type == "float":
+            return float(value)
+        if type == "bool":
+            return bool(value)
+        if type == "datetime":
+            return parseDatetime(value)
+    except (TypeError, ValueError):
+        return None
+    return str(value)
+
+class ModelExporter:
+    """
+    Streams model objects to a columnar file in bounded-size chunks, with a stable schema per model.
+
+    Parquet and Arrow need the optional ``pyarrow`` package (``pip install pyrez[export]``); gzip-compressed CSV is always available.
+
+    Parameters
+    ----------
+    path : str
+        Output file. When format is None it is picked from the extension (.parquet, .arrow or .csv.gz).
+    modelClass : class
+        :class:`MatchHistory`, :class:`MatchPlayerDetail`, :class:`QueueStats` or :class:`GodRank`.
+    format : [optional] : str
+        "parquet", "arrow" or "csv".
+    chunkSize : [optional] : int
+        Number of rows buffered before a record batch is written. It defaults to 10000.
+    """
+    FORMATS = ("parquet", "arrow", "csv")
+
+    def __init__(self, path, modelClass, format = None, chunkSize = 10000):
+        schema = next((SCHEMAS [cls] for cls in modelClass.__mro__ if cls in SCHEMAS), None)
+        if schema is None:
+            raise InvalidArgumentException("There is no export schema for {0}!".format(modelClass.__name__))
+        format = (format or ("parquet" if path.endswith(".parquet") else "arrow" if path.endswith((".arrow", ".feather")) else "csv")).lower()
+        if format not in self.FORMATS:
+            raise InvalidArgumentException("Unknown export format: {0}".format(format))
+        if format != "csv" and pyarrow is None:
+            raise NotSupported("Exporting to {0} requires pyarrow! Install it or export to csv.".format(format))
+        self.path = path
+        self.format = format
+        self.columns = schema
+        self.chunkSize = max(1, int(chunkSize))
+        self.rowsWritten = 0
+        self.__buffer__ = []
+        self.__writer__ = None
+        self.__file__ = None
+        if format == "csv":
+            self.__file__ = gzip.open(path, "wt", newline='', encoding="utf-8") if path.endswith(".gz") else open(path, 'w', newline='', encoding="utf-8")
+            self.__writer__ = csv.writer(self.__file__)
+            self.__writer__.writerow([ column [0] for column in self.columns ])
+        else:
+            types = { "int": pyarrow.int64(), "float": pyarrow.float64(), "str": pyarrow.string(), "bool": pyarrow.bool_(), "datetime": pyarrow.timestamp('s') }
+            self.schema = pyarrow.schema([ (column [0], types [column [1]]) for column in self.columns ])
+            self.__writer__ = pyarrow.parquet.ParquetWriter(path, self.schema, compression="snappy") if format == "parquet" else pyarrow.ipc.new_file(path, self.schema)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def toRow(self, obj):
+        return [ __convert__(getter(obj) if callable(getter) else getattr(obj, getter, None), type) for name, type, getter in self.columns ]
+
+    def write(self, objects):
+        """
+        Writes model objects (any iterable, consumed lazily).
+        """
+        for obj in objects or []:
+            self.__buffer__.append(self.toRow(obj))
+            if len(self.__buffer__) >= self.chunkSize:
+                self.flush()
+
+    def flush(self):
+        if not self.__buffer__:
+            return
+        if self.format == "csv":
+            self.__writer__.writerows([ [ '' if value is None else value.strftime("%Y-%m-%dT%H:%M:%S") if isinstance(value, datetime) else value for value in row ] for row in self.__buffer__ ])
+        else:
+            arrays = [ pyarrow.array([ row [i] for row in self.__buffer__ ], type=self.schema.field(i).type) for i in range(len(self.columns)) ]
+            batch = pyarrow.RecordBatch.from_arrays(arrays, schema=self.schema)
+            if self.format == "parquet":
+                self.__writer__.write_table(pyarrow.Table.from_batches([batch]))
+            else:
+                self.__writer__.write_batch(batch)
+        self.rowsWritten += len(self.__buffer__)
+        self.__buffer__ = []
+
+    def close(self):
+        if self.__writer__ is None:
+            return
+        self.flush()
+        if self.format == "csv":
+            self.__file__.close()
+        else:
+            self.__writer__.close()
+        self.__writer__ = None
+
+def exportModels(path, objects, modelClass, format = None, chunkSize = 10000):
+    """
+    Writes model objects to path with a :class:`ModelExporter` and returns the number of rows written.
+    """
+    with ModelExporter(path, modelClass, format, chunkSize) as exporter:
+        exporter.write(objects)
+    return exporter.rowsWritten
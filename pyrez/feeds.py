@@ -0,0 +1,110 @@
+from threading import Lock
+from xml.etree.ElementTree import iterparse
+
+from pyrez.exceptions import NotFoundException
+from pyrez.http import HttpRequest
+from pyrez.models import HiRezServerFeedEntry
+
+ATOM_NAMESPACE = "{http://www.w3.org/2005/Atom}"
+
+class ServerFeedCache:
+    """
+    Process-wide copy of an Atom feed, refreshed with conditional requests (ETag / Last-Modified).
+
+    Use :meth:`getInstance` so every watcher and API instance of the process shares one copy per URL.
+    """
+    __instances__ = {}
+    __instancesLock__ = Lock()
+
+    def __init__(self, url, headers = None):
+        self.url = url
+        self.headers = dict(headers or HttpRequest.defaultHeaders)
+        self.entries = [] # Newest first
+        self.etag = None
+        self.lastModified = None
+        self.requests = 0
+        self.notModified = 0
+        self.__lock__ = Lock()
+
+    @classmethod
+    def getInstance(cls, url, headers = None):
+        with cls.__instancesLock__:
+            if url not in cls.__instances__:
+                cls.__instances__ [url] = cls(url, headers)
+            return cls.__instances__ [url]
+
+    def __parse__(self, stream):
+        # Entries come newest first, so parsing stops at the first entry already cached (and not updated since)
+        known, entries = { entry.entryId: entry.updated for entry in self.entries }, []
+        for event, element in iterparse(stream, events=("end",)):
+            if element.tag != ATOM_NAMESPACE + "entry":
+                continue
+            fields = { child.tag.replace(ATOM_NAMESPACE, ''): child.text for child in element }
+            link = element.find(ATOM_NAMESPACE + "link")
+            fields ["link"] = link.get("href") if link is not None else None
+            element.clear()
+            entry = HiRezServerFeedEntry(**fields)
+            if entry.entryId in known and known [entry.entryId] == entry.updated:
+                break
+            entries.append(entry)
+        return entries
+
+    def refresh(self):
+        """
+        Sends a conditional request and updates the cached entries if the feed changed.
+
+        Returns
+        -------
+        list of :class:`HiRezServerFeedEntry`
+            The cached entries, newest first.
+        """
+        with self.__lock__:
+            headers = dict(self.headers)
+            if self.etag:
+                headers ["If-None-Match"] = self.etag
+            if self.lastModified:
+                headers ["If-Modified-Since"] = self.lastModified
+            httpResponse = HttpRequest(headers).get(self.url, headers=headers, stream=True)
+            self.requests += 1
+            try:
+                if httpResponse.status_code == 304:
+                    self.notModified += 1
+                    return list(self.entries)
+                if httpResponse.status_code >= 400:
+                    raise NotFoundException("Wrong URL: {0}".format(self.url))
+                httpResponse.raw.decode_content = True
+                newEntries = self.__parse__(httpResponse.raw)
+                knownIds = { entry.entryId for entry in newEntries }
+                self.entries = newEntries + [ entry for entry in self.entries if entry.entryId not in knownIds ]
+                self.etag = httpResponse.headers.get("ETag")
+                self.lastModified = httpResponse.headers.get("Last-Modified")
+                return list(self.entries)
+            finally:
+                httpResponse.close()
+
+class ServerFeedWatcher:
+    """
+    Watches the Hi-Rez server status feed and returns only the incidents that are newer than the last one seen.
+
+    Parameters
+    ----------
+    url : [optional] : str
+        Atom feed. It defaults to :attr:`FEED_URL`.
+    headers : [optional] : dict
+    """
+    FEED_URL = "http://status.hirezstudios.com/history.atom"
+
+    def __init__(self, url = FEED_URL, headers = None):
+        self.cache = ServerFeedCache.getInstance(url, headers)
+        self.lastSeen = None
+
+    def poll(self):
+        """
+        Refreshes the shared feed copy and returns the entries newer than the last poll (oldest first).
+        The first poll returns every entry of the feed.
+        """
+        entries = self.cache.refresh()
+        newEntries = [ entry for entry in entries if self.lastSeen is None or entry.updated and entry.updated > self.lastSeen ]
+        if entries:
+            self.lastSeen = max([ entry.updated for entry in entries if entry.updated ] + ([self.lastSeen] if self.lastSeen else []), default=self.lastSeen)
+        return list(reversed(newEntries))
@@ -1,17 +1,66 @@
 from sys import version_info as pythonVersion
+from threading import Lock
+import zlib
 import requests
 
 class HttpRequest():
-    defaultHeaders = { "user-agent": "HttpRequestWrapper [Python/{0.major}.{0.minor}]".format(pythonVersion) }
+    defaultHeaders = { "user-agent": "HttpRequestWrapper [Python/{0.major}.{0.minor}]".format(pythonVersion), "accept-encoding": "gzip, deflate" }
+    chunkSize = 65536
     timeout = 500
+    poolSize = 32
+    __session__ = None
+    __sessionLock__ = Lock()
 
     def __init__(self, headers=defaultHeaders):
         self.headers=defaultHeaders if headers is None else headers
 
+    @classmethod
+    def getSession(cls):
+        """
+        Returns the :class:`requests.Session` shared by every HttpRequest of the process, so connections are kept alive and pooled per host.
+        """
+        if cls.__session__ is None:
+            with cls.__sessionLock__:
+                if cls.__session__ is None:
+                    session = requests.Session()
+                    adapter = requests.adapters.HTTPAdapter(pool_connections=cls.poolSize, pool_maxsize=cls.poolSize)
+                    session.mount("http://", adapter)
+                    session.mount("https://", adapter)
+                    cls.__session__ = session
+        return cls.__session__
+
     def get(self, url, params=None, data=None, headers=defaultHeaders, cookies=None, files=None, auth=None, timeout=None, allowRedirects=False, proxies=None, hooks=None, stream=False, verify=None, cert=None):
         return self.request('GET', url=url.replace(' ', '%20'), params=params, data=data, headers=headers, cookies=cookies, files=files, auth=auth, timeout=timeout, allowRedirects=allowRedirects, proxies=proxies, hooks=hooks, stream=stream, verify=verify, cert=cert)
+    @classmethod
+    def readContent(cls, httpResponse):
+        """
+        Reads a streamed response, decompressing gzip/deflate chunk by chunk.
+
+        Returns
+        -------
+        tuple
+            (decompressed body as bytes, number of bytes received on the wire)
+        """
+        encoding = str(httpResponse.headers.get("content-encoding", '')).lower()
+        decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS) if "gzip" in encoding else zlib.decompressobj() if "deflate" in encoding else None
+        chunks, wireBytes = [], 0
+        for chunk in httpResponse.raw.stream(cls.chunkSize, decode_content=False):
+            wireBytes += len(chunk)
+            if decompressor is None:
+                chunks.append(chunk)
+                continue
+            try:
+                chunks.append(decompressor.decompress(chunk))
+            except zlib.error:
+                if wireBytes != len(chunk) or "deflate" not in encoding:
+                    raise
+                decompressor = zlib.decompressobj(-zlib.MAX_WBITS) # Some servers send raw deflate data, without the zlib header
+                chunks.append(decompressor.decompress(chunk))
+        if decompressor is not None:
+            chunks.append(decompressor.flush())
+        return b''.join(chunks), wireBytes
     def request(self, method, url, params=None, data=None, headers=defaultHeaders, cookies=None, files=None, auth=None, timeout=None, allowRedirects=False, proxies=None, hooks=None, stream=False, verify=None, cert=None):
-        return requests.request(method=method, url=url, params=params, data=data, headers=headers, cookies=cookies, files=files, auth=auth, timeout=timeout, allow_redirects=allowRedirects, proxies=proxies, hooks=hooks, stream=stream, verify=verify, cert=cert)
+        return self.getSession().request(method=method, url=url, params=params, data=data, headers=headers, cookies=cookies, files=files, auth=auth, timeout=timeout, allow_redirects=allowRedirects, proxies=proxies, hooks=hooks, stream=stream, verify=verify, cert=cert)
     def post(self, url, params=None, data=None, headers=defaultHeaders, cookies=None, files=None, auth=None, timeout=None, allowRedirects=False, proxies=None, hooks=None, stream=False, verify=None, cert=None):
         return requests.post(url=url.replace(' ', '%20'), params=params, data=data, headers=headers, cookies=cookies, files=files, auth=auth, timeout=timeout, allow_redirects=allowRedirects, proxies=proxies, hooks=hooks, stream=stream, verify=verify, cert=cert)
     def put(self, url, params=None, data=None, headers=defaultHeaders, cookies=None, files=None, auth=None, timeout=None, allowRedirects=False, proxies=None, hooks=None, stream=False, verify=None, cert=None):
@@ -0,0 +1,125 @@
+from collections import namedtuple
+from datetime import datetime
+from threading import Lock
+
+from pyrez.executor import BulkExecutor
+
+RankChange = namedtuple("RankChange", ["board", "playerId", "playerName", "previousRank", "currentRank"])
+
+class LeaderboardSnapshot:
+    """
+    Compact copy of one leaderboard: a playerId → rank index plus the player names.
+
+    Parameters
+    ----------
+    board : tuple
+        (apiMethod, args) that produced the leaderboard.
+    rows : list
+        Rows returned by the API (dicts or leaderboard objects).
+    """
+    def __init__(self, board, rows):
+        self.board = board
+        self.timestamp = datetime.utcnow()
+        self.ranks = {}
+        self.names = {}
+        for position, row in enumerate(rows or []):
+            playerId, playerName, rank = self.parseRow(row)
+            if playerId:
+                self.ranks [playerId] = rank or position + 1
+                self.names [playerId] = playerName
+
+    @staticmethod
+    def parseRow(row):
+        if isinstance(row, dict):
+            playerId, playerName, rank = row.get("player_id") or row.get("playerId"), row.get("Name") or row.get("player_name"), row.get("Rank") or row.get("rank")
+        else:
+            playerId, playerName, rank = getattr(row, "playerId", None), getattr(row, "playerName", None), getattr(row, "rank", None)
+        try:
+            return int(playerId), playerName, int(rank) if rank else None
+        except (TypeError, ValueError):
+            return None, None, None
+
+    def __len__(self):
+        return len(self.ranks)
+
+    def getRank(self, playerId):
+        return self.ranks.get(int(playerId))
+
+    def diff(self, previous):
+        """
+        Returns the :class:`RankChange` of every player whose rank differs from the previous snapshot
+        (new players have previousRank None, players that dropped out have currentRank None). Runs in linear time.
+        """
+        previousRanks = previous.ranks if previous else {}
+        changes = [ RankChange(self.board, playerId, self.names [playerId], previousRanks.get(playerId), rank) for playerId, rank in self.ranks.items() if previousRanks.get(playerId) != rank ]
+        changes.extend(RankChange(self.board, playerId, previous.names [playerId], rank, None) for playerId, rank in previousRanks.items() if playerId not in self.ranks)
+        return changes
+
+class LeaderboardTracker:
+    """
+    Fetches many leaderboards concurrently and keeps the latest snapshot of each one, emitting only the rows whose rank changed.
+
+    The first snapshot of a board is a baseline: it is stored without emitting any change. A fetch that fails
+    or returns no rows is treated as a failure and the previous snapshot is kept, so a transient empty
+    response doesn't report every player as dropped out (and then as new on the next refresh).
+
+    Parameters
+    ----------
+    api : class:`SmiteAPI` or :class:`PaladinsAPI`
+    boards : [optional] : iterable of tuple
+        (apiMethod, args) of every leaderboard tracked, e.g. ("getLeagueLeaderboard", (451, 27, 5)). See :meth:`leagueBoards`, :meth:`godBoards` and :meth:`championBoards`.
+    onChange : [optional] : callable
+        Called with the list of :class:`RankChange` of every refresh that found changes.
+    maxWorkers : [optional] : int
+        Maximum number of requests in flight. It defaults to 8.
+    rateLimiter : [optional] : class:`RateLimiter`
+    """
+    def __init__(self, api, boards = (), onChange = None, maxWorkers = 8, rateLimiter = None):
+        self.api = api
+        self.boards = [ (method, tuple(args)) for method, args in boards ]
+        self.onChange = onChange
+        self.executor = BulkExecutor(maxWorkers, rateLimiter)
+        self.snapshots = {}
+        self.__lock__ = Lock()
+
+    @staticmethod
+    def leagueBoards(queueIds, tiers, seasons):
+        return [ ("getLeagueLeaderboard", (queueId, tier, season)) for queueId in queueIds for tier in tiers for season in seasons ]
+
+    @staticmethod
+    def godBoards(godIds, queueIds):
+        return [ ("getGodLeaderboard", (godId, queueId)) for godId in godIds for queueId in queueIds ]
+
+    @staticmethod
+    def championBoards(championIds, queueId = 428):
+        return [ ("getChampionLeaderboard", (championId, queueId)) for championId in championIds ]
+
+    def __fetch__(self, board):
+        return LeaderboardSnapshot(board, getattr(self.api, board [0])(*board [1]))
+
+    def getSnapshot(self, board):
+        with self.__lock__:
+            return self.snapshots.get((board [0], tuple(board [1])))
+
+    def refresh(self, boards = None):
+        """
+        Fetches the leaderboards concurrently and replaces their snapshots.
+
+        Returns
+        -------
+        list of :class:`RankChange`
+            Rows that changed since the previous snapshot of every board. Boards fetched for the first time,
+            and boards that failed or came back empty (their previous snapshot is kept), contribute nothing.
+        """
+        changes = []
+        for board, snapshot, error in self.executor.mapAsCompleted(self.__fetch__, [ (method, tuple(args)) for method, args in boards ] if boards else self.boards):
+            if error is not None or not snapshot:
+                continue
+            with self.__lock__:
+                previous = self.snapshots.get(board)
+                self.snapshots [board] = snapshot
+            if previous is not None:
+                changes.extend(snapshot.diff(previous))
+        if changes and self.onChange:
+            self.onChange(changes)
+        return changes
@@ -0,0 +1,149 @@
+from logging import getLogger
+from threading import Lock
+from time import monotonic
+
+from pyrez.executor import BulkExecutor
+
+logger = getLogger(__name__)
+
+class LiveMatchTracker:
+    """
+    Groups tracked players by their current match so every live match is fetched only once.
+
+    The roster (getMatchPlayerDetails) is kept for the life of the match; when the last tracked player
+    leaves it, the final result is fetched once with getMatchDetails.
+    It can be plugged straight into :class:`PresencePoller` as its onChange callback.
+    A match whose result can't be fetched, or whose onMatchEnd callback raises, stays pending and is
+    retried by a later :meth:`update` with exponential backoff, until maxAttempts is reached; errors are
+    logged and never propagate to the caller.
+
+    Parameters
+    ----------
+    api : class:`PaladinsAPI`
+    onMatchStart : [optional] : callable
+        Called with (matchId, roster) when the roster of a new match is fetched.
+    onMatchEnd : [optional] : callable
+        Called with (matchId, matchDetails) when a match ends.
+    maxWorkers : [optional] : int
+        Maximum number of rosters fetched at once by :meth:`update`. It defaults to 8.
+    retryDelay : [optional] : float
+        Seconds before the first retry of a match result, doubled after every failure. It defaults to 30.
+    maxRetryDelay : [optional] : float
+        Upper bound of the retry delay. It defaults to 1800.
+    maxAttempts : [optional] : int
+        Attempts made for a match result before the match is dropped. It defaults to 8.
+    """
+    def __init__(self, api, onMatchStart = None, onMatchEnd = None, maxWorkers = 8, retryDelay = 30, maxRetryDelay = 1800, maxAttempts = 8):
+        self.api = api
+        self.onMatchStart = onMatchStart
+        self.onMatchEnd = onMatchEnd
+        self.executor = BulkExecutor(maxWorkers)
+        self.retryDelay = retryDelay
+        self.maxRetryDelay = maxRetryDelay
+        self.maxAttempts = maxAttempts
+        self.__matches__ = {} # matchId → set of tracked playerIds
+        self.__players__ = {} # playerId → matchId
+        self.__rosters__ = {} # matchId → list of MatchPlayerDetail
+        self.__fetching__ = set() # matchIds whose roster or result is being fetched
+        self.__ended__ = {} # matchId → [failed attempts, monotonic time of the next attempt] of the results not delivered yet
+        self.__lock__ = Lock()
+
+    def __call__(self, change):
+        self.update({ change.playerId: change.current })
+
+    def getMatchId(self, playerId):
+        with self.__lock__:
+            return self.__players__.get(int(playerId))
+
+    def getRoster(self, matchId):
+        """
+        Returns the cached roster of a live match, without making a request.
+        """
+        with self.__lock__:
+            return self.__rosters__.get(int(matchId))
+
+    def getLiveMatches(self):
+        with self.__lock__:
+            return { matchId: set(players) for matchId, players in self.__matches__.items() }
+
+    def update(self, statuses):
+        """
+        Updates the tracked players with their latest :class:`PlayerStatus` and fetches what is needed.
+
+        Parameters
+        ----------
+        statuses : dict
+            playerId → :class:`PlayerStatus` (or None when the player is offline/unknown).
+        """
+        ended, started = [], set()
+        with self.__lock__:
+            for playerId, status in statuses.items():
+                playerId = int(playerId)
+                matchId = int(status.currentMatchId) if status is not None and status.currentMatchId else None
+                previous = self.__players__.get(playerId)
+                if previous == matchId:
+                    if matchId and matchId not in self.__rosters__:
+                        started.add(matchId)
+                    continue
+                if previous:
+                    players = self.__matches__.get(previous)
+                    if players is not None:
+                        players.discard(playerId)
+                        if not players:
+                            del self.__matches__ [previous]
+                            self.__rosters__.pop(previous, None)
+                            ended.append(previous)
+                    del self.__players__ [playerId]
+                if matchId:
+                    self.__players__ [playerId] = matchId
+                    self.__matches__.setdefault(matchId, set()).add(playerId)
+                    if matchId not in self.__rosters__:
+                        started.add(matchId)
+            started -= self.__fetching__
+            self.__fetching__ |= started
+            for matchId in ended:
+                self.__ended__.setdefault(matchId, [0, 0])
+            now = monotonic()
+            ending = { matchId for matchId, (attempts, due) in self.__ended__.items() if due <= now } - self.__fetching__
+            self.__fetching__ |= ending
+        for matchId, roster, error in self.executor.mapAsCompleted(self.api.getMatchPlayerDetails, started):
+            with self.__lock__:
+                self.__fetching__.discard(matchId)
+                if error is not None or not roster or matchId not in self.__matches__:
+                    continue # Retried on the next update for this match
+                self.__rosters__ [matchId] = roster
+            if self.onMatchStart:
+                try:
+                    self.onMatchStart(matchId, roster)
+                except Exception:
+                    logger.exception("onMatchStart failed for match %s", matchId)
+        for matchId, details, error in self.executor.mapAsCompleted(self.api.getMatchDetails, ending):
+            delivered = False
+            if error is not None or not details:
+                logger.warning("Couldn't fetch the result of match %s, retrying later: %r", matchId, error)
+            else:
+                try:
+                    if self.onMatchEnd:
+                        self.onMatchEnd(matchId, details)
+                    delivered = True
+                except Exception:
+                    logger.exception("onMatchEnd failed for match %s, retrying later", matchId)
+            with self.__lock__:
+                self.__fetching__.discard(matchId)
+                entry = self.__ended__.get(matchId)
+                if delivered or entry is None:
+                    self.__ended__.pop(matchId, None)
+                    continue
+                entry [0] += 1
+                if entry [0] >= self.maxAttempts:
+                    del self.__ended__ [matchId]
+                    logger.error("Giving up on the result of match %s after %s attempts", matchId, entry [0])
+                else:
+                    entry [1] = monotonic() + min(self.maxRetryDelay, self.retryDelay * 2 ** (entry [0] - 1))
+
+    def getPendingMatches(self):
+        """
+        Returns the ids of the ended matches whose result is still to be delivered.
+        """
+        with self.__lock__:
+            return set(self.__ended__)
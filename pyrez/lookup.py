@@ -0,0 +1,79 @@
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+
+from pyrez.enumerations import Platform
+from pyrez.exceptions import InvalidArgumentException, NotFoundException
+
+class CrossPlatformLookup:
+    """
+    Sends one query to every platform of a game at the same time.
+
+    One API object is kept per platform, so sessions and pooled connections are reused between lookups.
+
+    Parameters
+    ----------
+    apiClass : class
+        :class:`SmiteAPI` or :class:`PaladinsAPI`.
+    devId : int
+        Used for authentication. This is the developer ID that you receive from Hi-Rez Studios.
+    authKey : str
+        Used for authentication. This is the authentication key that you receive from Hi-Rez Studios.
+    platforms : [optional] : list of class:`Platform`
+        Platforms queried. It defaults to PC, PS4 and Xbox.
+    """
+    def __init__(self, apiClass, devId, authKey, platforms = (Platform.PC, Platform.PS4, Platform.XBOX)):
+        if not platforms:
+            raise InvalidArgumentException("You need to pass at least one platform!")
+        self.apis = { platform: apiClass(devId, authKey, platform) for platform in platforms }
+
+    def __call__(self, apiMethod, *args):
+        try:
+            return getattr(self.apis [apiMethod [0]], apiMethod [1])(*args)
+        except NotFoundException:
+            return None
+
+    def lookup(self, apiMethod, *args, firstOnly = True, errors = None):
+        """
+        Calls apiMethod with args on every platform concurrently. A platform whose request fails counts as a miss.
+
+        Parameters
+        ----------
+        apiMethod : str
+            Name of the API method, e.g. "getPlayer".
+        firstOnly : [optional] : bool
+            Return as soon as one platform has an answer. The requests already sent to the other platforms
+            can't be aborted: they finish in the background and their results are ignored. It defaults to True.
+        errors : [optional] : dict
+            Filled with platform → exception for every platform whose request failed (before the return).
+
+        Returns
+        -------
+        tuple or dict
+            (platform, result) of the first hit (or (None, None)) when firstOnly, else a dict of platform → result with every hit.
+        """
+        hits = {}
+        executor = ThreadPoolExecutor(max_workers=len(self.apis))
+        try:
+            futures = { executor.submit(self, (platform, apiMethod), *args): platform for platform in self.apis }
+            pending = set(futures)
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    try:
+                        result = future.result()
+                    except Exception as x:
+                        if errors is not None:
+                            errors [futures [future]] = x
+                        continue
+                    if result:
+                        if firstOnly:
+                            return futures [future], result
+                        hits [futures [future]] = result
+        finally:
+            executor.shutdown(wait=False)
+        return (None, None) if firstOnly else hits
+
+    def getPlayer(self, player, firstOnly = True, errors = None):
+        """
+        Looks for a player on every platform. See :meth:`lookup`.
+        """
+        return self.lookup("getPlayer", player, firstOnly=firstOnly, errors=errors)
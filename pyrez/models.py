@@ -1,5 +1,6 @@
 from pyrez.enumerations import *
-from datetime import datetime
+from pyrez.schema import schemaModel # The fields of the @schemaModel classes are declared in pyrez.schema.SCHEMAS
+from pyrez.utils import parseDatetime
 
 class BaseAPIResponse:
     def __init__(self, **kwargs):
@@ -12,15 +13,12 @@ class APIResponse(BaseAPIResponse):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.retMsg = str(kwargs.get("ret_msg", None))
+@schemaModel
 class AbstractPlayer(APIResponse):
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        self.playerId = int(kwargs.get("Id", 0)) or int(kwargs.get("id", 0))
-        self.playerName = str(kwargs.get("Name", None)) or str(kwargs.get("name", None))
+    pass
+@schemaModel
 class Player(AbstractPlayer):
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        self.steamId = int(kwargs.get("steam_id", 0))
+    pass
 class PlayerAcheviements(AbstractPlayer):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
@@ -50,12 +48,8 @@ class PlayerAcheviements(AbstractPlayer):
 class BasePlayer(AbstractPlayer):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
-        self.createdDatetime = str(kwargs.get("Created_Datetime", None)) or str(kwargs.get("created_datetime", None))
-        if self.createdDatetime:
-            self.createdDatetime = datetime.strptime(self.createdDatetime, "%m/%d/%Y %H:%M:%S %p")
-        self.lastLoginDatetime = str(kwargs.get("Last_Login_Datetime", None)) or str(kwargs.get("last_login_datetime", None))
-        if self.lastLoginDatetime:
-            self.lastLoginDatetime = datetime.strptime(self.lastLoginDatetime, "%m/%d/%Y %H:%M:%S %p")
+        self.createdDatetime = parseDatetime(kwargs.get("Created_Datetime", None) or kwargs.get("created_datetime", None))
+        self.lastLoginDatetime = parseDatetime(kwargs.get("Last_Login_Datetime", None) or kwargs.get("last_login_datetime", None))
         self.accountLevel = int(kwargs.get("Level", 0)) or int(kwargs.get("level", 0))
         self.playerRegion = str(kwargs.get("Region", None)) or str(kwargs.get("region", None))
 class PlayerRealmRoyale(BasePlayer):
@@ -106,63 +100,22 @@ class ChampionAbility(BaseAbility):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.description = str(kwargs.get("Description", None))
+@schemaModel
 class BaseCharacter(APIResponse):
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        self.abilitys = []
-        self.cons = str(kwargs.get("Cons", None))
-        self.health = int(kwargs.get("Health", 0))
-        self.lore = str(kwargs.get("Lore", None))
-        self.onFreeRotation = str(kwargs.get("OnFreeRotation", None)).lower() == 'y'
-        self.pantheon = str(kwargs.get("Pantheon", None))
-        self.pros = str(kwargs.get("Pros", None))
-        self.roles = str(kwargs.get("Roles", None))
-        self.speed = int(kwargs.get("Speed", 0))
-        self.title = str(kwargs.get("Title", None))
-        self.type = str(kwargs.get("Type", None))
+    pass
+@schemaModel
 class Champion(BaseCharacter):
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        try:
-            self.championId = Champions(int(kwargs.get("id", 0)))
-            self.championName = str(self.championId)
-        except:
-            self.championId = int(kwargs.get("id", 0))
-            self.championName = str(kwargs.get("Name", None))
-        for i in range(0, 5):
-            obj = ChampionAbility(**kwargs.get("Ability_" + str(i + 1), None))
-            self.abilitys.append(obj)
-        self.championCardURL = str(kwargs.get("ChampionCard_URL", None))
-        self.championIconURL = str(kwargs.get("ChampionIcon_URL", None))
-        self.latestChampion = str(kwargs.get("latestChampion", None)).lower() == 'y'
     def __str__(self):
         st = "Name: {0} ID: {1} Health: {2} Roles: {3} Title: {4}".format(self.championName, self.championId.getId() if isinstance(self.championId, Champions) else self.championId, self.health, self.roles, self.title)
         for i in range(0, len(self.abilitys)):
             st +=(" Ability {0}: {1}").format(i + 1, self.abilitys [i])
         st += "CardUrl: {0} IconUrl: {1} ".format(self.championCardURL, self.championIconURL)
         return st;
+@schemaModel
 class God(BaseCharacter):
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        try:
-            self.godId = Gods(int(kwargs.get("id", 0)))
-            self.godName = str(self.godId)
-        except:
-            self.godId = int(kwargs.get("id", 0))
-            self.godName = str(kwargs.get("Name", None))
-        self.latestGod = str(kwargs.get("latestGod", None)).lower() == 'y'
+    pass
+@schemaModel
 class BaseCharacterRank(APIResponse):
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        self.assists = int(kwargs.get("Assists", 0))
-        self.deaths = int(kwargs.get("Deaths", 0))
-        self.kills = int(kwargs.get("Kills", None))
-        self.losses = int(kwargs.get("Losses", 0))
-        self.minionKills = int(kwargs.get("MinionKills", 0))
-        self.godLevel = int(kwargs.get("Rank", 0))
-        self.wins = int(kwargs.get("Wins", 0))
-        self.worshippers = int(kwargs.get("Worshippers", 0))
-        self.playerId = int(kwargs.get("player_id", 0))
     def getWinratio(self, decimals = 2):
         aux = self.wins + self.losses if self.wins + self.losses > 1 else 1
         winratio = self.wins / aux * 100.0
@@ -171,15 +124,9 @@ class BaseCharacterRank(APIResponse):
         deaths = self.deaths if self.deaths > 1 else 1
         kda = ((self.assists / 2) + self.kills) / deaths
         return int(kda) if kda % 2 == 0 else round(kda, decimals)# + "%";
+@schemaModel
 class GodRank(BaseCharacterRank):
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        try:
-            self.godId = Gods(int(kwargs.get("god_id"))) if kwargs.get("god_id") else Champions(int(kwargs.get("champion_id"))) if kwargs.get("champion_id") else -1
-            self.godName = str(self.godId)
-        except:
-            self.godId = int(kwargs.get("god_id")) if kwargs.get("god_id") else int(kwargs.get("champion_id")) if kwargs.get("champion_id") else -1
-            self.godName = str(kwargs.get("champion", None)) if kwargs.get("champion") else str(kwargs.get("god", None))
+    pass
 class BaseItem(APIResponse):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
@@ -230,39 +177,16 @@ class BaseRanked(APIResponse):
     def getWinratio(self):
         winratio = self.wins /((self.wins + self.losses) if self.wins + self.losses > 1 else 1) * 100.0
         return int(winratio) if winratio % 2 == 0 else round(winratio, 2)
+@schemaModel
 class BaseSkin(APIResponse):
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        self.skinId1 = int(kwargs.get("skin_id1", 0))
-        self.skinId2 = int(kwargs.get("skin_id2", 0))
-        self.skinName = str(kwargs.get("skin_name", None))
-        self.skinNameEnglish = str(kwargs.get("skin_name_english", None))
     def __eq__(self, other):
         return self.skinID1 == other.skinID1 and self.skinID2 == other.skinID2
+@schemaModel
 class ChampionSkin(BaseSkin):
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        try:
-            self.championId = Champions(int(kwargs.get("champion_id", 0)))
-            self.championName = str(self.championId)
-        except:
-            self.championId = int(kwargs.get("champion_id", 0))
-            self.championName = str(kwargs.get("champion_name", None))
-        self.rarity = str(kwargs.get("rarity", None))
+    pass
+@schemaModel
 class GodSkin(BaseSkin):
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        try:
-            self.godId = Champions(int(kwargs.get("god_name", 0)))
-            self.godName = str(self.championId)
-        except:
-            self.godId = int(kwargs.get("god_id", 0))
-            self.godName = str(kwargs.get("god_name", None))
-        self.godIconURL = str(kwargs.get("godIcon_URL", None))
-        self.godSkinURL = str(kwargs.get("godSkin_URL", None))
-        self.obtainability = str(kwargs.get("obtainability", None))
-        self.priceFavor = int(kwargs.get("price_favor", 0))
-        self.priceGems = int(kwargs.get("price_gems", 0))
+    pass
 class DataUsed(APIResponse):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
@@ -281,27 +205,29 @@ class DataUsed(APIResponse):
         return self.requestLimitDaily - self.totalRequestsToday if self.requestLimitDaily - self.totalRequestsToday > 0 else 0
     def concurrentSessionsLeft(self):
         return self.concurrentSessions - self.activeSessions if self.concurrentSessions - self.activeSessions > 0 else 0
+@schemaModel
 class Friend(APIResponse):
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        self.accountId = int(kwargs.get("account_id", 0))
-        self.avatarURL = str(kwargs.get("avatar_url", None))
-        self.playerId = int(kwargs.get("player_id", 0))
-        self.playerName = str(kwargs.get("name", None))
     def __str__(self):
         return "<Player {0} ({1})>".format(self.playerName, self.playerId)
     #def __hash__(self):
         #return hash(self.playerId)
     def __eq__(self, other):
         return self.playerId == other.playerId
+@schemaModel
 class HiRezServerStatus(APIResponse):
+    def __str__(self):
+        return "entry_datetime: {0} status: {1} version: {2}".format(self.entryDateTime, "UP" if self.status else "DOWN", self.version)
+class HiRezServerFeedEntry(APIResponse):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
-        self.entryDateTime = str(kwargs.get("entry_datetime", None))
-        self.status = str(kwargs.get("status", None).upper()) == "UP"
-        self.version = str(kwargs.get("version", None))
+        self.entryId = str(kwargs.get("id", None))
+        self.title = str(kwargs.get("title", None))
+        self.link = str(kwargs.get("link", None))
+        self.content = str(kwargs.get("content", None))
+        self.published = parseDatetime(kwargs.get("published", None))
+        self.updated = parseDatetime(kwargs.get("updated", None))
     def __str__(self):
-        return "entry_datetime: {0} status: {1} version: {2}".format(self.entryDateTime, "UP" if self.status else "DOWN", self.version)
+        return "title: {0} updated: {1} link: {2}".format(self.title, self.updated, self.link)
 class InGameItem:
     def __init__(self, itemID, itemName, itemLevel):
         self.itemId = itemID
@@ -349,86 +275,12 @@ class LoadoutItem:
         self.points = int(kwargs.get("Points", 0))
     def __str__(self):
         return "{0}({1})".format(self.itemName, self.points)
+@schemaModel
 class MatchHistory(APIResponse):
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        self.items = []
-        self.loadout = []
-        for i in range(1, 5):
-            obj = InGameItem(kwargs.get("ActiveId{0}".format(i)), kwargs.get("Active_{0}".format(i)), kwargs.get("ActiveLevel{0}".format(i)))
-            self.items.append(obj)
-        for i in range(1, 7):
-            obj = InGameItem(kwargs.get("ItemId{0}".format(i)), kwargs.get("Item_{0}".format(i)), kwargs.get("ItemLevel{0}".format(i)))
-            self.loadout.append(obj)
-        self.assists = kwargs.get("Assists")
-        try:
-            self.championId = Champions(int(kwargs.get("ChampionId", 0)))
-            self.championName = str(self.championId)
-        except:
-            self.championId = int(kwargs.get("ChampionId", 0))
-            self.championName = str(kwargs.get("Champion", None))
-        self.creeps = kwargs.get("Creeps")
-        self.damage = kwargs.get("Damage")
-        self.damageBot = kwargs.get("Damage_Bot")
-        self.damageDoneInHand = kwargs.get("Damage_Done_In_Hand")
-        self.damageMitigated = kwargs.get("Damage_Mitigated")
-        self.damageStructure = kwargs.get("Damage_Structure")
-        self.damageTaken = kwargs.get("Damage_Taken")
-        self.damageTakenMagical = kwargs.get("Damage_Taken_Magical")
-        self.damageTakenPhysical = kwargs.get("Damage_Taken_Physical")
-        self.deaths = kwargs.get("Deaths")
-        self.distanceTraveled = kwargs.get("Distance_Traveled")
-        self.credits = kwargs.get("Gold")
-        self.healing = kwargs.get("Healing")
-        self.healingBot = kwargs.get("Healing_Bot")
-        self.healingPlayerSelf = kwargs.get("Healing_Player_Self")
-        self.killingSpree = kwargs.get("Killing_Spree")
-        self.kills = kwargs.get("Kills")
-        self.level = kwargs.get("Level")
-        self.mapGame = kwargs.get("Map_Game")
-        self.matchMinutes = kwargs.get("Minutes")
-        self.matchRegion = kwargs.get("Region")
-        self.matchQueueId = kwargs.get("Match_Queue_Id")
-        self.matchTime = kwargs.get("Match_Time")
-        self.matchTimeSecond = kwargs.get("Time_In_Match_Seconds")
-        self.matchId = kwargs.get("Match")
-        self.multiKillMax = kwargs.get("Multi_kill_Max")
-        self.objectiveAssists = kwargs.get("Objective_Assists")
-        self.queue = kwargs.get("Queue")
-        self.skin = kwargs.get("Skin")
-        self.skinId = kwargs.get("SkinId")
-        self.surrendered = kwargs.get("Surrendered")
-        self.taskForce = kwargs.get("TaskForce")
-        self.team1Score = kwargs.get("Team1Score")
-        self.team2Score = kwargs.get("Team2Score")
-        self.wardsPlaced = kwargs.get("Wards_Placed")
-        self.winStatus = kwargs.get("Win_Status")
-        self.winningTaskForce = kwargs.get("Winning_TaskForce")
-        self.playerName = kwargs.get("playerName")
+    pass
+@schemaModel
 class MatchPlayerDetail(APIResponse):
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        self.accountLevel = int(kwargs.get("Account_Level", 0))
-        try:
-            self.championId = Champions(int(kwargs.get("ChampionId", 0)))
-            self.championName = str(self.championId)
-        except:
-            self.championId = int(kwargs.get("ChampionId", 0))
-            self.championName = str(kwargs.get("ChampionName", None))
-        self.masteryLevel = int(kwargs.get("Mastery_Level", 0))
-        self.matchId = int(kwargs.get("Match", 0))
-        try:
-            self.queue = PaladinsQueue(int(kwargs.get("Queue", 0)))
-        except:
-            self.queue = int(kwargs.get("Queue", 0))
-        self.skinId = int(kwargs.get("SkinId", 0))
-        self.playerCreated = datetime.strptime(kwargs.get("playerCreated", None), "%m/%d/%Y %H:%M:%S %p")
-        self.playerId = int(kwargs.get("playerId", 0))
-        self.playerName = str(kwargs.get("playerName", None))
-        self.taskForce = int(kwargs.get("taskForce", 0))
-        self.tier = int(kwargs.get("Tier", 0))
-        self.tierLosses = int(kwargs.get("tierLosses", 0))
-        self.tierWins = int(kwargs.get("tierWins", 0))
+    pass
 class Menuitem:
     def __init__(self, **kwargs):
         self.description = int(kwargs.get("Description", 0))
@@ -451,27 +303,12 @@ class Ping:
             self.gamePatch = textPlain [5].replace(']', '')
             self.ping = textPlain [8] == "successful."
             #self.date = "{0} {1} {2}".format(textPlain [10].replace("Date:", ""), textPlain [11], textPlain [12])
-            self.date = datetime.strptime("{0} {1} {2}".format(textPlain [10].replace("Date:", ""), textPlain [11], textPlain [12]), "%m/%d/%Y %H:%M:%S %p")
+            self.date = parseDatetime("{0} {1} {2}".format(textPlain [10].replace("Date:", ""), textPlain [11], textPlain [12]))
     def __str__(self):
         return "APIName: {0} APIVersion: {1} GameVersion: {2} Ping: {3} Date: {4}".format(self.apiName, self.apiVersion, self.gamePatch, self.ping, self.date)
+@schemaModel
 class PlayerLoadout(APIResponse):
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        try:
-            self.championId = Champions(int(kwargs.get("ChampionId", 0)))
-            self.championName = str(self.championId)
-        except:
-            self.championId = int(kwargs.get("ChampionId", 0))
-            self.championName = str(kwargs.get("ChampionName", None))
-        self.deckId = int(kwargs.get("DeckId", 0))
-        self.deckName = str(kwargs.get("DeckName", None))
-        self.playerId = int(kwargs.get("playerId", 0))
-        self.playerName = str(kwargs.get("playerName", None))
-        cards = kwargs.get("LoadoutItems")
-        self.cards = []
-        for i in cards:
-            obj = LoadoutItem(**i)
-            self.cards.append(obj)
+    pass
 class PlayerStatus(APIResponse):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
@@ -484,7 +321,7 @@ class Session(APIResponse):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.sessionId = str(kwargs.get("session_id", None))
-        self.timeStamp = datetime.strptime(str(kwargs.get("timestamp", None)), "%m/%d/%Y %H:%M:%S %p")
+        self.timeStamp = parseDatetime(kwargs.get("timestamp", None))
     def isApproved(self):
         return str(self.json).lower().find("approved") != -1
 class TestSession:
@@ -495,7 +332,7 @@ class TestSession:
             self.successfull = self.textPlain.lower().find("this was a successful test with the following parameters added:") != -1
             self.devId = textPlain [11]
             #self.date = "{0} {1} {2}".format(textPlain [13].replace("time:", ""), textPlain [14], textPlain [15])
-            self.date = datetime.strptime("{0} {1} {2}".format(textPlain [13].replace("time:", ""), textPlain [14], textPlain [15]), "%m/%d/%Y %H:%M:%S %p")
+            self.date = parseDatetime("{0} {1} {2}".format(textPlain [13].replace("time:", ""), textPlain [14], textPlain [15]))
             self.signature = textPlain [17]
             self.session = textPlain [19]
     def __str__(self):
@@ -517,94 +354,24 @@ class EsportProLeagueDetail(APIResponse):
         self.region = str(kwargs.get("region", None))
         self.tournamentName = str(kwargs.get("tournament_name", None))
         self.winningTeamClanId = int(kwargs.get("winning_team_clan_id", 0))
+@schemaModel
 class GodLeaderboard(APIResponse):
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        try:
-            self.godId = Gods(int(kwargs.get("god_id", 0)))
-        except:
-            self.godId = int(kwargs.get("god_id", 0))
-        self.losses = int(kwargs.get("losses", 0))
-        self.playerId = int(kwargs.get("player_id", 0))
-        self.playerName = str(kwargs.get("player_name", None))
-        self.playerRanking = str(kwargs.get("player_ranking", None))
-        self.rank = int(kwargs.get("rank", 0))
-        self.wins = int(kwargs.get("wins", 0))
+    pass
+@schemaModel
 class MOTD(APIResponse):
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        self.description = str(kwargs.get("description", None))
-        self.gameMode = str(kwargs.get("gameMode", None))
-        self.maxPlayers = str(kwargs.get("maxPlayers", None))
-        self.name = str(kwargs.get("name", None))
-        self.startDateTime = str(kwargs.get("startDateTime", None))
-        self.team1GodsCSV = str(kwargs.get("team1GodsCSV", None))
-        self.team2GodsCSV = str(kwargs.get("team2GodsCSV", None))
-        self.title = str(kwargs.get("title", None))
+    pass
+@schemaModel
 class TeamPlayer(APIResponse):
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        self.accountLevel = int(kwargs.get("AccountLevel", 0))
-        self.joinedDatetime = str(kwargs.get("JoinedDatetime", None))
-        self.lastLoginDatetime = str(kwargs.get("LastLoginDatetime", None))
-        self.name = str(kwargs.get("Name", None))
+    pass
+@schemaModel
 class TeamDetail(APIResponse):
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        self.founder = str(kwargs.get("Founder", None))
-        self.founderId = int(kwargs.get("FounderId", 0))
-        self.losses = int(kwargs.get("Losses", 0))
-        self.name = str(kwargs.get("Name", None))
-        self.players = int(kwargs.get("Players", 0))
-        self.rating = int(kwargs.get("Rating", 0))
-        self.tag = str(kwargs.get("Tag", None))
-        self.teamId = int(kwargs.get("TeamId", 0))
-        self.wins = int(kwargs.get("Wins", 0))
+    pass
+@schemaModel
 class QueueStats(APIResponse):
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        self.assists = int(kwargs.get("Assists", 0))
-        try:
-            self.godId = Gods(int(kwargs.get("GodId", 0))) or Champions(int(kwargs.get("ChampionId", 0)))
-            self.godName = str(self.godId)
-        except:
-            self.godId = int(kwargs.get("ChampionId", 0)) or int(kwargs.get("GodId", 0))
-            self.godName = str(kwargs.get("Champion", None)) or str(kwargs.get("God", None))
-        self.deaths = int(kwargs.get("Deaths", 0))
-        self.gold = int(kwargs.get("Gold", 0))
-        self.kills = int(kwargs.get("Kills", 0))
-        self.lastPlayed = str(kwargs.get("LastPlayed", None))
-        if self.lastPlayed:
-            self.lastPlayed = datetime.strptime(self.lastPlayed, "%m/%d/%Y %H:%M:%S %p")
-        self.losses = int(kwargs.get("Losses", 0))
-        self.matches = int(kwargs.get("Matches", 0))
-        self.minutes = int(kwargs.get("Minutes", 0))
-        self.queue = str(kwargs.get("Queue", None))
-        self.wins = int(kwargs.get("Wins", 0))
-        self.playerId = int(kwargs.get("player_id", 0))
+    pass
 
+@schemaModel
 class ChampionCard(APIResponse):
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        self.activeFlagActivationSchedule = str(kwargs.get("active_flag_activation_schedule", None)).lower() == 'y'
-        self.activeFlagLti = str(kwargs.get("active_flag_lti", None)).lower() == 'y'
-        self.cardDescription = str(kwargs.get("card_description", None))
-        self.cardId1 = int(kwargs.get("card_id1", 0))
-        self.cardId2 = int(kwargs.get("card_id2", 0))
-        self.cardName = str(kwargs.get("card_name", None))
-        self.cardNameEnglish = str(kwargs.get("card_name_english", None))
-        self.championCardURL =  str(kwargs.get("championCard_URL", None))
-        self.championIconURL = str(kwargs.get("championIcon_URL", None))
-        try:
-            self.championId = Champions(int(kwargs.get("champion_id", 0)))
-            self.championName = str(self.championId)
-        except:
-            self.championId = int(kwargs.get("champion_id", 0))
-            self.championName = str(kwargs.get("champion_name", None))
-        self.exclusive = str(kwargs.get("exclusive", None)).lower() == 'y'
-        self.rank = int(kwargs.get("rank", 0))
-        self.rarity = str(kwargs.get("rarity", None))
-        self.recharge_seconds = int(kwargs.get("recharge_seconds", 0))
     def getIconURL(self):
         return "https://web2.hirez.com/paladins/champion-icons/{0}.jpg".format(self.championName)
     def getCardURL(self):
@@ -0,0 +1,74 @@
+from concurrent.futures import ProcessPoolExecutor
+from os import cpu_count
+from threading import Lock
+
+from pyrez.schema import parseModels
+
+def __parseChunk__(modelClass, rows, records):
+    models = parseModels(modelClass, rows)
+    if not records:
+        return models
+    return [ { key: value for key, value in vars(model).items() if key != "json" } for model in models ]
+
+class ModelParser:
+    """
+    Builds model objects from large decoded responses on a pool of processes, so the work isn't serialized by the GIL.
+
+    Small payloads are parsed in-process, where pickling would cost more than the parse.
+
+    Parameters
+    ----------
+    processes : [optional] : int
+        Number of worker processes. It defaults to the number of CPUs.
+    chunkSize : [optional] : int
+        Number of rows sent to a worker at a time. It defaults to 500.
+    minParallelRows : [optional] : int
+        Responses with fewer rows than this are parsed in-process. It defaults to 2000.
+    """
+    def __init__(self, processes = None, chunkSize = 500, minParallelRows = 2000):
+        self.processes = processes or cpu_count() or 1
+        self.chunkSize = max(1, int(chunkSize))
+        self.minParallelRows = minParallelRows
+        self.__pool__ = None
+        self.__lock__ = Lock()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
+        with self.__lock__:
+            pool, self.__pool__ = self.__pool__, None
+        if pool is not None:
+            pool.shutdown()
+
+    def parse(self, modelClass, rows, records = False):
+        """
+        Builds one modelClass object per row, keeping the order of the rows.
+
+        Parameters
+        ----------
+        modelClass : class
+            Model built from every row, e.g. :class:`MatchHistory`.
+        rows : list of dict
+        records : [optional] : bool
+            Return the attributes of every model as a dict (without the raw json copy) instead of the model, which is cheaper to send back from the workers.
+
+        Returns
+        -------
+        list
+        """
+        rows = [ row for row in rows or [] if isinstance(row, dict) ]
+        if len(rows) < self.minParallelRows or self.processes < 2:
+            return __parseChunk__(modelClass, rows, records)
+        with self.__lock__: # parse can be called from several threads: only one of them creates the pool
+            if self.__pool__ is None:
+                self.__pool__ = ProcessPoolExecutor(max_workers=self.processes)
+            pool = self.__pool__
+        chunks = [ rows [i:i + self.chunkSize] for i in range(0, len(rows), self.chunkSize) ]
+        result = []
+        for models in pool.map(__parseChunk__, [modelClass] * len(chunks), chunks, [records] * len(chunks)):
+            result.extend(models)
+        return result
@@ -0,0 +1,176 @@
+from collections import namedtuple
+from heapq import heappush, heappop
+from logging import getLogger
+from threading import Event, Lock, Thread
+from time import monotonic
+
+from pyrez.enumerations import Status
+from pyrez.executor import BulkExecutor
+from pyrez.ratelimit import RateLimiter
+
+logger = getLogger(__name__)
+
+PresenceChange = namedtuple("PresenceChange", ["playerId", "previous", "current"])
+
+class PresencePoller:
+    """
+    Polls getPlayerStatus for many players, scheduling every player by its last known state.
+
+    Players in god selection or in game are polled often, players in lobby at a medium pace and
+    offline players exponentially less often. A change event is emitted only when the status or
+    the current match changes.
+
+    Parameters
+    ----------
+    api : class:`HiRezAPI`
+    playerIds : [optional] : iterable of int
+    onChange : [optional] : callable
+        Called with a :class:`PresenceChange` for every change. Its exceptions are logged and never stop the poller.
+    requestsPerMinute : [optional] : int
+        Global request budget of the poller. It defaults to 300.
+    maxWorkers : [optional] : int
+        Maximum number of requests in flight. It defaults to 8.
+    fastInterval : [optional] : float
+        Seconds between polls while in god selection or in game. It defaults to 30.
+    idleInterval : [optional] : float
+        Seconds between polls while online or in lobby. It defaults to 120.
+    offlineInterval : [optional] : float
+        First interval used once a player is offline, doubled on every poll that finds it still offline. It defaults to 300.
+    maxInterval : [optional] : float
+        Upper bound of the offline backoff. It defaults to 3600.
+    """
+    FAST_STATES = (Status.God_Selection, Status.In_Game)
+    OFFLINE_STATES = (Status.Offline, Status.Not_Found)
+
+    def __init__(self, api, playerIds = (), onChange = None, requestsPerMinute = 300, maxWorkers = 8, fastInterval = 30, idleInterval = 120, offlineInterval = 300, maxInterval = 3600):
+        self.api = api
+        self.onChange = onChange
+        self.budget = RateLimiter(requestsPerMinute, 60)
+        self.executor = BulkExecutor(maxWorkers)
+        self.fastInterval = fastInterval
+        self.idleInterval = idleInterval
+        self.offlineInterval = offlineInterval
+        self.maxInterval = maxInterval
+        self.__players__ = {} # playerId → [PlayerStatus, offline streak, due time]; heap entries with another due time are stale
+        self.__schedule__ = [] # heap of (due time, playerId)
+        self.__lock__ = Lock()
+        self.__stopEvent__ = Event()
+        self.__thread__ = None
+        for playerId in playerIds:
+            self.add(playerId)
+
+    @staticmethod
+    def getState(playerStatus):
+        """
+        Returns the :class:`Status` of a :class:`PlayerStatus` (Not_Found when it is None or unknown).
+        """
+        try:
+            return Status(int(playerStatus.playerStatus))
+        except (AttributeError, TypeError, ValueError):
+            return Status.Not_Found
+
+    def add(self, playerId, delay = 0):
+        with self.__lock__:
+            if int(playerId) not in self.__players__:
+                due = monotonic() + delay
+                self.__players__ [int(playerId)] = [None, 0, due]
+                heappush(self.__schedule__, (due, int(playerId)))
+
+    def remove(self, playerId):
+        with self.__lock__:
+            self.__players__.pop(int(playerId), None) # Its schedule entry is dropped lazily, see __takeDue__
+
+    def getStatus(self, playerId):
+        """
+        Returns the last known :class:`PlayerStatus` of a player, without making a request.
+        """
+        with self.__lock__:
+            entry = self.__players__.get(int(playerId))
+            return entry [0] if entry else None
+
+    def nextInterval(self, state, offlineStreak):
+        if state in self.FAST_STATES:
+            return self.fastInterval
+        if state in self.OFFLINE_STATES:
+            return min(self.maxInterval, self.offlineInterval * 2 ** max(0, offlineStreak - 1))
+        return self.idleInterval
+
+    @staticmethod
+    def hasChanged(previous, current):
+        if previous is None or current is None:
+            return previous is not current
+        return PresencePoller.getState(previous) != PresencePoller.getState(current) or previous.currentMatchId != current.currentMatchId
+
+    def __takeDue__(self):
+        due, now = [], monotonic()
+        with self.__lock__:
+            while self.__schedule__ and self.__schedule__ [0][0] <= now:
+                dueTime, playerId = self.__schedule__ [0]
+                entry = self.__players__.get(playerId)
+                if entry is None or entry [2] != dueTime: # Removed, or re-added/rescheduled since
+                    heappop(self.__schedule__)
+                    continue
+                if not self.budget.tryAcquire():
+                    break
+                heappop(self.__schedule__)
+                due.append(playerId)
+        return due
+
+    def pollDue(self):
+        """
+        Polls every player whose turn has come, as far as the request budget allows.
+
+        Returns
+        -------
+        list of :class:`PresenceChange`
+        """
+        changes = []
+        for playerId, current, error in self.executor.mapAsCompleted(self.api.getPlayerStatus, self.__takeDue__()):
+            with self.__lock__:
+                entry = self.__players__.get(playerId)
+                if entry is None:
+                    continue
+                if error is not None:
+                    entry [2] = monotonic() + self.idleInterval
+                    heappush(self.__schedule__, (entry [2], playerId))
+                    continue
+                previous, state = entry [0], self.getState(current)
+                entry [1] = entry [1] + 1 if state in self.OFFLINE_STATES else 0
+                entry [0] = current
+                entry [2] = monotonic() + self.nextInterval(state, entry [1])
+                heappush(self.__schedule__, (entry [2], playerId))
+            if self.hasChanged(previous, current):
+                changes.append(PresenceChange(playerId, previous, current))
+        if self.onChange:
+            for change in changes:
+                try:
+                    self.onChange(change)
+                except Exception:
+                    logger.exception("onChange failed for player %s", change.playerId)
+        return changes
+
+    def run(self):
+        """
+        Polls until :meth:`stop` is called.
+        """
+        self.__stopEvent__.clear()
+        while not self.__stopEvent__.is_set():
+            self.pollDue()
+            with self.__lock__:
+                wait = self.__schedule__ [0][0] - monotonic() if self.__schedule__ else self.fastInterval
+            self.__stopEvent__.wait(min(max(wait, 0.05), self.fastInterval))
+
+    def start(self):
+        """
+        Runs the poller on a daemon thread.
+        """
+        if self.__thread__ is None or not self.__thread__.is_alive():
+            self.__stopEvent__.clear()
+            self.__thread__ = Thread(target=self.run, name="PresencePoller", daemon=True)
+            self.__thread__.start()
+
+    def stop(self):
+        self.__stopEvent__.set()
+        if self.__thread__ is not None:
+            self.__thread__.join()
+            self.__thread__ = None
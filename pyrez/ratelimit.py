@@ -0,0 +1,57 @@
+from threading import Lock
+from time import monotonic, sleep
+
+class RateLimiter:
+    """
+    Thread-safe token bucket used to keep outgoing requests under a rate limit.
+
+    Parameters
+    ----------
+    rate : float
+        Number of requests allowed on each period; a fractional rate such as 0.5 allows one request every two periods.
+    period : [optional] : float
+        Length of the period in seconds. It defaults to 1 second.
+    """
+    def __init__(self, rate, period = 1.0):
+        if not rate or float(rate) <= 0 or not period or float(period) <= 0:
+            raise ValueError("Rate and period must be greater than zero!")
+        self.rate = float(rate)
+        self.period = float(period)
+        self.capacity = max(1.0, self.rate) # The bucket holds at least one request, so rates below 1 still let requests through
+        self.__tokens__ = self.capacity
+        self.__lastRefill__ = monotonic()
+        self.__lock__ = Lock()
+
+    def __refill__(self):
+        now = monotonic()
+        self.__tokens__ = min(self.capacity, self.__tokens__ + (now - self.__lastRefill__) * self.rate / self.period)
+        self.__lastRefill__ = now
+
+    def tryAcquire(self, tokens = 1):
+        """
+        Takes tokens from the bucket without blocking.
+
+        Returns
+        -------
+        bool
+            True if the tokens were taken, False if the bucket doesn't have enough tokens.
+        """
+        with self.__lock__:
+            self.__refill__()
+            if self.__tokens__ >= tokens:
+                self.__tokens__ -= tokens
+                return True
+            return False
+
+    def acquire(self, tokens = 1):
+        """
+        Blocks until the tokens are available and takes them from the bucket.
+        """
+        while True:
+            with self.__lock__:
+                self.__refill__()
+                if self.__tokens__ >= tokens:
+                    self.__tokens__ -= tokens
+                    return
+                wait = (tokens - self.__tokens__) * self.period / self.rate
+            sleep(wait)
@@ -0,0 +1,130 @@
+from datetime import datetime
+
+from pyrez.cache import PersistentCache
+from pyrez.exceptions import DailyLimitException
+from pyrez.executor import BulkExecutor
+from pyrez.utils import parseDatetime
+
+class RealmHistorySync:
+    """
+    Incremental sync of Realm Royale match histories.
+
+    The newest match time seen for every player (its watermark) is kept in a local file, and later syncs
+    only ask getPlayerMatchHistoryAfterDatetime for newer matches. Matches already delivered are never
+    delivered again, so running the same sync twice is harmless. A player without any match gets the time
+    of its first sync as watermark, so it isn't asked for its whole history again.
+
+    Parameters
+    ----------
+    api : class:`RealmRoyaleAPI`
+    statePath : [optional] : str
+        JSON file where the watermarks are kept between runs.
+    sink : [optional] : callable
+        Called with (playerId, list of new matches) for every player with new matches.
+    maxWorkers : [optional] : int
+        Maximum number of requests in flight. It defaults to 8.
+    rateLimiter : [optional] : class:`RateLimiter`
+    """
+    DATETIME_FORMAT = "%Y%m%d%H%M%S" # Format of the {startDatetime} parameter
+
+    def __init__(self, api, statePath = None, sink = None, maxWorkers = 8, rateLimiter = None):
+        self.api = api
+        self.watermarks = PersistentCache(statePath)
+        self.sink = sink
+        self.executor = BulkExecutor(maxWorkers, rateLimiter)
+
+    @staticmethod
+    def getMatches(response):
+        """
+        Returns the list of matches of a getPlayerMatchHistory(AfterDatetime) response.
+        """
+        if not response:
+            return []
+        if isinstance(response, list):
+            response = response [0] if len(response) == 1 and isinstance(response [0], dict) and "matches" in response [0] else { "matches": response }
+        return [ match for match in response.get("matches") or [] if isinstance(match, dict) ]
+
+    def __fetch__(self, playerId):
+        watermark, fetchedAt = self.watermarks.get(str(playerId)), datetime.utcnow().replace(microsecond=0)
+        if watermark is None:
+            return self.getMatches(self.api.getPlayerMatchHistory(playerId)), fetchedAt
+        after = parseDatetime(watermark ["after"])
+        return self.getMatches(self.api.getPlayerMatchHistoryAfterDatetime(playerId, after.strftime(self.DATETIME_FORMAT))), fetchedAt
+
+    def __merge__(self, playerId, matches, fetchedAt):
+        # Returns (new matches, new watermark or None); the watermark is only committed once the matches are delivered
+        watermark = self.watermarks.get(str(playerId))
+        if watermark is None and not matches:
+            return [], { "after": fetchedAt.strftime("%Y-%m-%dT%H:%M:%S"), "ids": [] }
+        watermark = watermark or { "after": None, "ids": [] }
+        after = parseDatetime(watermark ["after"]) if watermark ["after"] else None
+        seenIds, newMatches, newest, newestIds = set(watermark ["ids"]), {}, after, set(watermark ["ids"])
+        for match in matches:
+            matchId, when = match.get("match_id"), parseDatetime(match.get("match_datetime"))
+            if when is None or after is not None and (when < after or when == after and matchId in seenIds):
+                continue
+            newMatches [matchId] = match
+            if newest is None or when > newest:
+                newest, newestIds = when, { matchId }
+            elif when == newest:
+                newestIds.add(matchId)
+        if newest is not None and (newest != after or newestIds != seenIds):
+            return list(newMatches.values()), { "after": newest.strftime("%Y-%m-%dT%H:%M:%S"), "ids": sorted(newestIds, key=str) }
+        return list(newMatches.values()), None
+
+    def sync(self, playerIds):
+        """
+        Syncs the players concurrently, yielding the new matches of every player as soon as they arrive.
+
+        Parameters
+        ----------
+        playerIds : iterable of int
+
+        Returns
+        -------
+        generator of tuple
+            (playerId, list of new matches, exception) for every player; a player that failed (request or sink)
+            comes with an empty list and its exception (None otherwise), and keeps its watermark, so its matches
+            are delivered again by the next sync.
+
+        Raises
+        ------
+        DailyLimitException
+            As soon as a request hits the daily limit; the requests still pending are cancelled and
+            the watermarks of the players already synced are saved.
+        """
+        try:
+            for playerId, result, error in self.executor.mapAsCompleted(self.__fetch__, set(int(playerId) for playerId in playerIds)):
+                if isinstance(error, DailyLimitException):
+                    raise error
+                if error is not None:
+                    yield playerId, [], error
+                    continue
+                newMatches, watermark = self.__merge__(playerId, *result)
+                if newMatches and self.sink:
+                    try:
+                        self.sink(playerId, newMatches)
+                    except Exception as x:
+                        yield playerId, [], x
+                        continue
+                if watermark is not None:
+                    self.watermarks.set(str(playerId), watermark)
+                yield playerId, newMatches, None
+        finally:
+            self.watermarks.save()
+
+    def syncAll(self, playerIds):
+        """
+        Same as :meth:`sync`, but waits for every player.
+
+        Returns
+        -------
+        tuple
+            (dict of playerId → number of new matches, dict of playerId → exception for the players that failed).
+        """
+        counts, errors = {}, {}
+        for playerId, matches, error in self.sync(playerIds):
+            counts [playerId] = len(matches)
+            if error is not None:
+                errors [playerId] = error
+        return counts, errors
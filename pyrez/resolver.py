@@ -0,0 +1,121 @@
+from time import time
+
+from pyrez.cache import PersistentCache
+from pyrez.enumerations import PortalId
+from pyrez.executor import BulkExecutor
+from pyrez.exceptions import InvalidArgumentException
+
+class PlayerIdResolver:
+    """
+    Resolves player names and portal user ids to Hi-Rez playerIds in bulk.
+
+    Queries are normalized and de-duplicated, known ids are read from a persistent cache
+    and only the misses are sent to the API, concurrently.
+
+    Parameters
+    ----------
+    api : class:`HiRezAPI`
+        API used to resolve the misses.
+    cachePath : [optional] : str
+        JSON file where the name→playerId cache is kept between runs.
+    maxWorkers : [optional] : int
+        Maximum number of requests in flight. It defaults to 8.
+    rateLimiter : [optional] : class:`RateLimiter`
+    xboxAndSwitch : [optional] : bool
+        Resolve names with getPlayerIdInfoForXboxAndSwitch (Paladins Xbox/Switch gamer tags).
+    notFoundTTL : [optional] : int
+        Seconds a player that wasn't found is remembered before being queried again. It defaults to 3600.
+    """
+    def __init__(self, api, cachePath = None, maxWorkers = 8, rateLimiter = None, xboxAndSwitch = False, notFoundTTL = 3600):
+        self.api = api
+        self.notFoundTTL = notFoundTTL
+        self.cache = PersistentCache(cachePath)
+        self.executor = BulkExecutor(maxWorkers, rateLimiter)
+        self.xboxAndSwitch = xboxAndSwitch
+
+    @staticmethod
+    def normalize(query):
+        """
+        Returns the cache key of a query: a player name or a (portalId, portalUserId) pair.
+        """
+        if isinstance(query, (tuple, list)):
+            if len(query) != 2 or not str(query [1]).strip():
+                raise InvalidArgumentException("Portal queries must be (portalId, portalUserId) pairs!")
+            portalId = query [0].value if isinstance(query [0], PortalId) else int(query [0])
+            return "portal:{0}:{1}".format(portalId, str(query [1]).strip().lower())
+        name = str(query).strip().lower()
+        if not name:
+            raise InvalidArgumentException("Invalid player!")
+        return "name:{0}".format(name)
+
+    @staticmethod
+    def __parsePlayerId__(response):
+        if not response:
+            return None
+        first = response [0] if isinstance(response, list) else response
+        playerId = (first.get("player_id") or first.get("playerId")) if isinstance(first, dict) else None
+        return int(playerId) if playerId and str(playerId).isnumeric() and int(playerId) > 0 else None
+
+    def __lookup__(self, query):
+        if isinstance(query, (tuple, list)):
+            portalId = query [0].value if isinstance(query [0], PortalId) else int(query [0])
+            return self.__parsePlayerId__(self.api.getPlayerIdByPortalUserId(portalId, str(query [1]).strip()))
+        if self.xboxAndSwitch:
+            return self.__parsePlayerId__(self.api.getPlayerIdInfoForXboxAndSwitch(str(query).strip()))
+        return self.__parsePlayerId__(self.api.getPlayerIdByName(str(query).strip()))
+
+    def resolve(self, queries):
+        """
+        Resolves the queries, yielding the results as they complete. Cached ids are yielded first.
+
+        Parameters
+        ----------
+        queries : iterable
+            Player names and/or (portalId, portalUserId) pairs.
+
+        Returns
+        -------
+        generator of tuple
+            (query, playerId, exception) for every unique query; playerId is None if the player wasn't found
+            or the lookup failed, and exception is the error of a failed lookup (None otherwise).
+        """
+        seen, pending = set(), {}
+        for query in queries:
+            query = tuple(query) if isinstance(query, list) else query
+            key = self.normalize(query)
+            if key in seen:
+                continue
+            seen.add(key)
+            playerId = self.cache.get(key)
+            if isinstance(playerId, dict): # Not found before
+                if playerId.get("notFoundUntil", 0) > time():
+                    yield query, None, None
+                    continue
+                playerId = None
+            if playerId is None:
+                pending [key] = query
+            else:
+                yield query, playerId, None
+        try:
+            for key, playerId, error in self.executor.mapAsCompleted(lambda k: self.__lookup__(pending [k]), pending):
+                if error is None:
+                    self.cache.set(key, playerId if playerId else { "notFoundUntil": time() + self.notFoundTTL })
+                yield pending [key], playerId, error
+        finally:
+            self.cache.save()
+
+    def resolveAll(self, queries):
+        """
+        Same as :meth:`resolve`, but waits for every query.
+
+        Returns
+        -------
+        tuple
+            (dict of query → playerId, dict of query → exception for the lookups that failed).
+        """
+        results, errors = {}, {}
+        for query, playerId, error in self.resolve(queries):
+            results [query] = playerId
+            if error is not None:
+                errors [query] = error
+        return results, errors
@@ -0,0 +1,152 @@
+from collections import namedtuple
+from datetime import datetime
+from heapq import heappush, heappop
+from itertools import count
+from threading import Condition, local
+from time import monotonic
+
+from pyrez.exceptions import DailyLimitException, InvalidArgumentException
+from pyrez.stats import RequestStats
+
+PriorityClass = namedtuple("PriorityClass", ["name", "priority", "maxConcurrency", "reserved"])
+
+class RequestScheduler:
+    """
+    Shares one developer key between interactive and batch work: requests wait in a priority queue
+    and a freed slot always goes to the most urgent class first.
+
+    Assign it to :attr:`HiRezAPI.scheduler` (it can be shared by several API objects).
+
+    Parameters
+    ----------
+    maxConcurrency : [optional] : int
+        Maximum number of requests in flight over every class. It defaults to 16.
+    classes : [optional] : list of class:`PriorityClass`
+        Lower priority values are served first. maxConcurrency (or None) caps a class, and reserved
+        is the part of the daily quota that lower priority classes can't use.
+        It defaults to "interactive" (priority 0) and "batch" (priority 1).
+    defaultClass : [optional] : str
+        Class of requests that don't pick one. It defaults to "batch".
+    methodClasses : [optional] : dict
+        API method → class, e.g. { "getplayer": "interactive" }.
+    dailyQuota : [optional] : int
+        Requests allowed per day (UTC), needed for the reservations. It defaults to None (no quota accounting).
+    """
+    DEFAULT_CLASSES = (PriorityClass("interactive", 0, None, 0), PriorityClass("batch", 1, None, 0))
+    DEFAULT_METHOD_CLASSES = { "getplayer": "interactive", "getplayerstatus": "interactive" }
+
+    class Ticket:
+        def __init__(self, priorityClass, sequence):
+            self.priorityClass = priorityClass
+            self.sequence = sequence
+            self.enqueued = monotonic()
+            self.granted = False
+        def __lt__(self, other):
+            return (self.priorityClass.priority, self.sequence) < (other.priorityClass.priority, other.sequence)
+
+    def __init__(self, maxConcurrency = 16, classes = DEFAULT_CLASSES, defaultClass = "batch", methodClasses = None, dailyQuota = None):
+        self.classes = { priorityClass.name: priorityClass for priorityClass in classes }
+        if defaultClass not in self.classes:
+            raise InvalidArgumentException("Unknown default class: {0}".format(defaultClass))
+        self.maxConcurrency = max(1, int(maxConcurrency))
+        self.defaultClass = defaultClass
+        self.methodClasses = dict(self.DEFAULT_METHOD_CLASSES if methodClasses is None else methodClasses)
+        self.dailyQuota = dailyQuota
+        self.stats = RequestStats()
+        self.__waiting__ = []
+        self.__inFlight__ = { name: 0 for name in self.classes }
+        self.__used__ = { name: 0 for name in self.classes }
+        self.__usedDay__ = datetime.utcnow().date()
+        self.__maxDelay__ = { name: 0.0 for name in self.classes }
+        self.__sequence__ = count()
+        self.__condition__ = Condition()
+        self.__local__ = local()
+
+    def priority(self, className):
+        """
+        Context manager that sends the requests of the current thread with another class::
+
+            with scheduler.priority("interactive"):
+                api.getPlayer(playerId)
+        """
+        scheduler = self
+        if className not in self.classes:
+            raise InvalidArgumentException("Unknown class: {0}".format(className))
+        class PriorityContext:
+            def __enter__(self):
+                self.previous = getattr(scheduler.__local__, "className", None)
+                scheduler.__local__.className = className
+            def __exit__(self, *args):
+                scheduler.__local__.className = self.previous
+        return PriorityContext()
+
+    def getClass(self, apiMethod = None):
+        className = getattr(self.__local__, "className", None) or self.methodClasses.get(str(apiMethod).lower()) or self.defaultClass
+        return self.classes [className]
+
+    def __reservedAbove__(self, priorityClass):
+        return sum(max(0, other.reserved - self.__used__ [other.name]) for other in self.classes.values() if other.priority < priorityClass.priority)
+
+    def __hasQuota__(self, priorityClass):
+        if self.dailyQuota is None:
+            return True
+        today = datetime.utcnow().date()
+        if today != self.__usedDay__:
+            self.__usedDay__, self.__used__ = today, { name: 0 for name in self.classes }
+        return sum(self.__used__.values()) < self.dailyQuota - self.__reservedAbove__(priorityClass)
+
+    def __dispatch__(self):
+        inFlight, skipped = sum(self.__inFlight__.values()), []
+        while self.__waiting__ and inFlight < self.maxConcurrency:
+            ticket = heappop(self.__waiting__)
+            priorityClass = ticket.priorityClass
+            if priorityClass.maxConcurrency is not None and self.__inFlight__ [priorityClass.name] >= priorityClass.maxConcurrency:
+                skipped.append(ticket)
+                continue
+            ticket.granted = True
+            self.__inFlight__ [priorityClass.name] += 1
+            self.__used__ [priorityClass.name] += 1
+            inFlight += 1
+        for ticket in skipped:
+            heappush(self.__waiting__, ticket)
+        self.__condition__.notify_all()
+
+    def acquire(self, apiMethod = None):
+        """
+        Waits for a slot for a request and returns its ticket, to be given back with :meth:`release`.
+        Raises :class:`DailyLimitException` when the rest of the daily quota is reserved for more urgent classes.
+        """
+        priorityClass = self.getClass(apiMethod)
+        with self.__condition__:
+            if not self.__hasQuota__(priorityClass):
+                self.stats.increment(priorityClass.name, "rejected")
+                raise DailyLimitException("The rest of the daily quota is reserved for higher priority requests!")
+            ticket = self.Ticket(priorityClass, next(self.__sequence__))
+            heappush(self.__waiting__, ticket)
+            self.__dispatch__()
+            while not ticket.granted:
+                self.__condition__.wait()
+            delay = monotonic() - ticket.enqueued
+            self.__maxDelay__ [priorityClass.name] = max(self.__maxDelay__ [priorityClass.name], delay)
+        self.stats.record(priorityClass.name, requests=1, queueDelay=delay)
+        return ticket
+
+    def release(self, ticket):
+        with self.__condition__:
+            self.__inFlight__ [ticket.priorityClass.name] -= 1
+            self.__dispatch__()
+
+    def getMetrics(self):
+        """
+        Returns, per class: requests, waiting, inFlight, usedToday, rejected, averageQueueDelay and maxQueueDelay (seconds).
+        """
+        with self.__condition__:
+            waiting = {}
+            for ticket in self.__waiting__:
+                waiting [ticket.priorityClass.name] = waiting.get(ticket.priorityClass.name, 0) + 1
+            metrics = {}
+            for name in self.classes:
+                counters = self.stats.get(name)
+                metrics [name] = { "requests": counters.get("requests", 0), "waiting": waiting.get(name, 0), "inFlight": self.__inFlight__ [name], "usedToday": self.__used__ [name],
+                    "rejected": counters.get("rejected", 0), "averageQueueDelay": counters.get("queueDelay", 0) / counters ["requests"] if counters.get("requests") else 0.0, "maxQueueDelay": self.__maxDelay__ [name] }
+            return metrics
@@ -0,0 +1,338 @@
+from collections import namedtuple
+
+from pyrez.enumerations import Champions, Gods, PaladinsQueue
+from pyrez.utils import parseDatetime
+
+# attribute : name set on the model
+# keys : source keys, tried in order (value = first truthy conversion, like `int(a) or int(b)` in the models)
+# kind : "raw", "int", "str", "bool", "yesno", "equals", "datetime", "enum", "enums", "items" or "models"
+# default : default of the source lookup; for "equals" the upper-case value compared with; for "enum" (enumClass, nameAttribute, fallbackKeys, nameKeys);
+#   for "enums" (enumClasses, nameAttribute, nameKeys, missing); for "items" the slot count; for "models" (name of the class in pyrez.models, slot count or None for a list)
+Field = namedtuple("Field", ["attribute", "keys", "kind", "default"])
+
+def __raw__(attribute, key):
+    return Field(attribute, (key,), "raw", None)
+
+# Own fields of every model (by class name); a model also gets the fields of its base classes, see :func:`getFields`
+SCHEMAS = {
+    "Friend": [
+        Field("accountId", ("account_id",), "int", 0), Field("avatarURL", ("avatar_url",), "str", None),
+        Field("playerId", ("player_id",), "int", 0), Field("playerName", ("name",), "str", None),
+    ],
+    "AbstractPlayer": [
+        Field("playerId", ("Id", "id"), "int", 0), Field("playerName", ("Name", "name"), "str", None),
+    ],
+    "Player": [
+        Field("steamId", ("steam_id",), "int", 0),
+    ],
+    "BaseCharacter": [
+        Field("abilitys", ("Ability_{0}",), "models", ("ChampionAbility", 0)), Field("cons", ("Cons",), "str", None), Field("health", ("Health",), "int", 0),
+        Field("lore", ("Lore",), "str", None), Field("onFreeRotation", ("OnFreeRotation",), "yesno", None), Field("pantheon", ("Pantheon",), "str", None),
+        Field("pros", ("Pros",), "str", None), Field("roles", ("Roles",), "str", None), Field("speed", ("Speed",), "int", 0),
+        Field("title", ("Title",), "str", None), Field("type", ("Type",), "str", None),
+    ],
+    "Champion": [
+        Field("championId", ("id",), "enum", (Champions, "championName", ("id",), ("Name",))), Field("abilitys", ("Ability_{0}",), "models", ("ChampionAbility", 5)),
+        Field("championCardURL", ("ChampionCard_URL",), "str", None), Field("championIconURL", ("ChampionIcon_URL",), "str", None),
+        Field("latestChampion", ("latestChampion",), "yesno", None),
+    ],
+    "God": [
+        Field("godId", ("id",), "enum", (Gods, "godName", ("id",), ("Name",))), Field("latestGod", ("latestGod",), "yesno", None),
+    ],
+    "BaseCharacterRank": [
+        Field("assists", ("Assists",), "int", 0), Field("deaths", ("Deaths",), "int", 0), Field("kills", ("Kills",), "int", None),
+        Field("losses", ("Losses",), "int", 0), Field("minionKills", ("MinionKills",), "int", 0), Field("godLevel", ("Rank",), "int", 0),
+        Field("wins", ("Wins",), "int", 0), Field("worshippers", ("Worshippers",), "int", 0), Field("playerId", ("player_id",), "int", 0),
+    ],
+    "GodRank": [
+        Field("godId", ("god_id", "champion_id"), "enums", ((Gods, Champions), "godName", ("champion", "god"), -1)),
+    ],
+    "BaseSkin": [
+        Field("skinId1", ("skin_id1",), "int", 0), Field("skinId2", ("skin_id2",), "int", 0),
+        Field("skinName", ("skin_name",), "str", None), Field("skinNameEnglish", ("skin_name_english",), "str", None),
+    ],
+    "ChampionSkin": [
+        Field("championId", ("champion_id",), "enum", (Champions, "championName", ("champion_id",), ("champion_name",))), Field("rarity", ("rarity",), "str", None),
+    ],
+    "GodSkin": [
+        Field("godId", ("god_id",), "int", 0), Field("godName", ("god_name",), "str", None), Field("godIconURL", ("godIcon_URL",), "str", None),
+        Field("godSkinURL", ("godSkin_URL",), "str", None), Field("obtainability", ("obtainability",), "str", None),
+        Field("priceFavor", ("price_favor",), "int", 0), Field("priceGems", ("price_gems",), "int", 0),
+    ],
+    "HiRezServerStatus": [
+        Field("entryDateTime", ("entry_datetime",), "str", None), Field("environment", ("environment",), "str", None),
+        Field("limitedAccess", ("limited_access",), "bool", False), Field("platform", ("platform",), "str", None),
+        Field("status", ("status",), "equals", "UP"), Field("version", ("version",), "str", None),
+    ],
+    "MatchHistory": [
+        Field("items", ("ActiveId{0}", "Active_{0}", "ActiveLevel{0}"), "items", 4), Field("loadout", ("ItemId{0}", "Item_{0}", "ItemLevel{0}"), "items", 6),
+        Field("championId", ("ChampionId",), "enum", (Champions, "championName", ("ChampionId",), ("Champion",))),
+    ] + [ __raw__(attribute, key) for attribute, key in (
+        ("assists", "Assists"), ("creeps", "Creeps"), ("damage", "Damage"), ("damageBot", "Damage_Bot"), ("damageDoneInHand", "Damage_Done_In_Hand"),
+        ("damageMitigated", "Damage_Mitigated"), ("damageStructure", "Damage_Structure"), ("damageTaken", "Damage_Taken"), ("damageTakenMagical", "Damage_Taken_Magical"),
+        ("damageTakenPhysical", "Damage_Taken_Physical"), ("deaths", "Deaths"), ("distanceTraveled", "Distance_Traveled"), ("credits", "Gold"), ("healing", "Healing"),
+        ("healingBot", "Healing_Bot"), ("healingPlayerSelf", "Healing_Player_Self"), ("killingSpree", "Killing_Spree"), ("kills", "Kills"), ("level", "Level"),
+        ("mapGame", "Map_Game"), ("matchMinutes", "Minutes"), ("matchRegion", "Region"), ("matchQueueId", "Match_Queue_Id"), ("matchTime", "Match_Time"),
+        ("matchTimeSecond", "Time_In_Match_Seconds"), ("matchId", "Match"), ("multiKillMax", "Multi_kill_Max"), ("objectiveAssists", "Objective_Assists"), ("queue", "Queue"),
+        ("skin", "Skin"), ("skinId", "SkinId"), ("surrendered", "Surrendered"), ("taskForce", "TaskForce"), ("team1Score", "Team1Score"), ("team2Score", "Team2Score"),
+        ("wardsPlaced", "Wards_Placed"), ("winStatus", "Win_Status"), ("winningTaskForce", "Winning_TaskForce"), ("playerName", "playerName"),
+    ) ],
+    "MatchPlayerDetail": [
+        Field("accountLevel", ("Account_Level",), "int", 0),
+        Field("championId", ("ChampionId",), "enum", (Champions, "championName", ("ChampionId",), ("ChampionName",))),
+        Field("masteryLevel", ("Mastery_Level",), "int", 0), Field("matchId", ("Match",), "int", 0),
+        Field("queue", ("Queue",), "enum", (PaladinsQueue, None, ("Queue",), ())),
+        Field("skinId", ("SkinId",), "int", 0), Field("playerCreated", ("playerCreated",), "datetime", None), Field("playerId", ("playerId",), "int", 0),
+        Field("playerName", ("playerName",), "str", None), Field("taskForce", ("taskForce",), "int", 0), Field("tier", ("Tier",), "int", 0),
+        Field("tierLosses", ("tierLosses",), "int", 0), Field("tierWins", ("tierWins",), "int", 0),
+    ],
+    "PlayerLoadout": [
+        Field("championId", ("ChampionId",), "enum", (Champions, "championName", ("ChampionId",), ("ChampionName",))),
+        Field("deckId", ("DeckId",), "int", 0), Field("deckName", ("DeckName",), "str", None), Field("playerId", ("playerId",), "int", 0),
+        Field("playerName", ("playerName",), "str", None), Field("cards", ("LoadoutItems",), "models", ("LoadoutItem", None)),
+    ],
+    "GodLeaderboard": [
+        Field("godId", ("god_id",), "enum", (Gods, None, ("god_id",), ())), Field("losses", ("losses",), "int", 0),
+        Field("playerId", ("player_id",), "int", 0), Field("playerName", ("player_name",), "str", None),
+        Field("playerRanking", ("player_ranking",), "str", None), Field("rank", ("rank",), "int", 0), Field("wins", ("wins",), "int", 0),
+    ],
+    "MOTD": [
+        Field(attribute, (attribute,), "str", None) for attribute in ("description", "gameMode", "maxPlayers", "name", "startDateTime", "team1GodsCSV", "team2GodsCSV", "title")
+    ],
+    "QueueStats": [
+        Field("assists", ("Assists",), "int", 0),
+        Field("godId", ("GodId",), "enum", (Gods, "godName", ("ChampionId", "GodId"), ("Champion", "God"))),
+        Field("deaths", ("Deaths",), "int", 0), Field("gold", ("Gold",), "int", 0), Field("kills", ("Kills",), "int", 0),
+        Field("lastPlayed", ("LastPlayed",), "datetime", None), Field("losses", ("Losses",), "int", 0), Field("matches", ("Matches",), "int", 0),
+        Field("minutes", ("Minutes",), "int", 0), Field("queue", ("Queue",), "str", None), Field("wins", ("Wins",), "int", 0), Field("playerId", ("player_id",), "int", 0),
+    ],
+    "TeamDetail": [
+        Field("founder", ("Founder",), "str", None), Field("founderId", ("FounderId",), "int", 0), Field("losses", ("Losses",), "int", 0),
+        Field("name", ("Name",), "str", None), Field("players", ("Players",), "int", 0), Field("rating", ("Rating",), "int", 0),
+        Field("tag", ("Tag",), "str", None), Field("teamId", ("TeamId",), "int", 0), Field("wins", ("Wins",), "int", 0),
+    ],
+    "TeamPlayer": [
+        Field("accountLevel", ("AccountLevel",), "int", 0), Field("joinedDatetime", ("JoinedDatetime",), "str", None),
+        Field("lastLoginDatetime", ("LastLoginDatetime",), "str", None), Field("name", ("Name",), "str", None),
+    ],
+    "ChampionCard": [
+        Field("activeFlagActivationSchedule", ("active_flag_activation_schedule",), "yesno", None), Field("activeFlagLti", ("active_flag_lti",), "yesno", None),
+        Field("cardDescription", ("card_description",), "str", None), Field("cardId1", ("card_id1",), "int", 0), Field("cardId2", ("card_id2",), "int", 0),
+        Field("cardName", ("card_name",), "str", None), Field("cardNameEnglish", ("card_name_english",), "str", None),
+        Field("championCardURL", ("championCard_URL",), "str", None), Field("championIconURL", ("championIcon_URL",), "str", None),
+        Field("championId", ("champion_id",), "enum", (Champions, "championName", ("champion_id",), ("champion_name",))),
+        Field("exclusive", ("exclusive",), "yesno", None), Field("rank", ("rank",), "int", 0), Field("rarity", ("rarity",), "str", None),
+        Field("recharge_seconds", ("recharge_seconds",), "int", 0),
+    ],
+}
+
+__TEMPLATES__ = {
+    "raw": "get({0!r})", "int": "int(get({0!r}, {1!r}))", "str": "str(get({0!r}, {1!r}))", "bool": "bool(get({0!r}, {1!r}))",
+    "yesno": "str(get({0!r}, {1!r})).lower() == 'y'", "equals": "str(get({0!r}, None)).upper() == {1!r}", "datetime": "parseDatetime(get({0!r}, {1!r}))",
+}
+__MODELS__ = set()
+__FILLERS__ = {}
+__PARSERS__ = {}
+__RECORD_PARSERS__ = {}
+__RECORD_CLASSES__ = {}
+
+def __convert__(kind, keys, default):
+    return " or ".join(__TEMPLATES__ [kind].format(key, default) for key in keys)
+
+def __choose__(choices, last):
+    # `a if get(keyA) else b if get(keyB) else last`: the value of the first key that is set
+    return "".join("{0} if get({1!r}) else ".format(value, key) for value, key in choices) + last
+
+def __attributes__(field):
+    if field.kind in ("enum", "enums") and field.default [1]:
+        return [ field.attribute, field.default [1] ]
+    return [ field.attribute ]
+
+def __generate__(field, record = False):
+    # Models set attributes on obj; records assign locals (prefixed with _) and skip the enum lookups
+    target = "_" if record else "obj."
+    if field.kind in __TEMPLATES__:
+        return [ "{0}{1} = {2}".format(target, field.attribute, __convert__(field.kind, field.keys, field.default)) ]
+    if field.kind == "items":
+        item = "({0})" if record else "InGameItem({0})"
+        items = ", ".join(item.format(", ".join("get({0!r})".format(key.format(i)) for key in field.keys)) for i in range(1, field.default + 1))
+        return [ "{0}{1} = {2}".format(target, field.attribute, "({0})".format(items) if record else "[ {0} ]".format(items)) ]
+    if field.kind == "models":
+        # Nested models (e.g. the abilities of a champion): one per numbered key, or one per entry of a list; records keep the raw rows
+        className, count = field.default
+        item = "get({0!r}, None)" if record else className + "(**get({0!r}, None))"
+        if count is None:
+            items = "tuple(get({0!r}))".format(field.keys [0]) if record else "[ {0}(**i) for i in get({1!r}) ]".format(className, field.keys [0])
+        else:
+            items = ", ".join(item.format(field.keys [0].format(i)) for i in range(1, count + 1))
+            items = "({0}{1})".format(items, "," if count == 1 else "") if record else "[ {0} ]".format(items)
+        return [ "{0}{1} = {2}".format(target, field.attribute, items) ]
+    if field.kind == "enum":
+        enumClass, nameAttribute, fallbackKeys, nameKeys = field.default
+        if record:
+            lines = [ "_{0} = {1}".format(field.attribute, __convert__("int", fallbackKeys, 0)) ]
+            return lines + ([ "_{0} = {1}".format(nameAttribute, __convert__("str", nameKeys, None)) ] if nameAttribute else [])
+        lines = [ "try:", "    obj.{0} = {1}(int(get({2!r}, 0)))".format(field.attribute, enumClass.__name__, field.keys [0]) ]
+        if nameAttribute:
+            lines.append("    obj.{0} = str(obj.{1})".format(nameAttribute, field.attribute))
+        lines += [ "except Exception:", "    obj.{0} = {1}".format(field.attribute, __convert__("int", fallbackKeys, 0)) ]
+        if nameAttribute:
+            lines.append("    obj.{0} = {1}".format(nameAttribute, __convert__("str", nameKeys, None)))
+        return lines
+    if field.kind == "enums":
+        # One enum class per key (e.g. god_id → Gods, champion_id → Champions), taken from the first key that is set
+        enumClasses, nameAttribute, nameKeys, missing = field.default
+        ids = __choose__([ ("int(get({0!r}))".format(key), key) for key in field.keys ], repr(missing))
+        name = __choose__([ ("str(get({0!r}))".format(key), key) for key in nameKeys [:-1] ], "str(get({0!r}, None))".format(nameKeys [-1]))
+        if record:
+            return [ "_{0} = {1}".format(field.attribute, ids), "_{0} = {1}".format(nameAttribute, name) ]
+        enums = __choose__([ ("{0}(int(get({1!r})))".format(enumClass.__name__, key), key) for enumClass, key in zip(enumClasses, field.keys) ], repr(missing))
+        return [ "try:", "    obj.{0} = {1}".format(field.attribute, enums), "    obj.{0} = str(obj.{1})".format(nameAttribute, field.attribute),
+                 "except Exception:", "    obj.{0} = {1}".format(field.attribute, ids), "    obj.{0} = {1}".format(nameAttribute, name) ]
+    raise ValueError("Unknown field kind: {0}".format(field.kind))
+
+def getFields(modelClass):
+    """
+    Returns the fields of modelClass: the :data:`SCHEMAS` entries of its base classes first, then its own.
+    A field redeclared by a subclass (e.g. the abilitys of a :class:`Champion`) replaces the one of its base class.
+    """
+    fields = [ field for cls in reversed(modelClass.__mro__) for field in SCHEMAS.get(cls.__name__, ()) ]
+    last = { field.attribute: field for field in fields }
+    return [ field for field in fields if last [field.attribute] is field ]
+
+def __lines__(lines):
+    return "\n".join("    " + line for line in lines)
+
+def generateSource(modelClass, fields = None):
+    """
+    Returns the source code of the parse function of modelClass (see :func:`compileParser`).
+    """
+    from pyrez.models import APIResponse
+    lines = [ "obj = new(cls)", "get = row.get" ]
+    if issubclass(modelClass, APIResponse):
+        lines += [ "obj.json = str(row)", "obj.retMsg = str(get('ret_msg', None))" ]
+    for field in getFields(modelClass) if fields is None else fields:
+        lines += __generate__(field)
+    return "def parse{0}(row):\n{1}\n    return obj\n".format(modelClass.__name__, __lines__(lines))
+
+def generateFillSource(modelClass):
+    """
+    Returns the source code of the function that sets the own fields of modelClass on an object (see :func:`schemaModel`).
+    """
+    lines = [ "get = row.get" ]
+    for field in SCHEMAS [modelClass.__name__]:
+        lines += __generate__(field)
+    return "def fill{0}(obj, row):\n{1}\n".format(modelClass.__name__, __lines__(lines))
+
+def generateRecordSource(modelClass, fields = None):
+    """
+    Returns the source code of the record function of modelClass (see :func:`compileRecordParser`).
+    """
+    lines, attributes = [ "get = row.get" ], []
+    for field in getFields(modelClass) if fields is None else fields:
+        lines += __generate__(field, record=True)
+        attributes += __attributes__(field)
+    lines.append("return Record({0})".format(", ".join("_" + attribute for attribute in attributes)))
+    return "def record{0}(row):\n{1}\n".format(modelClass.__name__, __lines__(lines))
+
+def __namespace__(fields):
+    import pyrez.models as models
+    namespace = { "new": object.__new__, "InGameItem": models.InGameItem, "parseDatetime": parseDatetime }
+    for field in fields:
+        if field.kind == "models":
+            namespace [field.default [0]] = getattr(models, field.default [0])
+        elif field.kind == "enum":
+            namespace [field.default [0].__name__] = field.default [0]
+        elif field.kind == "enums":
+            namespace.update((enumClass.__name__, enumClass) for enumClass in field.default [0])
+    return namespace
+
+def __compile__(source, name, namespace):
+    exec(compile(source, "<pyrez.schema.{0}>".format(name), "exec"), namespace)
+    return namespace
+
+def __createRecordClass__(modelClass, attributes):
+    recordClass = __RECORD_CLASSES__.get((modelClass, tuple(attributes)))
+    if recordClass is None:
+        recordClass = __RECORD_CLASSES__ [(modelClass, tuple(attributes))] = namedtuple("{0}Record".format(modelClass.__name__), attributes, rename=True)
+        globals() [recordClass.__name__] = recordClass # Importable, so records can be pickled
+    return recordClass
+
+def schemaModel(modelClass):
+    """
+    Class decorator of the models described in :data:`SCHEMAS`, which is the only definition of their fields:
+    `modelClass(**row)` calls the `__init__` of the base class, then sets the own fields of modelClass with a
+    function compiled from its schema (on first use).
+    """
+    def __init__(self, **kwargs):
+        super(modelClass, self).__init__(**kwargs)
+        fill = __FILLERS__.get(modelClass)
+        if fill is None:
+            fill = __FILLERS__ [modelClass] = __compile__(generateFillSource(modelClass), modelClass.__name__, __namespace__(SCHEMAS [modelClass.__name__])) ["fill{0}".format(modelClass.__name__)]
+        fill(self, kwargs)
+    modelClass.__init__ = __init__
+    __MODELS__.add(modelClass)
+    return modelClass
+
+def compileParser(modelClass, fields = None):
+    """
+    Compiles one function specialised for modelClass from its field schema. It takes the decoded row positionally
+    and sets every attribute directly (no `**kwargs` unpacking, no chain of `__init__` calls), giving the same object
+    as `modelClass(**row)`.
+
+    Parameters
+    ----------
+    modelClass : class
+    fields : [optional] : list of :class:`Field`
+        It defaults to :func:`getFields` of modelClass.
+    """
+    fields = getFields(modelClass) if fields is None else fields
+    namespace = dict(__namespace__(fields), cls=modelClass)
+    return __compile__(generateSource(modelClass, fields), modelClass.__name__, namespace) ["parse{0}".format(modelClass.__name__)]
+
+def compileRecordParser(modelClass, fields = None):
+    """
+    Compiles one function that turns a decoded row into a lightweight named tuple (`<Model>Record`) with the
+    attribute names of modelClass. The lookups of "enum" and "enums" fields, :class:`InGameItem` objects, nested
+    models and the raw json copy are skipped: those ids stay ints, items are (id, name, level) tuples and nested
+    models stay the decoded rows (in a tuple).
+
+    Parameters
+    ----------
+    modelClass : class
+    fields : [optional] : list of :class:`Field`
+        It defaults to :func:`getFields` of modelClass.
+    """
+    fields = getFields(modelClass) if fields is None else fields
+    namespace = dict(__namespace__(fields), Record=__createRecordClass__(modelClass, [ attribute for field in fields for attribute in __attributes__(field) ]))
+    return __compile__(generateRecordSource(modelClass, fields), modelClass.__name__ + "Record", namespace) ["record{0}".format(modelClass.__name__)]
+
+def getParser(modelClass):
+    """
+    Returns the compiled parser of modelClass (compiled on first use), or `modelClass(**row)` when it isn't a :func:`schemaModel`.
+    """
+    parser = __PARSERS__.get(modelClass)
+    if parser is None:
+        parser = __PARSERS__ [modelClass] = compileParser(modelClass) if modelClass in __MODELS__ else lambda row: modelClass(**row)
+    return parser
+
+def parseModels(modelClass, rows):
+    parser = getParser(modelClass)
+    return [ parser(row) for row in rows ]
+
+def parseRecords(modelClass, rows):
+    """
+    Returns one record per row (see :func:`compileRecordParser`). Models that aren't a :func:`schemaModel` are built
+    and then copied into a record of their attributes.
+    """
+    parser = __RECORD_PARSERS__.get(modelClass)
+    if parser is None and modelClass in __MODELS__:
+        parser = __RECORD_PARSERS__ [modelClass] = compileRecordParser(modelClass)
+    if parser is not None:
+        return [ parser(row) for row in rows ]
+    models = parseModels(modelClass, rows)
+    if not models:
+        return []
+    attributes = [ attribute for attribute in vars(models [0]) if attribute != "json" ]
+    recordClass = __createRecordClass__(modelClass, attributes)
+    return [ recordClass(*(getattr(model, attribute, None) for attribute in attributes)) for model in models ]
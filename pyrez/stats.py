@@ -0,0 +1,54 @@
+from threading import Lock
+
+class RequestStats:
+    """
+    Thread-safe per-method counters of an API client (requests, bytes on the wire, decompressed bytes, ...).
+    """
+    def __init__(self):
+        self.__counters__ = {}
+        self.__lock__ = Lock()
+
+    def increment(self, method, counter, value = 1):
+        with self.__lock__:
+            counters = self.__counters__.setdefault(str(method).lower(), {})
+            counters [counter] = counters.get(counter, 0) + value
+
+    def record(self, method, **counters):
+        """
+        Adds every counter=value pair to the counters of a method.
+        """
+        with self.__lock__:
+            methodCounters = self.__counters__.setdefault(str(method).lower(), {})
+            for counter, value in counters.items():
+                methodCounters [counter] = methodCounters.get(counter, 0) + value
+
+    def get(self, method = None):
+        """
+        Returns a copy of the counters of a method, or the totals of every method when method is None.
+        """
+        with self.__lock__:
+            if method is not None:
+                return dict(self.__counters__.get(str(method).lower(), {}))
+            totals = {}
+            for counters in self.__counters__.values():
+                for counter, value in counters.items():
+                    totals [counter] = totals.get(counter, 0) + value
+            return totals
+
+    def snapshot(self):
+        """
+        Returns a copy of the counters of every method.
+        """
+        with self.__lock__:
+            return { method: dict(counters) for method, counters in self.__counters__.items() }
+
+    def getCompressionRatio(self, method = None):
+        """
+        Returns decompressed bytes / bytes on the wire (1.0 when nothing was received).
+        """
+        counters = self.get(method)
+        return counters.get("decompressedBytes", 0) / counters ["compressedBytes"] if counters.get("compressedBytes") else 1.0
+
+    def reset(self):
+        with self.__lock__:
+            self.__counters__ = {}
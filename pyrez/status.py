@@ -0,0 +1,134 @@
+from logging import getLogger
+from threading import Event, Lock, Thread
+from time import monotonic, sleep
+
+from pyrez.enumerations import Endpoint, OutputMode
+from pyrez.exceptions import ServerDownException
+
+logger = getLogger(__name__)
+
+class ServerStatusMonitor:
+    """
+    Polls getHiRezServerStatus in the background and holds outgoing requests back while their endpoint is DOWN.
+
+    Assign it to :attr:`HiRezAPI.statusMonitor` (of one or more API objects of the same game) to gate their requests.
+
+    Parameters
+    ----------
+    api : class:`HiRezAPI`
+        API used to poll the status of its game.
+    interval : [optional] : float
+        Seconds between polls. It defaults to 60, the interval Hi-Rez caches the status for.
+    mode : [optional] : str
+        "pause" blocks requests until the endpoint is UP again; "slow" lets one request through every slowInterval seconds.
+    slowInterval : [optional] : float
+        Seconds between requests in "slow" mode. It defaults to 5.
+    maxWait : [optional] : float
+        In "pause" mode, seconds a request waits before :class:`ServerDownException` is raised. It defaults to None (wait forever).
+    """
+    UNGATED_METHODS = ("createsession", "gethirezserverstatus", "ping")
+
+    def __init__(self, api, interval = 60, mode = "pause", slowInterval = 5.0, maxWait = None):
+        if mode not in ("pause", "slow"):
+            raise ValueError("Mode must be 'pause' or 'slow'!")
+        self.api = api
+        self.interval = interval
+        self.mode = mode
+        self.slowInterval = slowInterval
+        self.maxWait = maxWait
+        self.statuses = {} # endpoint URL → HiRezServerStatus
+        self.__upEvents__ = {} # endpoint URL → Event set while the endpoint is UP
+        self.__lastRequest__ = {}
+        self.__lock__ = Lock()
+        self.__stopEvent__ = Event()
+        self.__thread__ = None
+        self.lastUpdate = None
+
+    @staticmethod
+    def getPlatform(endpoint):
+        url = str(endpoint).lower()
+        return "ps4" if ".ps4." in url else "xbox" if ".xbox." in url else "pc"
+
+    def __endpoints__(self):
+        game = str(self.api.__endpointBaseURL__).split('/') [-1].lower() # e.g. "paladinsapi.svc"
+        return [ str(endpoint) for endpoint in Endpoint if str(endpoint).lower().endswith(game) ]
+
+    def __upEvent__(self, endpoint):
+        if endpoint not in self.__upEvents__:
+            self.__upEvents__ [endpoint] = Event()
+            self.__upEvents__ [endpoint].set()
+        return self.__upEvents__ [endpoint]
+
+    def update(self, statuses = None):
+        """
+        Polls the status now (or applies the given list of :class:`HiRezServerStatus`).
+        """
+        statuses = self.api.getHiRezServerStatuses(outputMode=OutputMode.MODEL) if statuses is None else statuses
+        byPlatform = { str(status.platform).lower(): status for status in statuses or [] if str(status.environment).lower() in ("live", "none") }
+        with self.__lock__:
+            for endpoint in self.__endpoints__():
+                status = byPlatform.get(self.getPlatform(endpoint))
+                if status is None:
+                    continue
+                self.statuses [endpoint] = status
+                if status.status:
+                    self.__upEvent__(endpoint).set()
+                else:
+                    self.__upEvent__(endpoint).clear()
+            self.lastUpdate = monotonic()
+
+    def isUp(self, endpoint):
+        """
+        Returns the last known health of an endpoint, without making a request (unknown endpoints are considered UP).
+        """
+        with self.__lock__:
+            return self.__upEvent__(str(endpoint)).is_set()
+
+    def getStatus(self, endpoint):
+        with self.__lock__:
+            return self.statuses.get(str(endpoint))
+
+    def gate(self, endpoint):
+        """
+        Called before every request: returns at once if the endpoint is UP, otherwise pauses or slows the caller.
+        """
+        endpoint = str(endpoint)
+        with self.__lock__:
+            upEvent = self.__upEvent__(endpoint)
+        if upEvent.is_set():
+            return
+        if self.mode == "pause":
+            if not upEvent.wait(self.maxWait):
+                raise ServerDownException("{0} is DOWN!".format(endpoint))
+            return
+        while True:
+            with self.__lock__:
+                wait = self.__lastRequest__.get(endpoint, 0) + self.slowInterval - monotonic()
+                if wait <= 0 or upEvent.is_set():
+                    self.__lastRequest__ [endpoint] = monotonic()
+                    return
+            sleep(min(wait, 1.0))
+
+    def run(self):
+        self.__stopEvent__.clear()
+        while not self.__stopEvent__.is_set():
+            try:
+                self.update()
+            except Exception:
+                logger.exception("Server status poll failed") # Keep the last known status; the next poll will try again
+            self.__stopEvent__.wait(self.interval)
+
+    def start(self):
+        """
+        Starts polling on a daemon thread.
+        """
+        if self.__thread__ is None or not self.__thread__.is_alive():
+            self.__stopEvent__.clear()
+            self.__thread__ = Thread(target=self.run, name="ServerStatusMonitor", daemon=True)
+            self.__thread__.start()
+
+    def stop(self):
+        self.__stopEvent__.set()
+        if self.__thread__ is not None:
+            self.__thread__.join()
+            self.__thread__ = None
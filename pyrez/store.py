@@ -0,0 +1,227 @@
+import json
+import sqlite3
+from threading import RLock
+
+from pyrez.models import MatchHistory
+from pyrez.schema import parseModels
+from pyrez.utils import parseDatetime
+
+class MatchStore:
+    """
+    Local SQLite store of matches and per-player match rows, indexed by match, player, champion/god, queue and match time.
+
+    It can also be used as a read-through layer: :meth:`getMatchDetailsBatch` only requests the matches that are not stored yet.
+    A match only counts as stored once its full rows (getMatchDetails or getMatchDetailsBatch) were added with complete=True:
+    getMatchHistory rows or sink rows alone don't stop it from being fetched.
+
+    Parameters
+    ----------
+    path : [optional] : str
+        SQLite database file. It defaults to an in-memory database.
+    api : [optional] : class:`HiRezAPI`
+        API used by the read-through methods.
+    """
+    BATCH_SIZE = 10 # Hi-Rez asks to limit getmatchdetailsbatch to 5-10 matches
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS matches (match_id INTEGER PRIMARY KEY, queue_id INTEGER, match_time TEXT, map TEXT, minutes INTEGER, complete INTEGER NOT NULL DEFAULT 0);
+        CREATE TABLE IF NOT EXISTS match_players (match_id INTEGER NOT NULL, player_id INTEGER NOT NULL, character_id INTEGER, queue_id INTEGER, match_time TEXT, data TEXT NOT NULL, PRIMARY KEY (match_id, player_id));
+        CREATE INDEX IF NOT EXISTS ix_matches_queue_time ON matches (queue_id, match_time);
+        CREATE INDEX IF NOT EXISTS ix_matches_time ON matches (match_time);
+        CREATE INDEX IF NOT EXISTS ix_match_players_player ON match_players (player_id, match_time);
+        CREATE INDEX IF NOT EXISTS ix_match_players_character ON match_players (character_id, queue_id);
+        CREATE INDEX IF NOT EXISTS ix_match_players_queue_time ON match_players (queue_id, match_time);
+    """
+
+    def __init__(self, path = ":memory:", api = None):
+        self.api = api
+        self.__lock__ = RLock()
+        self.__connection__ = sqlite3.connect(path, check_same_thread=False)
+        with self.__lock__:
+            if path != ":memory:":
+                self.__connection__.execute("PRAGMA journal_mode=WAL")
+            self.__connection__.executescript(self.SCHEMA)
+            if "complete" not in { column [1] for column in self.__connection__.execute("PRAGMA table_info(matches)") }: # Stores created before the column existed
+                self.__connection__.execute("ALTER TABLE matches ADD COLUMN complete INTEGER NOT NULL DEFAULT 0")
+
+    def __call__(self, playerId, rows):
+        """
+        Sink interface (e.g. for :class:`RealmHistorySync`): stores the rows of a player.
+        """
+        return self.addMatchRows(rows, playerId)
+
+    def close(self):
+        with self.__lock__:
+            self.__connection__.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    @staticmethod
+    def __toIsoDatetime__(value):
+        value = parseDatetime(value)
+        return value.strftime("%Y-%m-%dT%H:%M:%S") if value else None
+
+    @staticmethod
+    def __toInt__(value):
+        try:
+            return int(value)
+        except (TypeError, ValueError):
+            return None
+
+    def __toRow__(self, row, playerId = None):
+        matchId = self.__toInt__(row.get("Match") or row.get("match_id") or row.get("match"))
+        playerId = self.__toInt__(playerId or row.get("playerId") or row.get("player_id") or row.get("ActivePlayerId"))
+        characterId = self.__toInt__(row.get("ChampionId") or row.get("GodId") or row.get("champion_id") or row.get("god_id"))
+        queueId = self.__toInt__(row.get("Match_Queue_Id") or row.get("match_queue_id") or row.get("Queue_Id"))
+        matchTime = self.__toIsoDatetime__(row.get("Match_Time") or row.get("Entry_Datetime") or row.get("match_datetime"))
+        return matchId, playerId, characterId, queueId, matchTime
+
+    def addMatchRows(self, rows, playerId = None, complete = False):
+        """
+        Stores per-player match rows (getMatchDetails, getMatchDetailsBatch or getMatchHistory) in a single transaction.
+        Rows already stored are replaced, so adding the same rows twice is harmless.
+
+        Parameters
+        ----------
+        rows : list of dict
+        playerId : [optional] : int
+            Owner of the rows, for getMatchHistory rows (which don't carry the playerId).
+        complete : [optional] : bool
+            True when the rows are every row of their matches (a getMatchDetails or getMatchDetailsBatch response),
+            so :meth:`hasMatch` and :meth:`getMissingMatchIds` consider those matches stored. It defaults to False.
+
+        Returns
+        -------
+        int
+            Number of rows stored.
+        """
+        matches, players = {}, []
+        for row in rows or []:
+            if not isinstance(row, dict):
+                continue
+            matchId, rowPlayerId, characterId, queueId, matchTime = self.__toRow__(row, playerId)
+            if not matchId or rowPlayerId is None:
+                continue
+            matches [matchId] = (matchId, queueId, matchTime, row.get("Map_Game") or row.get("mapGame"), self.__toInt__(row.get("Minutes")), int(bool(complete)))
+            players.append((matchId, rowPlayerId, characterId, queueId, matchTime, json.dumps(row)))
+        with self.__lock__, self.__connection__:
+            # A match stays complete once it is: later partial rows (e.g. match history) only refresh its columns
+            self.__connection__.executemany("INSERT INTO matches VALUES (?, ?, ?, ?, ?, ?) ON CONFLICT (match_id) DO UPDATE SET queue_id = excluded.queue_id, match_time = excluded.match_time, map = excluded.map, minutes = excluded.minutes, complete = MAX(complete, excluded.complete)", matches.values())
+            self.__connection__.executemany("INSERT OR REPLACE INTO match_players VALUES (?, ?, ?, ?, ?, ?)", players)
+        return len(players)
+
+    def hasMatch(self, matchId):
+        """
+        Returns True when every row of the match is stored (see :meth:`addMatchRows`).
+        """
+        with self.__lock__:
+            return self.__connection__.execute("SELECT 1 FROM matches WHERE match_id = ? AND complete = 1", (int(matchId),)).fetchone() is not None
+
+    def getMissingMatchIds(self, matchIds):
+        """
+        Returns the matchIds (in the given order) whose rows are not all stored yet.
+        """
+        matchIds = [ int(matchId) for matchId in matchIds ]
+        stored = set()
+        with self.__lock__:
+            for i in range(0, len(matchIds), 500):
+                chunk = matchIds [i:i + 500]
+                query = "SELECT match_id FROM matches WHERE complete = 1 AND match_id IN ({0})".format(','.join('?' * len(chunk)))
+                stored.update(row [0] for row in self.__connection__.execute(query, chunk))
+        return [ matchId for matchId in matchIds if matchId not in stored ]
+
+    def __query__(self, where, params, limit = None, raw = False):
+        query = "SELECT data FROM match_players WHERE {0} ORDER BY match_time DESC, match_id DESC".format(" AND ".join(where) if where else "1")
+        if limit:
+            query += " LIMIT {0}".format(int(limit))
+        with self.__lock__:
+            rows = [ json.loads(row [0]) for row in self.__connection__.execute(query, params) ]
+        return rows if raw else parseModels(MatchHistory, rows)
+
+    def getMatch(self, matchId, raw = False):
+        """
+        Returns the stored rows of a match, as :class:`MatchHistory` objects (or the raw dicts).
+        """
+        return self.__query__(["match_id = ?"], [int(matchId)], raw=raw)
+
+    def getPlayerMatches(self, playerId, characterId = None, queueId = None, since = None, until = None, limit = None, raw = False):
+        """
+        Returns the stored rows of a player, newest first, as :class:`MatchHistory` objects (or the raw dicts).
+
+        Parameters
+        ----------
+        playerId : int
+        characterId : [optional] : int
+            Champion or god id.
+        queueId : [optional] : int
+        since : [optional] : datetime
+        until : [optional] : datetime
+        limit : [optional] : int
+        """
+        where, params = ["player_id = ?"], [int(playerId)]
+        return self.__query__(*self.__filters__(where, params, characterId, queueId, since, until), limit=limit, raw=raw)
+
+    def getCharacterMatches(self, characterId, queueId = None, since = None, until = None, limit = None, raw = False):
+        """
+        Returns the stored rows played with a champion/god, newest first. See :meth:`getPlayerMatches`.
+        """
+        where, params = ["character_id = ?"], [int(characterId)]
+        return self.__query__(*self.__filters__(where, params, None, queueId, since, until), limit=limit, raw=raw)
+
+    def getQueueMatchIds(self, queueId, since = None, until = None):
+        """
+        Returns the stored matchIds of a queue, newest first.
+        """
+        where, params = self.__filters__(["queue_id = ?"], [int(queueId)], None, None, since, until)
+        with self.__lock__:
+            return [ row [0] for row in self.__connection__.execute("SELECT match_id FROM matches WHERE {0} ORDER BY match_time DESC".format(" AND ".join(where)), params) ]
+
+    @staticmethod
+    def __filters__(where, params, characterId, queueId, since, until):
+        if characterId is not None:
+            where.append("character_id = ?")
+            params.append(int(characterId))
+        if queueId is not None:
+            where.append("queue_id = ?")
+            params.append(int(queueId))
+        if since is not None:
+            where.append("match_time >= ?")
+            params.append(since.strftime("%Y-%m-%dT%H:%M:%S"))
+        if until is not None:
+            where.append("match_time < ?")
+            params.append(until.strftime("%Y-%m-%dT%H:%M:%S"))
+        return where, params
+
+    def getMatchDetailsBatch(self, matchIds, raw = False):
+        """
+        Read-through getMatchDetailsBatch: only the matches that are not stored are requested (in batches of :attr:`BATCH_SIZE`).
+
+        Returns
+        -------
+        dict
+            matchId → list of rows (:class:`MatchHistory` objects or raw dicts); matches the API didn't return are left out.
+        """
+        missing = self.getMissingMatchIds(matchIds)
+        if missing and self.api is None:
+            raise ValueError("MatchStore needs an api to fetch missing matches!")
+        for i in range(0, len(missing), self.BATCH_SIZE):
+            self.addMatchRows(self.api.getMatchDetailsBatch(','.join(str(matchId) for matchId in missing [i:i + self.BATCH_SIZE])), complete=True)
+        result = {}
+        for matchId in matchIds:
+            rows = self.getMatch(matchId, raw=raw)
+            if rows:
+                result [int(matchId)] = rows
+        return result
+
+    def getMatchDetails(self, matchId, raw = False):
+        """
+        Read-through getMatchDetails. See :meth:`getMatchDetailsBatch`.
+        """
+        if not self.hasMatch(matchId):
+            if self.api is None:
+                raise ValueError("MatchStore needs an api to fetch missing matches!")
+            self.addMatchRows(self.api.getMatchDetails(matchId), complete=True)
+        return self.getMatch(matchId, raw=raw)
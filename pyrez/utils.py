@@ -0,0 +1,48 @@
+from datetime import datetime, timedelta
+from functools import lru_cache
+
+DATETIME_CACHE_SIZE = 8192
+
+@lru_cache(maxsize=DATETIME_CACHE_SIZE)
+def __parseDatetime__(value):
+    value = value.strip()
+    try:
+        if '/' in value: # Hi-Rez format: "10/12/2018 5:33:11 PM"
+            parts = value.split(' ')
+            month, day, year = parts [0].split('/')
+            hour, minute, second = parts [1].split(':')
+            hour = int(hour)
+            if len(parts) > 2:
+                meridiem = parts [2].upper()
+                if meridiem == "PM" and hour < 12:
+                    hour += 12
+                elif meridiem == "AM" and hour == 12:
+                    hour = 0
+            return datetime(int(year), int(month), int(day), hour, int(minute), int(second.split('.') [0]))
+        # ISO format: "2018-10-12T17:33:11", "2018-10-12 17:33:11.123" or "2018-10-12T17:33:11-04:00" (converted to UTC)
+        date, _, time = value.replace('T', ' ').partition(' ')
+        year, month, day = date.split('-')
+        offset = timedelta()
+        if time.endswith('Z'):
+            time = time [:-1]
+        elif len(time) > 6 and time [-6] in "+-" and time [-3] == ':':
+            offset = timedelta(hours=int(time [-5:-3]), minutes=int(time [-2:])) * (1 if time [-6] == '+' else -1)
+            time = time [:-6]
+        hour, minute, second = (time.split('.') [0].split(':') + ["0", "0", "0"]) [:3] if time else ("0", "0", "0")
+        return datetime(int(year), int(month), int(day), int(hour), int(minute), int(second)) - offset
+    except (IndexError, ValueError):
+        return None
+
+def parseDatetime(value):
+    """
+    Parses the datetimes returned by Hi-Rez ("10/12/2018 5:33:11 PM" or ISO) into :class:`datetime`.
+    Timestamps repeat a lot inside a match, so results are memoized in a bounded cache.
+
+    Returns
+    -------
+    datetime or None
+        None when value is empty or can't be parsed.
+    """
+    if value is None or isinstance(value, datetime):
+        return value
+    return __parseDatetime__(str(value)) if value else None
@@ -55,6 +55,12 @@ setup(
     ],
     description="An open-source wrapper for Hi-Rez API (Paladins, Realm Royale, and Smite), written in Python",
     download_url="https://pypi.org/project/pyrez/#files",
+    entry_points={
+        "console_scripts": [ "pyrez=pyrez.cli:main" ],
+    },
+    extras_require={
+        "export": [ "pyarrow>=0.11.0" ],
+    },
     include_package_data=True,
     install_requires=requeriments(),
     keywords=["hirez hi-rez smite paladins realmapi open-source api wrapper library python api-wrapper paladins-api smitegame smiteapi realm-api python3 python-3 python-3-6"],